@@ -34,6 +34,7 @@ import time
 import warnings
 from collections import defaultdict
 from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
 from configparser import ConfigParser
 from contextlib import suppress
 from importlib.resources import files as read_files
@@ -81,6 +82,7 @@ from autosubmit.git.autosubmit_git import (
 from autosubmit.helpers.enums import ChunkUnit
 from autosubmit.helpers.utils import check_jobs_file_exists, get_rc_path
 from autosubmit.helpers.version import get_version
+from autosubmit.history.database_backup import HistoricalDatabaseBackup
 from autosubmit.history.database_managers.experiment_history_db_manager import (
     get_last_run_id,
 )
@@ -1540,6 +1542,7 @@ class Autosubmit:
         as_conf.experiment_data['STARTDATES'] = []
         for date in job_list._date_list:
             as_conf.experiment_data['STARTDATES'].append(date2str(date, job_list.get_date_format()))
+        as_conf.invalidate_parameters()
 
     @staticmethod
     def inspect(expid: str, lst: str, filter_chunks: str, filter_status: str, filter_section: str, force=False,
@@ -1846,6 +1849,9 @@ class Autosubmit:
                                                         as_conf.get_chunk_size(),
                                                         current_config=as_conf.get_full_config_as_json())
             job_list.run_id = run_dc.run_id if run_dc else None
+            if run_dc:
+                # The run counters were just counted from these statuses, later changes are applied to them.
+                job_list.history_statuses = {job.name: job.status_str for job in job_list.get_job_list()}
             Autosubmit.database_backup(expid)
         except Exception:
             Log.warning(f"Couldn't access the historical database for experiment {expid}")
@@ -1859,6 +1865,23 @@ class Autosubmit:
                       f"{os.path.join(BasicConfig.DB_DIR, BasicConfig.AS_TIMES_DB)}. Exception: {str(e)}", 7003)
         return exp_history
 
+    @staticmethod
+    def get_job_changes_tracker(job_list: JobList) -> dict[str, tuple[str, str]]:
+        """Get the status changes of the jobs since they were last applied to the historical database.
+
+        :param job_list: a JobList object.
+        :return: job name to ``(previous status, new status)`` for the jobs that changed.
+        """
+        job_changes_tracker = {}
+        for job in job_list.get_job_list():
+            status = Status.VALUE_TO_KEY[job.status]
+            previous_status = job_list.history_statuses.get(job.name)
+            if previous_status is None and job.prev_status is not None:
+                previous_status = Status.VALUE_TO_KEY[job.prev_status]
+            if previous_status is not None and previous_status != status:
+                job_changes_tracker[job.name] = (previous_status, status)
+        return job_changes_tracker
+
     @staticmethod
     def process_historical_data_iteration(job_list, job_changes_tracker, expid):
         """Process the historical data for the current iteration.
@@ -1868,9 +1891,20 @@ class Autosubmit:
         :param expid: a string with the experiment id.
         :return: an ExperimentHistory object.
         """
-        exp_history = ExperimentHistory(expid)
+        # A job keeps its previous status until its status changes again, so the same change
+        # is tracked in every iteration. It is only applied to the history counters once, and
+        # the counters are moved from the last status applied to the history, as ``prev_status``
+        # is not updated when the status is changed by ``update_list`` or by the submission.
+        job_changes_tracker = {
+            job_name: (job_list.history_statuses.get(job_name, previous_status), new_status)
+            for job_name, (previous_status, new_status) in job_changes_tracker.items()
+            if job_list.history_statuses.get(job_name, previous_status) != new_status
+        }
         if len(job_changes_tracker) > 0:
-            exp_history.process_job_list_changes_to_experiment_totals(job_list.get_job_list())
+            exp_history = ExperimentHistory(expid)
+            exp_history.process_job_changes(job_changes_tracker)
+            job_list.history_statuses.update(
+                (job_name, new_status) for job_name, (_, new_status) in job_changes_tracker.items())
             Autosubmit.database_backup(expid)
 
     @staticmethod
@@ -2063,26 +2097,53 @@ class Autosubmit:
         :param expid: experiment id
         return: None, but updates the status of the jobs in the job_list and notifies if there are changes
         """
+        wrapper_ids = job_list.wrapper_ids
+        jobs_by_platform: dict[Platform, list[Job]] = {}
         for p in platforms_to_test:
-            platform_jobs = [job for job in job_list.get_in_queue(p) if
-                             job.id not in job_list.get_wrappers_id_from_db()]
+            platform_jobs = [job for job in job_list.get_in_queue(p) if job.id not in wrapper_ids]
             if len(platform_jobs) == 0:
                 continue
             Log.info(f"Checking {len(platform_jobs)} jobs for platform {p.name}")
+            jobs_by_platform[p] = platform_jobs
+
+        # Each platform is polled over its own connection, so a slow platform does not delay the others.
+        errors: dict[Platform, Exception] = {}
+        if len(jobs_by_platform) > 1:
+            with ThreadPoolExecutor(max_workers=len(jobs_by_platform),
+                                    thread_name_prefix="check_all_jobs") as executor:
+                checks = {p: executor.submit(p.check_all_jobs, platform_jobs, as_conf)
+                          for p, platform_jobs in jobs_by_platform.items()}
+            for p, check in checks.items():
+                try:
+                    check.result()
+                except Exception as e:
+                    errors[p] = e
+        else:
+            for p, platform_jobs in jobs_by_platform.items():
+                p.check_all_jobs(platform_jobs, as_conf)
+        # The platforms that were checked fine still get their updates applied and saved.
+        for p in errors:
+            del jobs_by_platform[p]
 
-            p.check_all_jobs(platform_jobs, as_conf)
-            save = False
+        save = False
+        for platform_jobs in jobs_by_platform.values():
             for job in platform_jobs:
                 if job.new_status != job.status:
                     job.update_status(as_conf)
                     save = True
-            if save:
-                job_list.save_jobs()
+        if save:
+            job_list.save_jobs()
 
+        for platform_jobs in jobs_by_platform.values():
             for job in platform_jobs:
                 if job.prev_status != job.status:
                     Autosubmit.job_notify(as_conf, expid, job)
 
+        if errors:
+            Log.warning(f"Failed to check the jobs of {len(errors)} platform(s): "
+                        f"{', '.join(p.name for p in errors)}")
+            raise next(iter(errors.values()))
+
     @staticmethod
     def run_experiment(expid: str, start_time: str | None = None, start_after: str | None = None,
                        run_only_members: str | None = None, profile: bool = False,
@@ -2184,6 +2245,8 @@ class Autosubmit:
                             Autosubmit.exit = True
 
 
+                        # The parameters shared by all the jobs are computed once per iteration
+                        as_conf.invalidate_parameters()
                         # TODO fix in another PR, this is a workaround to avoid having missmatching job_list and platform experiment_data
                         if as_conf.needs_reload():
                             as_conf.reload()
@@ -2206,11 +2269,7 @@ class Autosubmit:
                         # Safe spot to store changes
                         try:
                             # Track all jobs change for GUI
-                            job_changes_tracker = {}
-                            for job in [job for job in job_list.get_job_list() if
-                                        job.prev_status is not None and job.prev_status != job.status]:
-                                job_changes_tracker[job.name] = (Status.VALUE_TO_KEY[job.prev_status],
-                                                                 Status.VALUE_TO_KEY[job.status])
+                            job_changes_tracker = Autosubmit.get_job_changes_tracker(job_list)
                             Autosubmit.process_historical_data_iteration(job_list, job_changes_tracker, expid)
                         except BaseException:
                             Log.printlog("Historic database seems corrupted, AS will repair it and resume the run",
@@ -2313,7 +2372,9 @@ class Autosubmit:
                 Log.info("Waiting for all logs to be updated")
                 for p in platforms_to_test:
                     p.clean_log_recovery_process()
-                Autosubmit.process_historical_data_iteration(job_list, job_changes_tracker, expid)
+                # The iterations only applied their changes to the totals, recount them once from the job list
+                ExperimentHistory(expid).process_job_list_changes_to_experiment_totals(job_list.get_job_list())
+                Autosubmit.database_backup(expid, force=True, wait=True)
 
                 for p in platforms_to_test:
                     p.close_connection()
@@ -2724,6 +2785,7 @@ class Autosubmit:
                 job.update_parameters(as_conf, set_attributes=True)
             Log.debug("Job list restored from db")
             jobs = StatisticsUtils.filter_by_section(job_list.get_job_list(), filter_type)
+            job_list.load_retrials(jobs)
             jobs, period_ini, period_fi = StatisticsUtils.filter_by_time_period(jobs, filter_period)
             # Package information
             queue_time_fixes = {}
@@ -3575,15 +3637,22 @@ class Autosubmit:
         return update_experiment_description_version(expid, description=new_description)
 
     @staticmethod
-    def database_backup(expid):
+    def database_backup(expid: str, force: bool = False, wait: bool = False) -> None:
+        """Back up the historical database of the experiment.
+
+        The backup runs in a background thread, and at most once every
+        ``JOBDATA_BACKUP_INTERVAL`` seconds unless ``force`` is given.
+
+        :param expid: a string with the experiment id
+        :param force: start a backup even if the last one is more recent than the interval
+        :param wait: block until the backup is written
+        """
         if BasicConfig.DATABASE_BACKEND == 'sqlite':
             try:
-                database_path = os.path.join(BasicConfig.JOBDATA_DIR, f"job_data_{expid}.db")
-                backup_path = os.path.join(BasicConfig.JOBDATA_DIR, f"job_data_{expid}.sql")
-                command = f"sqlite3 {database_path} .dump > {backup_path} "
-                Log.debug("Backing up jobs_data...")
-                subprocess.call(command, shell=True)
-                Log.debug("Jobs_data database backup completed.")
+                backup = HistoricalDatabaseBackup.for_experiment(expid)
+                backup.request(force=force)
+                if wait:
+                    backup.wait()
             except BaseException:
                 Log.debug("Jobs_data database backup failed.")
         elif BasicConfig.DATABASE_BACKEND == 'postgres':
@@ -3661,6 +3730,7 @@ class Autosubmit:
         # Code adapted from ``autosubmit stats``.
         job_list = Autosubmit.load_job_list(expid, as_conf)
         jobs = job_list.get_job_list()
+        job_list.load_retrials(jobs)
         exp_stats = Statistics(jobs=jobs, start=None, end=None, queue_time_fix={})
         exp_stats.calculate_statistics()
         start_time = None
@@ -4009,7 +4079,7 @@ class Autosubmit:
                                                                     current_config=as_conf.get_full_config_as_json(),
                                                                     create=True)
                         job_list.run_id = run_dc.run_id if run_dc else None
-                        Autosubmit.database_backup(expid)
+                        Autosubmit.database_backup(expid, force=True, wait=True)
                     except Exception:
                         Log.printlog("Historic database seems corrupted, AS will repair it and resume the run",
                                      Log.INFO)
@@ -4995,7 +5065,7 @@ class Autosubmit:
                                                        chunk_unit=as_conf.get_chunk_size_unit(),
                                                        chunk_size=as_conf.get_chunk_size(),
                                                        current_config=as_conf.get_full_config_as_json())
-                    Autosubmit.database_backup(expid)
+                    Autosubmit.database_backup(expid, force=True, wait=True)
                 else:
                     Log.printlog(
                         "Changes NOT saved to the JobList!!!!:  use -s option to save", 3000)
@@ -45,6 +45,7 @@ class BasicConfig:
     DEFAULT_OUTPUT_DIR = os.path.join('/esarchive', 'autosubmit', 'as_output', 'stats')
     JOBDATA_DIR = os.path.join(
         '/esarchive', 'autosubmit', 'as_metadata', 'data')
+    JOBDATA_BACKUP_INTERVAL = 600
     HISTORICAL_LOG_DIR = os.path.join('/esarchive', 'autosubmit', 'as_metadata', 'logs')
     AUTOSUBMIT_API_URL = "http://192.168.11.91:8081"
     DB_FILE = 'autosubmit.db'
@@ -64,6 +65,10 @@ class BasicConfig:
     CONFIG_FILE_FOUND = False
     DATABASE_BACKEND = "sqlite"
     DATABASE_CONN_URL = ""
+    DATABASE_JOURNAL_MODE = ""
+    """Journal mode of the SQLite databases, e.g. ``WAL``. Empty keeps the mode of each database file."""
+    _READ_SIGNATURE: tuple | None = None
+    """Path, modification time and size of the configuration files of the last ``read``."""
 
     @staticmethod
     def expid_dir(exp_id):
@@ -117,6 +122,8 @@ class BasicConfig:
             BasicConfig.DATABASE_BACKEND = parser.get('database', 'backend')
         if parser.has_option('database', 'connection_url'):
             BasicConfig.DATABASE_CONN_URL = parser.get('database', 'connection_url')
+        if parser.has_option('database', 'journal_mode'):
+            BasicConfig.DATABASE_JOURNAL_MODE = parser.get('database', 'journal_mode')
         if parser.has_option('local', 'path'):
             BasicConfig.LOCAL_ROOT_DIR = parser.get('local', 'path')
         if parser.has_option('conf', 'platforms'):
@@ -181,6 +188,8 @@ class BasicConfig:
             BasicConfig.DEFAULT_OUTPUT_DIR = parser.get('defaultstats', 'path')
         if parser.has_option('historicdb', 'path'):
             BasicConfig.JOBDATA_DIR = parser.get('historicdb', 'path')
+        if parser.has_option('historicdb', 'backup_interval'):
+            BasicConfig.JOBDATA_BACKUP_INTERVAL = int(parser.get('historicdb', 'backup_interval'))
         if parser.has_option('historiclog', 'path'):
             BasicConfig.HISTORICAL_LOG_DIR = parser.get('historiclog', 'path')
         if parser.has_option('autosubmitapi', 'url'):
@@ -190,10 +199,9 @@ class BasicConfig:
             BasicConfig.LOG_RECOVERY_TIMEOUT = int(parser.get('config', 'log_recovery_timeout'))
 
     @staticmethod
-    def read():
+    def _config_file_paths() -> list[Path]:
         """
-        Reads configuration from .autosubmitrc files, first from /etc., then for user
-        directory and last for current path.
+        Returns the configuration files to read, in the order they must be read.
         """
         filename = "autosubmitrc"
         dot_filename = f".{filename}"
@@ -202,27 +210,65 @@ class BasicConfig:
             "AUTOSUBMIT_CONFIGURATION" in os.environ
             and Path(os.environ["AUTOSUBMIT_CONFIGURATION"]).exists()
         ):
-            config_file_path = os.environ["AUTOSUBMIT_CONFIGURATION"]
-            # Call read_file_config with the value of the environment variable
+            return [os.environ["AUTOSUBMIT_CONFIGURATION"]]
+
+        user_config_path = Path(Path.cwd(), dot_filename)
+        home_user_config_path = Path(Path.home(), dot_filename)
+        etc_rc_path = Path("/etc", filename)
+        legacy_etc_rc_path = Path("/etc", dot_filename)
+
+        if user_config_path.exists():
+            return [user_config_path]
+        if home_user_config_path.exists():
+            return [home_user_config_path]
+        config_file_paths = []
+        if legacy_etc_rc_path.exists():
+            config_file_paths.append(legacy_etc_rc_path)
+        # Overwrite legacy config
+        if etc_rc_path.exists():
+            config_file_paths.append(etc_rc_path)
+        return config_file_paths
+
+    @staticmethod
+    def _read_signature(config_file_paths: list[Path]) -> tuple:
+        """
+        Returns the path, modification time and size of each configuration file.
+        """
+        signature = []
+        for config_file_path in config_file_paths:
+            try:
+                stat = os.stat(config_file_path)
+                signature.append((str(config_file_path), stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                signature.append((str(config_file_path), None, None))
+        return tuple(signature)
+
+    @staticmethod
+    def read():
+        """
+        Reads configuration from .autosubmitrc files, first from /etc., then for user
+        directory and last for current path.
+        """
+        config_file_paths = BasicConfig._config_file_paths()
+        for config_file_path in config_file_paths:
             BasicConfig.__read_file_config(config_file_path)
-        else:
-            user_config_path = Path(Path.cwd(), dot_filename)
-            home_user_config_path = Path(Path.home(), dot_filename)
-            etc_rc_path = Path("/etc", filename)
-            legacy_etc_rc_path = Path("/etc", dot_filename)
-
-            if user_config_path.exists():
-                BasicConfig.__read_file_config(user_config_path)
-            elif home_user_config_path.exists():
-                BasicConfig.__read_file_config(home_user_config_path)
-            else:
-                if legacy_etc_rc_path.exists():
-                    BasicConfig.__read_file_config(legacy_etc_rc_path)
-                # Overwrite legacy config
-                if etc_rc_path.exists():
-                    BasicConfig.__read_file_config(etc_rc_path)
 
         BasicConfig._update_config()
+        BasicConfig._READ_SIGNATURE = BasicConfig._read_signature(config_file_paths)
+
+    @staticmethod
+    def read_cached():
+        """
+        Reads the configuration only if the configuration files changed since the last ``read``.
+
+        Used where the configuration is needed many times per process, e.g. when building
+        every ``Job``. The files are compared by path, modification time and size. Call
+        ``read`` to force a reload.
+        """
+        if BasicConfig._READ_SIGNATURE is not None and BasicConfig._READ_SIGNATURE == BasicConfig._read_signature(
+                BasicConfig._config_file_paths()):
+            return
+        BasicConfig.read()
 
 
 def generate_dirs() -> None:
@@ -29,6 +29,8 @@ from collections.abc import Iterable
 from contextlib import suppress
 from datetime import datetime, timedelta
 from pathlib import Path
+from time import monotonic
+from types import MappingProxyType
 from typing import Any, Union
 
 from bscearth.utils.date import parse_date
@@ -51,7 +53,13 @@ class AutosubmitConfig:
     :type expid: str
     """
 
+    RELOAD_CHECK_INTERVAL = 1.0
+    """Seconds during which ``needs_reload`` trusts its last check that found no modified files."""
+
     def __init__(self, expid, basic_config=BasicConfig, parser_factory=YAMLParserFactory()):
+        self._parameters_snapshot: dict | None = None
+        self._parameters_generation = 0
+        self._reload_checked_at: float | None = None
         self.data_changed = False
         self.ignore_undefined_platforms = False
         self.ignore_file_path = False
@@ -1321,6 +1329,7 @@ class AutosubmitConfig:
                 else:
                     mails = mails.split(' ')
                 self.experiment_data["MAIL"]["TO"] = mails
+                self.invalidate_parameters()
 
                 for mail in self.experiment_data["MAIL"]["TO"]:
                     if not self.is_valid_mail_address(mail):
@@ -1742,21 +1751,63 @@ class AutosubmitConfig:
         parameters["AS_ENV_CURRENT_USER"] = os.environ.get("SUDO_USER", os.environ.get("USER", None))
         return parameters
 
+    @property
+    def experiment_data(self) -> dict:
+        return self._experiment_data
+
+    @experiment_data.setter
+    def experiment_data(self, experiment_data: dict) -> None:
+        self._experiment_data = experiment_data
+        self.invalidate_parameters()
+
+    @property
+    def parameters_generation(self) -> int:
+        """Number of times that the parameters snapshot has been invalidated."""
+        return self._parameters_generation
+
+    def invalidate_parameters(self) -> None:
+        """Discard the parameters snapshot, so the next ``load_parameters`` computes it again.
+
+        Must be called after modifying ``experiment_data`` in place.
+        """
+        self._parameters_snapshot = None
+        self._parameters_generation += 1
+        self._reload_checked_at = None
+
+    @property
+    def parameters_snapshot(self) -> MappingProxyType:
+        """Read-only view of the experiment parameters, computed once per generation.
+
+        It contains the flattened ``experiment_data``, updated with the parameters
+        loaded from the database.
+        """
+        if self._parameters_snapshot is None:
+            db_parameters = self._load_database_parameters()
+            self.deep_update(self.experiment_data, db_parameters)
+            self._parameters_snapshot = self.deep_parameters_export(self.experiment_data)
+        return MappingProxyType(self._parameters_snapshot)
+
     def needs_reload(self) -> bool:
         """
         Check if any configuration file has been modified and needs to be reloaded.
 
+        The files are not checked again until ``RELOAD_CHECK_INTERVAL`` seconds after
+        a check that did not find any modified file.
+
         Returns:
             bool: True if a reload is needed, False otherwise.
         """
         if len(self.current_loaded_files) == 0:
             return True
+        if self._reload_checked_at is not None and monotonic() - self._reload_checked_at < self.RELOAD_CHECK_INTERVAL:
+            return False
         if self.experiment_data.get("CONFIG", {}).get("RELOAD_WHILE_RUNNING", True):
             for file in self.current_loaded_files.keys():
                 if os.path.exists(file):
                     mod_time = os.path.getmtime(file)
                     if mod_time > self.current_loaded_files[file]:
                         return True
+        self._reload_checked_at = monotonic()
         return False
 
     def load_starter_conf(self):
@@ -2062,12 +2113,14 @@ class AutosubmitConfig:
 
     def load_parameters(self):
         """Load all experiment data
+
+        The parameters are a copy of ``parameters_snapshot``, so the jobs can add their
+        own parameters without recomputing the ones of the experiment.
+
         :return: a dictionary containing tuples [parameter_name, parameter_value]
         :rtype: dict
         """
-        db_parameters = self._load_database_parameters()
-        self.deep_update(self.experiment_data, db_parameters)
-        return self.deep_parameters_export(self.experiment_data)
+        return dict(self.parameters_snapshot)
 
     def get_project_type(self) -> str:
         """Returns project type from experiment config file.
@@ -22,6 +22,8 @@ from typing import Any, cast
 from sqlalchemy import (
     ClauseElement,
     Engine,
+    and_,
+    bindparam,
     delete,
     desc,
     func,
@@ -62,6 +64,8 @@ class DbManager:
         self.schema = schema if BasicConfig.DATABASE_BACKEND != "sqlite" else None
         self.restore_path = Path(BasicConfig.DB_PATH) / "autosubmit_db.sql"
         self.table_registry = TableRegistry(self.schema)
+        # Tables already created, and completed with their missing columns, by this manager.
+        self._created_tables: set[str] = set()
 
     def _get_engine(self, table_name: str | None = None) -> Engine:
         """Return the appropriate engine based on context.
@@ -74,6 +78,16 @@ class DbManager:
         return self.engine
 
     def create_table(self, table_name: str) -> None:
+        """Create the table if it does not exist, and add the columns it is missing.
+
+        This is done once per table for the lifetime of the manager, the following calls
+        do nothing. Call :meth:`reset_created_tables` if the tables may have been dropped
+        by something else than this manager.
+
+        :param table_name: The name of the table.
+        """
+        if table_name in self._created_tables:
+            return
         table = self.table_registry.get(table_name)
         with self._get_engine(table_name).begin() as conn:
             if self.schema:
@@ -88,8 +102,14 @@ class DbManager:
                     conn.execute(
                         text(f"ALTER TABLE {qualified_name} ADD COLUMN {column.name} {column.type}")
                     )
+        self._created_tables.add(table_name)
+
+    def reset_created_tables(self) -> None:
+        """Forget the tables created so far, so that :meth:`create_table` checks them again."""
+        self._created_tables.clear()
 
     def drop_table(self, table_name: str) -> None:
+        self._created_tables.discard(table_name)
         table = self.table_registry.get(table_name)
         with self._get_engine(table_name).begin() as conn:
             conn.execute(DropTable(table, if_exists=True))
@@ -248,6 +268,43 @@ class DbManager:
 
         return total_rows
 
+    def update_many(self, table_name: str, data: list[dict[str, Any]], key_cols: list[str],
+                    batch_size: int = 1000) -> int:
+        """Update existing rows, writing only the columns present in each dictionary.
+
+        Rows are grouped by their set of columns so every group is sent as a single
+        executemany ``UPDATE``. All the groups are written in the same transaction.
+
+        :param table_name: Name of the table.
+        :param data: List of dictionaries with the key columns and the columns to update.
+        :param key_cols: Columns used to identify the rows to update.
+        :param batch_size: Maximum number of rows sent per statement.
+        :return: Number of rows updated.
+        """
+        if not data:
+            return 0
+
+        table: Table = self.table_registry.get(table_name)
+        groups: dict[tuple[str, ...], list[dict[str, Any]]] = {}
+        for row in data:
+            update_cols = tuple(sorted(col for col in row if col not in key_cols))
+            if update_cols:
+                groups.setdefault(update_cols, []).append({f"b_{col}": value for col, value in row.items()})
+
+        total_rows = 0
+        with self._get_engine(table_name).begin() as conn:
+            for update_cols, rows in groups.items():
+                update_stmt = (
+                    table.update()
+                    .where(and_(*(table.c[col] == bindparam(f"b_{col}") for col in key_cols)))
+                    .values({col: bindparam(f"b_{col}") for col in update_cols})
+                )
+                for i in range(0, len(rows), batch_size):
+                    result = conn.execute(update_stmt, rows[i:i + batch_size])
+                    total_rows += result.rowcount
+
+        return total_rows
+
     def count_where(self, table_name: str, where: dict[str, Any]) -> int:
         """Count the number of rows in a table that match a given condition."""
         table = self.table_registry.get(table_name)
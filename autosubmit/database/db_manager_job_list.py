@@ -17,16 +17,32 @@
 
 """Contains code to manage a database via SQLAlchemy."""
 import datetime
+from collections.abc import Generator, Iterable
+from contextlib import contextmanager
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import and_, exists, func, not_, or_, select, update
+from sqlalchemy import (
+    and_,
+    bindparam,
+    column,
+    delete,
+    exists,
+    func,
+    not_,
+    or_,
+    select,
+    text,
+    update,
+)
+from sqlalchemy import table as sql_table
 from sqlalchemy.exc import IntegrityError
 
 from autosubmit.config.basicconfig import BasicConfig
 from autosubmit.database.db_manager import DbManager
 from autosubmit.database.tables import (
     ExperimentStructureTable,
+    JobRetrialsTable,
     JobsTable,
     PreviewWrapperInfoTable,
     PreviewWrapperJobsTable,
@@ -104,6 +120,8 @@ class JobsDbManager(DbManager):
         self._ACTIVE_STATUSES = ['READY', 'SUBMITTED', 'QUEUING', 'HELD', 'RUNNING']
         self._FINAL_STATUSES = ['COMPLETED', 'FAILED']
         self.restore_path = Path(BasicConfig.LOCAL_ROOT_DIR) / 'db' / 'job_list.sql'
+        # Jobs whose stored retrials match their ``TOTAL_STATS`` file, see ``save_jobs_retrials``.
+        self._synced_retrials: set[str] = set()
 
     def save_jobs(self, job_list: list["Job"], reset_log_counters: bool = False) -> None:
         """Save the job list to the database.
@@ -111,6 +129,10 @@ class JobsDbManager(DbManager):
         Log columns are excluded from the upsert to preserve data written by
         :meth:`save_job_log`.
 
+        Jobs keep track of the state last flushed to the database, so only jobs
+        with changes are written. Jobs never flushed before are upserted whole,
+        the rest only get their changed columns updated.
+
         :param job_list: List of Job objects to save to the database.
         :type job_list: List[Job]
         :param reset_log_counters: Whether to reset log counters.
@@ -121,17 +143,60 @@ class JobsDbManager(DbManager):
         """
         table: Table = self.table_registry.get(JobsTable.name)
         self.create_table(table.name)
-        persistent_data = [job.__getstate__() for job in job_list]
 
-        preserve_data: list = []
-        for d in persistent_data:
+        new_jobs: list[tuple[Job, dict[str, Any]]] = []
+        dirty_jobs: list[tuple[Job, dict[str, Any], dict[str, Any]]] = []
+        for job in job_list:
+            job_data = job.__getstate__()
             if reset_log_counters:
                 for k in _LOG_EXCLUDE_KEYS:
-                    d[k] = 0
-                d['log_recovery_call_count'] = 0
-            preserve_data.append(d)
-        if preserve_data:
-            self.upsert_many(table.name, preserve_data, ['name'], exclude_cols=list(_LOG_EXCLUDE_KEYS) if not reset_log_counters else None)
+                    job_data[k] = 0
+                job_data['log_recovery_call_count'] = 0
+                new_jobs.append((job, job_data))
+                continue
+            dirty_columns = job.get_dirty_columns(job_data)
+            if dirty_columns is None:
+                new_jobs.append((job, job_data))
+            else:
+                dirty_columns -= _LOG_EXCLUDE_KEYS
+                if dirty_columns:
+                    changes = {k: job_data[k] for k in dirty_columns}
+                    changes['name'] = job_data['name']
+                    changes['modified'] = job_data['modified']
+                    dirty_jobs.append((job, job_data, changes))
+
+        if dirty_jobs:
+            self.update_many(table.name, [changes for _, _, changes in dirty_jobs], ['name'])
+            # Some rows may be gone from the database (e.g. a cleared workflow), write them whole.
+            # The drivers do not all report the rowcount of an executemany, so look the names up.
+            stored = self._select_stored_job_names([job_data['name'] for _, job_data, _ in dirty_jobs])
+            missing = [(job, job_data) for job, job_data, _ in dirty_jobs if job_data['name'] not in stored]
+            if missing:
+                dirty_jobs = [dirty for dirty in dirty_jobs if dirty[1]['name'] in stored]
+                new_jobs.extend(missing)
+        if new_jobs:
+            self.upsert_many(table.name, [job_data for _, job_data in new_jobs], ['name'],
+                             exclude_cols=list(_LOG_EXCLUDE_KEYS) if not reset_log_counters else None)
+
+        for job, job_data, _ in dirty_jobs:
+            job.mark_persisted(job_data)
+        for job, job_data in new_jobs:
+            job.mark_persisted(job_data)
+
+    def _select_stored_job_names(self, job_names: list[str], batch_size: int = 500) -> set[str]:
+        """Return the given job names that have a row in the jobs table.
+
+        :param job_names: Names of the jobs.
+        :param batch_size: Maximum number of job names per ``IN`` query.
+        :return: Names of the jobs stored in the database.
+        """
+        table: Table = self.table_registry.get(JobsTable.name)
+        stored: set[str] = set()
+        with self._get_engine(table.name).connect() as conn:
+            for i in range(0, len(job_names), batch_size):
+                rows = conn.execute(select(table.c.name).where(table.c.name.in_(job_names[i:i + batch_size])))
+                stored.update(name for (name,) in rows)
+        return stored
 
     def save_job_log(self, job: "Job") -> None:
         """Save only the log information of a single job to the database.
@@ -151,6 +216,19 @@ class JobsDbManager(DbManager):
 
         self.update_where(table.name, job_data, where)
 
+    def save_jobs_log(self, jobs: list["Job"]) -> None:
+        """Save only the log information of several jobs to the database, in one batched update.
+
+        :param jobs: Job objects whose log information is to be saved.
+        :type jobs: list[Job]
+        :return: None
+        """
+        table: Table = self.table_registry.get(JobsTable.name)
+        self.create_table(table.name)
+        log_keys = {'name', 'log', 'updated_log', 'updated_stats', 'local_logs_out', 'local_logs_err', 'remote_logs_out', 'remote_logs_err'}
+        rows = [{k: v for k, v in job.__getstate__().items() if k in log_keys} for job in jobs]
+        self.update_many(table.name, rows, key_cols=['name'])
+
     def load_jobs(
             self,
             full_load: bool = False,
@@ -189,6 +267,18 @@ class JobsDbManager(DbManager):
         job = self.select_job_by_name(job_name)
         return dict(job) if job else None
 
+    def load_jobs_by_names(self, job_names: list[str]) -> list[dict[str, Any]]:
+        """Load several jobs by their names from the database, with one query.
+
+        :param job_names: Names of the jobs to load.
+        :type job_names: list[str]
+        :return: List of dictionaries containing the job information.
+        """
+        if not job_names:
+            return []
+        table: Table = self.table_registry.get(JobsTable.name)
+        return [dict(job) for job in self.select_where_with_columns(table, {'name': list(job_names)})]
+
     def get_job_list_size(self) -> tuple[int, int, int]:
         """
         Return the number of jobs in the database.
@@ -423,6 +513,41 @@ class JobsDbManager(DbManager):
             table.c.updated_log <= table.c.fail_count
         )
         return [dict(job) for job in self.select_where_with_columns(table, condition)]
+
+    @contextmanager
+    def _job_names_tmp_table(self, job_names: Iterable[str]) -> Generator[tuple[Any, Any], None, None]:
+        """Context manager that populates a temporary table with job names.
+
+        Yields ``(conn, tmp)`` where ``conn`` is the active SQLAlchemy connection
+        and ``tmp`` is a table expression for the temporary table. Joining against
+        it avoids ``IN`` clauses with one bound parameter per job name.
+
+        The temporary table belongs to the connection, which is kept open in the pool.
+        It is created once per connection and only emptied after use, so that the
+        statements that use it are always the same and can be reused.
+
+        :param job_names: Job names to load into the temporary table.
+        :yields: ``(conn, tmp)`` — the connection and the temp table expression.
+        """
+        table_name = "_tmp_job_names"
+        tmp = sql_table(table_name, column("job_name"))
+        with self._get_engine(JobsTable.name).connect() as conn:
+            conn.execute(text(f"CREATE TEMPORARY TABLE IF NOT EXISTS {table_name} (job_name TEXT)"))
+            conn.execute(text(f"DELETE FROM {table_name}"))
+            conn.commit()
+            conn.execute(
+                text(f"INSERT INTO {table_name} (job_name) VALUES (:name)"),
+                [{"name": name} for name in job_names],
+            )
+            try:
+                yield conn, tmp
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                conn.execute(text(f"DELETE FROM {table_name}"))
+                conn.commit()
+
     def select_children_jobs(
             self,
             job_list: list[str | Any],
@@ -431,98 +556,75 @@ class JobsDbManager(DbManager):
         """
         Select child jobs from the database, optionally filtered by members.
 
+        Only children whose incoming edges are all satisfied are selected. The
+        lookup runs a constant number of queries, joining against a temporary
+        table with the names of the given jobs.
+
         :param job_list: List of jobs to find children for.
         :param members: Optional list of member identifiers to filter child jobs.
-        :return: List of child jobs.
+        :return: The given list of jobs, extended with the child jobs.
         """
         jobs_table: Table = self.table_registry.get(JobsTable.name)
         experiment_structure_table: Table = self.table_registry.get(ExperimentStructureTable.name)
-
-
         self.create_table(jobs_table.name)
         self.create_table(experiment_structure_table.name)
-        children_names = set()
-        job_list_tmp = [dict(job) for job in job_list]
-        names_in_memory = {job['name'] for job in job_list_tmp}
-        for job in job_list_tmp:
-            child_rows = [dict(child) for child in
-                          self.select_where_with_columns(experiment_structure_table, {'e_from': job['name']})]
-            for row in child_rows:
-                children_names.add(row['e_to'])
-
-        if children_names:
-            with self._get_engine(experiment_structure_table.name).begin() as conn:
-                rows = conn.execute(
-                    select(
-                        experiment_structure_table.c.e_from,
-                        experiment_structure_table.c.e_to,
-                        experiment_structure_table.c.min_trigger_status,
-                        experiment_structure_table.c.fail_ok,
-                        experiment_structure_table.c.from_step,
-                        jobs_table.c.status.label("parent_status"),
-                    ).select_from(
-                        experiment_structure_table.join(
-                            jobs_table,
-                            experiment_structure_table.c.e_from == jobs_table.c.name
-                        )
-                    ).where(
-                        experiment_structure_table.c.e_to.in_(children_names)
-                    )
-                )
 
-                cp_rows = conn.execute(
-                    select(
-                        jobs_table.c.name,
-                        jobs_table.c.current_checkpoint_step,
-                    ).where(
-                        jobs_table.c.name.in_(children_names)
-                    )
+        jobs_in_memory = [dict(job) for job in job_list]
+        if not jobs_in_memory:
+            return job_list
+        status_in_memory = {job['name']: job['status'] for job in jobs_in_memory if 'status' in job}
+
+        parents_table = jobs_table.alias('parent')
+        children_table = jobs_table.alias('child')
+        with self._job_names_tmp_table({job['name'] for job in jobs_in_memory}) as (conn, tmp):
+            children_names_query = (
+                select(experiment_structure_table.c.e_to)
+                .select_from(experiment_structure_table.join(tmp, experiment_structure_table.c.e_from == tmp.c.job_name))
+            )
+            edges = conn.execute(
+                select(
+                    experiment_structure_table.c.e_from,
+                    experiment_structure_table.c.e_to,
+                    experiment_structure_table.c.min_trigger_status,
+                    experiment_structure_table.c.fail_ok,
+                    experiment_structure_table.c.from_step,
+                    parents_table.c.status.label("parent_status"),
+                    children_table.c.current_checkpoint_step,
+                ).select_from(
+                    experiment_structure_table
+                    .join(parents_table, experiment_structure_table.c.e_from == parents_table.c.name)
+                    .join(children_table, experiment_structure_table.c.e_to == children_table.c.name)
+                ).where(
+                    experiment_structure_table.c.e_to.in_(children_names_query)
                 )
-                child_checkpoint = {r.name: (r.current_checkpoint_step or 0) for r in cp_rows}
+            ).fetchall()
 
-                all_edges: dict[str, list] = {}
-                for row in rows:
-                    all_edges.setdefault(row.e_to, []).append(row)
-
-                keep = set()
-                for child_name, edges in all_edges.items():
-                    cp = child_checkpoint.get(child_name, 0)
-                    blocked = False
-                    for e in edges:
-                        parent_status = e.parent_status
-                        if e.e_from in names_in_memory:
-                            p_job = next((j for j in job_list_tmp if j['name'] == e.e_from), None)
-                            if p_job:
-                                parent_status = p_job.get('status', parent_status)
-                        if not _edge_satisfied(
-                            parent_status=parent_status,
-                            min_trigger_status=e.min_trigger_status or "COMPLETED",
-                            fail_ok=bool(e.fail_ok) if e.fail_ok is not None else False,
-                            from_step=e.from_step,
-                            child_checkpoint_step=cp,
-                        ):
-                            blocked = True
-                            break
-                    if not blocked:
-                        keep.add(child_name)
-
-                children_names = keep
-
-        for child_name in children_names:
-            if not any(child_name == job.get("child_name") for job in job_list_tmp):
-                where = {'name': child_name}
+            blocked = set()
+            candidates = set()
+            for e in edges:
+                candidates.add(e.e_to)
+                if e.e_to in blocked:
+                    continue
+                if not _edge_satisfied(
+                    parent_status=status_in_memory.get(e.e_from, e.parent_status),
+                    min_trigger_status=e.min_trigger_status or "COMPLETED",
+                    fail_ok=bool(e.fail_ok) if e.fail_ok is not None else False,
+                    from_step=e.from_step,
+                    child_checkpoint_step=e.current_checkpoint_step or 0,
+                ):
+                    blocked.add(e.e_to)
+            children_names = candidates - blocked
+
+            if children_names:
+                condition = jobs_table.c.name.in_(children_names_query)
                 if members is not None:
-                    from sqlalchemy import and_
                     condition = and_(
-                        jobs_table.c.name == child_name,
+                        condition,
                         or_(jobs_table.c.member.in_(members), jobs_table.c.member.is_(None))
                     )
-                    matches = self.select_where_with_columns(jobs_table, condition)
-                else:
-                    matches = self.select_where_with_columns(jobs_table, where)
-                if matches:
-                    child = matches[0]
-                    job_list.append(child)
+                rows = conn.execute(select(jobs_table).where(condition)).fetchall()
+                columns = jobs_table.c.keys()
+                job_list.extend(tuple(zip(columns, row)) for row in rows if row.name in children_names)
 
         return job_list
 
@@ -534,56 +636,71 @@ class JobsDbManager(DbManager):
         pkeys = ['e_from', 'e_to']
         self.upsert_many(table.name, graph, pkeys)
 
-    def update_outgoing_edges_completion(self, job_name: str, job_status: str) -> bool:
-        """Update completion_status to COMPLETED for all satisfied outgoing edges of a job.
+    def update_outgoing_edges_completion_many(self, jobs_status: dict[str, str], batch_size: int = 500) -> set[str]:
+        """Update completion_status to COMPLETED for all satisfied outgoing edges of many jobs.
 
-        Queries experiment_structure directly and updates matching edges in DB.
+        Queries experiment_structure for the outgoing edges of all the given jobs and
+        updates the satisfied ones in a single transaction.
 
-        :param job_name: Name of the parent job.
-        :param job_status: String representation of the parent job's status.
-        :return: True if at least one edge was updated.
+        :param jobs_status: Mapping of parent job names to the string representation of their status.
+        :param batch_size: Maximum number of parent names per ``IN`` query.
+        :return: Names of the jobs whose outgoing edges are all COMPLETED after the update.
         """
+        if not jobs_status:
+            return set()
         structure_table: Table = self.table_registry.get(ExperimentStructureTable.name)
         jobs_table: Table = self.table_registry.get(JobsTable.name)
         self.create_table(structure_table.name)
         self.create_table(jobs_table.name)
 
+        job_names = list(jobs_status)
+        propagated = set(job_names)
+        satisfied_edges = []
         with self._get_engine(structure_table.name).begin() as conn:
-            rows = conn.execute(
-                select(
-                    structure_table.c.e_to,
-                    structure_table.c.min_trigger_status,
-                    structure_table.c.fail_ok,
-                    structure_table.c.from_step,
-                    jobs_table.c.current_checkpoint_step,
-                ).select_from(
-                    structure_table.join(
-                        jobs_table,
-                        structure_table.c.e_to == jobs_table.c.name,
-                        isouter=True
-                    )
-                ).where(structure_table.c.e_from == job_name)
-            ).fetchall()
+            for i in range(0, len(job_names), batch_size):
+                rows = conn.execute(
+                    select(
+                        structure_table.c.e_from,
+                        structure_table.c.e_to,
+                        structure_table.c.min_trigger_status,
+                        structure_table.c.completion_status,
+                        structure_table.c.fail_ok,
+                        structure_table.c.from_step,
+                        jobs_table.c.current_checkpoint_step,
+                    ).select_from(
+                        structure_table.join(
+                            jobs_table,
+                            structure_table.c.e_to == jobs_table.c.name,
+                            isouter=True
+                        )
+                    ).where(structure_table.c.e_from.in_(job_names[i:i + batch_size]))
+                ).fetchall()
 
-            updated = False
-            for row in rows:
-                if _edge_satisfied(
-                    parent_status=job_status,
-                    min_trigger_status=row.min_trigger_status or "COMPLETED",
-                    fail_ok=bool(row.fail_ok) if row.fail_ok is not None else False,
-                    from_step=row.from_step or 0,
-                    child_checkpoint_step=row.current_checkpoint_step or 0,
-                ):
-                    conn.execute(
-                        update(structure_table)
-                        .where(and_(
-                            structure_table.c.e_from == job_name,
-                            structure_table.c.e_to == row.e_to
-                        ))
-                        .values(completion_status="COMPLETED")
-                    )
-                    updated = True
-        return updated
+                for row in rows:
+                    if row.completion_status == "COMPLETED":
+                        continue
+                    if _edge_satisfied(
+                        parent_status=jobs_status[row.e_from],
+                        min_trigger_status=row.min_trigger_status or "COMPLETED",
+                        fail_ok=bool(row.fail_ok) if row.fail_ok is not None else False,
+                        from_step=row.from_step or 0,
+                        child_checkpoint_step=row.current_checkpoint_step or 0,
+                    ):
+                        satisfied_edges.append({'b_e_from': row.e_from, 'b_e_to': row.e_to})
+                    else:
+                        propagated.discard(row.e_from)
+
+            if satisfied_edges:
+                conn.execute(
+                    update(structure_table)
+                    .where(and_(
+                        structure_table.c.e_from == bindparam('b_e_from'),
+                        structure_table.c.e_to == bindparam('b_e_to')
+                    ))
+                    .values(completion_status="COMPLETED"),
+                    satisfied_edges
+                )
+        return propagated
 
     def load_edges(self, job_list: list[dict[str, Any]] | None = None, full_load: bool = True, remove_unused_edges: bool = True) -> list[dict[str, Any]]:
         table: Table = self.table_registry.get(ExperimentStructureTable.name)
@@ -760,12 +877,14 @@ class JobsDbManager(DbManager):
         section_data = self.select_all_with_columns(section_structure_table.name)
         return section_data
 
-    def clear_unused_nodes(self, differences: dict[str, dict[str, Any]]) -> None:
+    def clear_unused_nodes(self, differences: dict[str, dict[str, Any]]) -> set[str]:
         """
         Remove jobs from the database that are no longer needed based on section differences.
 
         :param differences: Dictionary describing changes in sections.
         :type differences: Dict[str, Dict[str, Any]]
+        :return: Names of the removed jobs.
+        :rtype: Set[str]
         """
         jobs_table: Table = self.table_registry.get(JobsTable.name)
         jobs_to_delete: set[str] = set()
@@ -783,6 +902,7 @@ class JobsDbManager(DbManager):
 
         if jobs_to_delete:
             self.delete_where(JobsTable.name, {'name': list(jobs_to_delete)})
+        return jobs_to_delete
 
     def _should_delete_job(self, job: dict[str, Any], section_diff: dict[str, Any]) -> bool:
         """
@@ -851,6 +971,140 @@ class JobsDbManager(DbManager):
 
         return False
 
+    def save_retrials(self, retrials: dict[str, list[list[str]]]) -> None:
+        """Append retrials of several jobs to the retrials table, in one insert.
+
+        :param retrials: Fields of each retrial of each job, as in the lines of its ``TOTAL_STATS`` file:
+            submit, start, finish and status.
+        """
+        columns = ('submit', 'start', 'finish', 'status')
+        rows = [
+            {'name': job_name, **{col: fields[i] if i < len(fields) else None for i, col in enumerate(columns)}}
+            for job_name, job_retrials in retrials.items() for fields in job_retrials
+        ]
+        if not rows:
+            return
+        table: Table = self.table_registry.get(JobRetrialsTable.name)
+        self.create_table(table.name)
+        self.insert_many(table.name, rows)
+
+    def count_retrials(self, job_names: Iterable[str], batch_size: int = 500) -> dict[str, int]:
+        """Return the number of retrials stored of each job.
+
+        :param job_names: Names of the jobs.
+        :param batch_size: Maximum number of job names per ``IN`` query.
+        :return: Number of retrials of each job with stored retrials.
+        """
+        job_names = list(job_names)
+        table: Table = self.table_registry.get(JobRetrialsTable.name)
+        self.create_table(table.name)
+        counts: dict[str, int] = {}
+        with self._get_engine(table.name).connect() as conn:
+            for i in range(0, len(job_names), batch_size):
+                rows = conn.execute(select(table.c.name, func.count()).where(
+                    table.c.name.in_(job_names[i:i + batch_size])).group_by(table.c.name))
+                counts.update({name: count for name, count in rows})
+        return counts
+
+    def save_jobs_retrials(self, jobs: list["Job"]) -> None:
+        """Append the retrials written by ``Job.write_stats`` to the retrials table.
+
+        The ``TOTAL_STATS`` file of a job is the export of its stored retrials. The first time the
+        retrials of a job are saved, and after a failed save, the lines of the file missing in the
+        table are imported instead, so no retrial is stored twice or lost.
+
+        :param jobs: Jobs whose new retrials are saved.
+        """
+        jobs = [job for job in jobs if job.new_retrials]
+        if not jobs:
+            return
+        job_names = [job.name for job in jobs]
+        stored = self.count_retrials(name for name in job_names if name not in self._synced_retrials)
+        retrials: dict[str, list[list[str]]] = {}
+        for job in jobs:
+            if job.name in self._synced_retrials:
+                retrials[job.name] = job.new_retrials
+            else:
+                retrials[job.name] = job.read_total_stats_file()[stored.get(job.name, 0):]
+        self._synced_retrials.difference_update(job_names)
+        self.save_retrials(retrials)
+        self._synced_retrials.update(job_names)
+        for job in jobs:
+            job.new_retrials = []
+
+    def select_retrials(self, job_names: Iterable[str], batch_size: int = 500) -> dict[str, list[list[str]]]:
+        """Return the retrials of the given jobs.
+
+        :param job_names: Names of the jobs.
+        :param batch_size: Maximum number of job names per ``IN`` query.
+        :return: Fields of the retrials of each job with stored retrials, in the order they were saved.
+        """
+        job_names = list(job_names)
+        table: Table = self.table_registry.get(JobRetrialsTable.name)
+        self.create_table(table.name)
+        retrials: dict[str, list[list[str]]] = {}
+        with self._get_engine(table.name).connect() as conn:
+            for i in range(0, len(job_names), batch_size):
+                rows = conn.execute(select(table.c.name, table.c.submit, table.c.start, table.c.finish,
+                                           table.c.status).where(table.c.name.in_(job_names[i:i + batch_size]))
+                                    .order_by(table.c.id))
+                for name, *fields in rows:
+                    retrials.setdefault(name, []).append([field for field in fields if field is not None])
+        return retrials
+
+    def delete_edges_of_jobs(self, job_names: Iterable[str], batch_size: int = 500) -> None:
+        """Delete the edges from and to the given jobs.
+
+        :param job_names: Names of the jobs whose edges are deleted.
+        :param batch_size: Maximum number of job names per ``IN`` query.
+        """
+        job_names = list(job_names)
+        if not job_names:
+            return
+        table: Table = self.table_registry.get(ExperimentStructureTable.name)
+        self.create_table(table.name)
+        with self._get_engine(table.name).begin() as conn:
+            for i in range(0, len(job_names), batch_size):
+                batch = job_names[i:i + batch_size]
+                conn.execute(delete(table).where(or_(table.c.e_from.in_(batch), table.c.e_to.in_(batch))))
+
+    def replace_edges_to(self, job_names: Iterable[str], graph: list[dict[str, Any]],
+                         batch_size: int = 500) -> None:
+        """Replace the stored edges to the given jobs with the ones of ``graph``.
+
+        The stored edges are compared with the new ones, so only the edges that no longer exist are
+        deleted, and only the new or modified edges are written.
+
+        :param job_names: Names of the jobs whose parents were regenerated.
+        :param graph: Edges to the given jobs.
+        :param batch_size: Maximum number of job names per ``IN`` query.
+        """
+        table: Table = self.table_registry.get(ExperimentStructureTable.name)
+        self.create_table(table.name)
+        new_edges = {(edge['e_from'], edge['e_to']): edge for edge in graph}
+        job_names = list(job_names)
+        stored_edges: dict[tuple[str, str], dict[str, Any]] = {}
+        with self._get_engine(table.name).begin() as conn:
+            for i in range(0, len(job_names), batch_size):
+                rows = conn.execute(select(table).where(table.c.e_to.in_(job_names[i:i + batch_size])))
+                stored_edges.update(((row.e_from, row.e_to), dict(row._mapping)) for row in rows)
+
+            stale_edges = [{'b_e_from': e_from, 'b_e_to': e_to}
+                           for e_from, e_to in stored_edges if (e_from, e_to) not in new_edges]
+            if stale_edges:
+                conn.execute(
+                    delete(table).where(and_(table.c.e_from == bindparam('b_e_from'),
+                                             table.c.e_to == bindparam('b_e_to'))),
+                    stale_edges
+                )
+
+        changed_edges = [edge for key, edge in new_edges.items()
+                         if key not in stored_edges or any(stored_edges[key].get(col) != value
+                                                           for col, value in edge.items())]
+        Log.debug(f"Edges to regenerated jobs: {len(stale_edges)} deleted, {len(changed_edges)} written, "
+                  f"{len(new_edges) - len(changed_edges)} unchanged")
+        self.upsert_many(table.name, changed_edges, ['e_from', 'e_to'])
+
     def clear_edges(self) -> None:
         """Clear all edges from the database."""
         experiment_structure_table: Table = self.table_registry.get(ExperimentStructureTable.name)
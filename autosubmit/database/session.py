@@ -15,29 +15,141 @@
 # You should have received a copy of the GNU General Public License
 # along with Autosubmit.  If not, see <http://www.gnu.org/licenses/>.
 
+import os
+import sqlite3
 import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Union
+from typing import Any, ClassVar, Union
 
-from sqlalchemy import Engine, NullPool
+from sqlalchemy import Engine, event
 from sqlalchemy import create_engine as sqlalchemy_create_engine
 
 from autosubmit.config.basicconfig import BasicConfig
 
-__all__ = ["_resolve_engine", "get_engine"]
+__all__ = ["_resolve_engine", "dispose_sqlite_engines", "get_engine"]
+
+SQLITE_ENGINES_LIMIT = 32
+"""Maximum number of SQLite engines kept open by a process, the least recently used ones are disposed."""
+SQLITE_BUSY_TIMEOUT = 30000
+"""Milliseconds SQLite waits for a lock held by another connection before failing."""
+SQLITE_JOURNAL_MODES = ("DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF")
+"""Journal modes accepted in ``BasicConfig.DATABASE_JOURNAL_MODE``."""
+
+
+def _set_sqlite_pragmas(dbapi_connection: sqlite3.Connection, _connection_record: Any) -> None:
+    """Tune every new SQLite connection.
+
+    The journal mode is only changed when it is configured, as it is persistent in the database
+    file. If it cannot be changed, e.g. read-only databases, the connection keeps the current mode.
+
+    :raises ValueError: If the configured journal mode is not one of ``SQLITE_JOURNAL_MODES``.
+    """
+    journal_mode = str(BasicConfig.DATABASE_JOURNAL_MODE or "").strip().upper()
+    if journal_mode and journal_mode not in SQLITE_JOURNAL_MODES:
+        raise ValueError(f"Invalid SQLite journal mode: {BasicConfig.DATABASE_JOURNAL_MODE}, "
+                         f"expected one of {', '.join(SQLITE_JOURNAL_MODES)}")
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT:d}")
+        if journal_mode:
+            try:
+                journal_mode = cursor.execute(f"PRAGMA journal_mode={journal_mode}").fetchone()[0]
+            except sqlite3.DatabaseError:
+                journal_mode = cursor.execute("PRAGMA journal_mode").fetchone()[0]
+        if str(journal_mode).lower() == "wal":
+            # Durable across application crashes in WAL mode, only a power loss may lose the last commits.
+            cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+    finally:
+        cursor.close()
 
 
 def _resolve_engine(connection_url: str) -> Engine:
     """Create SQLAlchemy Core engine and resolves the connection pool class based on the backend.
 
+    SQLite engines keep their connections in the default SQLAlchemy pool, and tune them with
+    :func:`_set_sqlite_pragmas` when they are opened.
+
     :param connection_url: A SQLAlchemy connection URL.
     """
     if not connection_url:
         raise ValueError(f"Invalid SQLAlchemy connection URL: {connection_url}")
 
-    is_sqlite = connection_url.startswith("sqlite")
-    pool_class = NullPool if is_sqlite else None
-    return sqlalchemy_create_engine(connection_url, poolclass=pool_class)
+    engine = sqlalchemy_create_engine(connection_url)
+    if engine.dialect.name == "sqlite":
+        event.listen(engine, "connect", _set_sqlite_pragmas)
+    return engine
+
+
+class SQLiteEngineRegistry:
+    """Registry of the SQLite engines of a process, one per database file.
+
+    Reusing the engines keeps the connections open between queries, instead of opening the
+    file and reading its schema again for every one. The registry is emptied in forked
+    processes, as SQLite connections must not be shared with the parent process.
+    """
+
+    _engines: ClassVar["OrderedDict[str, Engine]"] = OrderedDict()
+    _pid: int = os.getpid()
+    _lock: threading.Lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls, db_path: Path) -> Engine:
+        """Get the engine of the database file, creating the file if it does not exist.
+
+        :param db_path: Path to the database file.
+        """
+        key = os.path.abspath(db_path)
+        with cls._lock:
+            if cls._pid != os.getpid():
+                for engine in cls._engines.values():
+                    engine.dispose(close=False)
+                cls._engines.clear()
+                cls._pid = os.getpid()
+
+            engine = cls._engines.pop(key, None)
+            if engine is not None and not os.path.exists(key):
+                # The database was deleted, do not write to the removed file.
+                engine.dispose()
+                engine = None
+            if engine is None:
+                engine = _resolve_engine(f"sqlite:///{_create_sqlite_file(db_path)}")
+            cls._engines[key] = engine
+
+            while len(cls._engines) > SQLITE_ENGINES_LIMIT:
+                _, unused_engine = cls._engines.popitem(last=False)
+                unused_engine.dispose()
+        return engine
+
+    @classmethod
+    def dispose(cls) -> None:
+        """Close the connections of all the engines and empty the registry."""
+        with cls._lock:
+            for engine in cls._engines.values():
+                engine.dispose()
+            cls._engines.clear()
+
+
+def _create_sqlite_file(db_path: Path) -> Path:
+    """Create the SQLite database file, and its directory, if they do not exist.
+
+    :param db_path: Path to the database file.
+    :return: The resolved path to the database file.
+    """
+    db_path = db_path.resolve()
+    if not db_path.exists():
+        if not db_path.parent.exists():
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            db_path.parent.chmod(0o775)
+        db_path.touch()
+        db_path.chmod(0o775)
+    return db_path
+
+
+def dispose_sqlite_engines() -> None:
+    """Close all the SQLite connections of the process, e.g. before moving or deleting database files."""
+    SQLiteEngineRegistry.dispose()
 
 
 class PostgreSQLEngineSingleton:
@@ -63,8 +175,8 @@ def get_engine(db_path: str | Path) -> Engine:
     In case the backend is PostgreSQL, the connection URL will be read from the environment variable,
     and the engine will be reutilized from the global variable to use the same connection pool.
 
-    In case the backend is SQLite, a new engine will be created for each call based on the provided database path
-    with a NullPool to avoid accumulating open file descriptors.
+    In case the backend is SQLite, the engine of the provided database path is reused by the whole
+    process, see :class:`SQLiteEngineRegistry`.
 
     :param db_path: Path to the database file, only used for SQLite.
     """
@@ -72,17 +184,7 @@ def get_engine(db_path: str | Path) -> Engine:
 
     if db_backend == "sqlite":
         db_path = Path(db_path) if isinstance(db_path, str) else db_path
-        db_path = db_path.resolve()
-        
-        if not db_path.exists():
-            if not db_path.parent.exists():
-                db_path.parent.mkdir(parents=True, exist_ok=True)
-                db_path.parent.chmod(0o775)
-            db_path.touch()
-            db_path.chmod(0o775)
-
-        connection_url = f"sqlite:///{db_path}"
-        return _resolve_engine(connection_url)
+        return SQLiteEngineRegistry.get_instance(db_path)
     elif db_backend == "postgres":
         # Get from singleton engine
         return PostgreSQLEngineSingleton.get_instance()
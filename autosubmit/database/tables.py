@@ -225,6 +225,21 @@ StructureDataTable = Table(
     UniqueConstraint("run_id", "e_from", "e_to", name="unique_structure_data_run_id_e_from_and_e_to"),
 )
 
+"""Table that holds the submit, start and finish times of every retrial of the experiment jobs.
+
+The rows are appended in the same order as the lines of the ``<job>_TOTAL_STATS`` files.
+"""
+JobRetrialsTable = Table(
+    "job_retrials",
+    metadata_obj,
+    Column("id", Integer, primary_key=True, autoincrement=True),
+    Column("name", String, nullable=False, index=True),
+    Column("submit", String),
+    Column("start", String),
+    Column("finish", String),
+    Column("status", String),
+)
+
 SectionsStructureTable = Table(
     "sections",
     metadata_obj,
@@ -309,6 +324,7 @@ JOBLISTTABLES = {
     PreviewWrapperInfoTable.name: PreviewWrapperInfoTable,
     PreviewWrapperJobsTable.name: PreviewWrapperJobsTable,
     SectionsStructureTable.name: SectionsStructureTable,
+    JobRetrialsTable.name: JobRetrialsTable,
 }
 
 JobListTable = JobsTable
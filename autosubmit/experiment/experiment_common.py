@@ -25,6 +25,7 @@ from shutil import rmtree
 
 from autosubmit.config.basicconfig import BasicConfig
 from autosubmit.database import db_common
+from autosubmit.database.session import dispose_sqlite_engines
 from autosubmit.experiment.detail_updater import ExperimentDetails
 from autosubmit.helpers.processes import process_id
 from autosubmit.helpers.utils import user_yes_no_query
@@ -208,6 +209,7 @@ def _delete_expid(expid_delete: str, force: bool = False) -> None:
     message_parts.append(f"{structure_db_path}")
     message_parts.append(f"{job_data_db_path}.db")
     message_parts.append(f"{job_data_db_path}.sql")
+    message_parts.append(f"{job_data_db_path}.db.bak")
     message = '\n'.join(message_parts)
 
     error_message = _perform_deletion(experiment_path, structure_db_path, job_data_db_path, expid_delete)
@@ -245,6 +247,10 @@ def _perform_deletion(experiment_path: Path, structure_db_path: Path, job_data_d
     except Exception as e:
         error_message.append(f"Cannot delete experiment entry: {e}")
 
+    if is_sqlite:
+        # Close the connections first, so that the write-ahead logs of the databases are not left behind.
+        dispose_sqlite_engines()
+
     Log.info("Removing experiment directory...")
     try:
         rmtree(experiment_path)
@@ -261,8 +267,12 @@ def _perform_deletion(experiment_path: Path, structure_db_path: Path, job_data_d
         Log.info("Removing job_data db...")
         db_path = job_data_db_path.with_suffix(".db")
         sql_path = job_data_db_path.with_suffix(".sql")
+        backup_path = job_data_db_path.with_suffix(".db.bak")
         db_path.unlink(missing_ok=True)
+        db_path.with_name(f"{db_path.name}-wal").unlink(missing_ok=True)
+        db_path.with_name(f"{db_path.name}-shm").unlink(missing_ok=True)
         sql_path.unlink(missing_ok=True)
+        backup_path.unlink(missing_ok=True)
         Log.info(f"Experiment {expid_delete} job_data db deleted")
 
     return "\n".join(error_message)
@@ -0,0 +1,181 @@
+# Copyright 2015-2025 Earth Sciences Department, BSC-CNS
+#
+# This file is part of Autosubmit.
+#
+# Autosubmit is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Autosubmit is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Autosubmit.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Background backups of the SQLite historical database of an experiment."""
+
+import os
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import ClassVar
+
+from autosubmit.config.basicconfig import BasicConfig
+from autosubmit.database.session import SQLITE_BUSY_TIMEOUT
+from autosubmit.log.log import Log
+
+__all__ = ["HistoricalDatabaseBackup"]
+
+BACKUP_PAGES_PER_STEP = 1024
+"""Number of database pages copied before the source database lock is released."""
+BACKUP_STEP_SLEEP = 0.01
+"""Seconds between two steps of the copy, so writers can take the database lock."""
+BACKUP_MAX_RESTARTS = 3
+"""Times a copy in steps may start over before the database is copied in a single step."""
+
+
+class HistoricalDatabaseBackup:
+    """Copies ``job_data_<EXPID>.db`` to ``job_data_<EXPID>.db.bak`` in a background thread.
+
+    The copy uses the SQLite online backup API. It copies the pages in small steps, so writers
+    of the historical database are not blocked for the whole copy. As the copy starts over
+    whenever the database is written between two steps, after ``BACKUP_MAX_RESTARTS`` restarts
+    the whole database is copied again in a single step. A new backup is only started once
+    ``interval`` seconds have passed since the previous one, and a forced backup requested
+    while one is running is written after it.
+
+    Use :meth:`for_experiment` to get the instance of an experiment, so the rate limit
+    is shared by every caller in the process.
+    """
+
+    _instances: ClassVar[dict[str, "HistoricalDatabaseBackup"]] = {}
+    _instances_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, database_path: Path, backup_path: Path, interval: float) -> None:
+        """
+        :param database_path: Path to the historical database.
+        :param backup_path: Path where the backup is written.
+        :param interval: Minimum number of seconds between two backups.
+        """
+        self.database_path = database_path
+        self.backup_path = backup_path
+        self.interval = interval
+        self._last_backup: float | None = None
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._running = False
+        self._pending = False
+
+    @classmethod
+    def for_experiment(cls, expid: str) -> "HistoricalDatabaseBackup":
+        """Return the backup of the historical database of an experiment.
+
+        :param expid: Experiment identifier.
+        :return: The instance shared by the whole process for ``expid``.
+        """
+        with cls._instances_lock:
+            if expid not in cls._instances:
+                database_path = Path(BasicConfig.JOBDATA_DIR, f"job_data_{expid}.db")
+                cls._instances[expid] = cls(
+                    database_path,
+                    database_path.with_suffix(".db.bak"),
+                    BasicConfig.JOBDATA_BACKUP_INTERVAL
+                )
+            return cls._instances[expid]
+
+    @property
+    def running(self) -> bool:
+        """Whether a backup is being written."""
+        return self._running
+
+    def request(self, force: bool = False) -> bool:
+        """Start a backup in a background thread, unless it is too early for a new one.
+
+        A forced backup requested while another one is running is written once the running one
+        finishes, so it includes the changes made to the database in the meantime.
+
+        :param force: Start a backup even if ``interval`` has not passed since the last one.
+        :return: True if a backup was started or queued, False otherwise.
+        """
+        with self._lock:
+            if self._running:
+                self._pending = self._pending or force
+                return force
+            now = time.monotonic()
+            if not force and self._last_backup is not None and now - self._last_backup < self.interval:
+                return False
+            self._last_backup = now
+            self._running = True
+            self._thread = threading.Thread(
+                target=self._run, name=f"{self.database_path.stem}_backup", daemon=True)
+            self._thread.start()
+            return True
+
+    def wait(self, timeout: float | None = None) -> None:
+        """Wait until the running backup, if any, finishes.
+
+        :param timeout: Maximum number of seconds to wait.
+        """
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def _run(self) -> None:
+        """Write backups until no forced backup is queued."""
+        while True:
+            self._backup()
+            with self._lock:
+                if not self._pending:
+                    self._running = False
+                    return
+                self._pending = False
+                self._last_backup = time.monotonic()
+
+    def _backup(self) -> None:
+        """Copy the database into a temporary file, then move it over the previous backup."""
+        if not self.database_path.exists():
+            return
+        tmp_path = self.backup_path.with_name(f"{self.backup_path.name}.tmp")
+        try:
+            Log.debug("Backing up jobs_data...")
+            timeout = SQLITE_BUSY_TIMEOUT / 1000
+            with closing(sqlite3.connect(self.database_path, timeout=timeout)) as source, \
+                    closing(sqlite3.connect(tmp_path, timeout=timeout)) as target:
+                try:
+                    source.backup(target, pages=BACKUP_PAGES_PER_STEP, progress=_RestartCounter(),
+                                  sleep=BACKUP_STEP_SLEEP)
+                except _BackupRestarted:
+                    Log.debug("Jobs_data database changed during the backup, copying it in one step.")
+                    source.backup(target, pages=-1)
+            os.replace(tmp_path, self.backup_path)
+            Log.debug("Jobs_data database backup completed.")
+        except Exception as e:
+            Log.debug(f"Jobs_data database backup failed: {str(e)}")
+            tmp_path.unlink(missing_ok=True)
+
+
+class _BackupRestarted(Exception):
+    """Raised to stop a copy in steps that started over too many times."""
+
+
+class _RestartCounter:
+    """Progress callback of a copy in steps, stops it after ``BACKUP_MAX_RESTARTS`` restarts.
+
+    SQLite does not report the restarts, but the number of remaining pages stops going down.
+    """
+
+    def __init__(self) -> None:
+        self.restarts = 0
+        self._remaining: int | None = None
+
+    def __call__(self, _status: int, remaining: int, _total: int) -> None:
+        if self._remaining is not None and remaining >= self._remaining:
+            self.restarts += 1
+            if self.restarts > BACKUP_MAX_RESTARTS:
+                raise _BackupRestarted()
+        self._remaining = remaining
@@ -48,6 +48,7 @@ DB_EXPERIMENT_HEADER_SCHEMA_CHANGES = 14
 DB_VERSION_SCHEMA_CHANGES = 12
 DEFAULT_DB_VERSION = 10
 DEFAULT_MAX_COUNTER = 0
+SQLITE_IN_CLAUSE_BATCH_SIZE = 500  # Stay below the SQLite limit of bound variables per statement
 
 class ExperimentHistoryDbManager(DatabaseManager):
     """ Manages actions directly on the database.
@@ -326,6 +327,18 @@ class ExperimentHistoryDbManager(DatabaseManager):
         job_data_rows = self.get_from_statement(self.historicaldb_file_path, statement)
         return [Models.JobDataRow(*row) for row in job_data_rows]
 
+    def get_last_job_data_dcs_by_job_names(self, job_names):
+        """ Gets JobData data classes in job_data for last=1 and the given job names. """
+        job_names = list(job_names)
+        job_data_rows = []
+        for i in range(0, len(job_names), SQLITE_IN_CLAUSE_BATCH_SIZE):
+            batch = job_names[i:i + SQLITE_IN_CLAUSE_BATCH_SIZE]
+            statement = self.get_built_select_statement(
+                "job_data", f"last=1 and job_name IN ({','.join('?' * len(batch))})")
+            job_data_rows.extend(
+                self.get_from_statement_with_arguments(self.historicaldb_file_path, statement, tuple(batch)))
+        return [JobData.from_model(Models.JobDataRow(*row)) for row in job_data_rows]
+
     def _insert_job_data(self, job_data):
         # type : (JobData) -> int
         """ Insert data class JobData into job_data table. """
@@ -562,6 +575,8 @@ class ExperimentHistoryDatabaseManager(Protocol):
 
     def get_all_last_job_data_dcs(self): ...
 
+    def get_last_job_data_dcs_by_job_names(self, job_names) -> list[JobData]: ...
+
     def update_many_job_data_change_status(self, changes): ...
 
     def get_job_data_by_job_id_name(self, job_id: int, job_name: str): ...
@@ -883,6 +898,20 @@ class SqlAlchemyExperimentHistoryDbManager:
             job_data_rows = conn.execute(query).all()
         return [Models.JobDataRow(*row) for row in job_data_rows]
 
+    def get_last_job_data_dcs_by_job_names(self, job_names):
+        """ Gets JobData data classes in job_data for last=1 and the given job names. """
+        job_names = list(job_names)
+        if not job_names:
+            return []
+        job_data_table = self.table_registry.get(JobDataTable.name)
+        with self._job_names_tmp_table(job_names) as (conn, tmp):
+            job_data_rows = conn.execute(
+                select(job_data_table)
+                .join(tmp, job_data_table.c.job_name == tmp.c.job_name)
+                .where(job_data_table.c.last == 1)
+            ).all()
+        return [JobData.from_model(Models.JobDataRow(*row)) for row in job_data_rows]
+
     def _insert_job_data(self, job_data):
         job_data_table = self.table_registry.get(JobDataTable.name)
         insert_query = (
@@ -37,6 +37,18 @@ from autosubmit.log.log import Log
 
 SECONDS_WAIT_PLATFORM = 60
 
+_TERMINAL_STATUSES = {HUtils.SupportedStatus.COMPLETED, HUtils.SupportedStatus.FAILED}
+
+# Status to the experiment_run attribute that counts the jobs in it.
+_RUN_COUNTER_BY_STATUS = {
+    HUtils.SupportedStatus.COMPLETED: "completed",
+    HUtils.SupportedStatus.FAILED: "failed",
+    HUtils.SupportedStatus.QUEUING: "queuing",
+    HUtils.SupportedStatus.SUBMITTED: "submitted",
+    HUtils.SupportedStatus.RUNNING: "running",
+    HUtils.SupportedStatus.SUSPENDED: "suspended",
+}
+
 
 class ExperimentHistory:
     def __init__(self, expid, force_sql_alchemy: bool = False):
@@ -414,20 +426,56 @@ class ExperimentHistory:
 
     def detect_changes_in_job_list(self, job_list):
         """ Detect changes in job_list compared to the current contents of job_data table. Returns a list of JobData data classes where the status of each item is the new status."""
-        job_name_to_job = {str(job.name): job for job in job_list}
-        current_job_data_dcs = self.manager.get_all_last_job_data_dcs()
+        job_name_to_status = {str(job.name): job.status_str for job in job_list}
+        return self._get_job_data_dcs_with_new_status(self.manager.get_all_last_job_data_dcs(), job_name_to_status)
+
+    @staticmethod
+    def _get_job_data_dcs_with_new_status(job_data_dcs, job_name_to_status):
+        """ Return the JobData data classes whose status differs from job_name_to_status, with the new status set. """
         differences = []
-        for job_dc in current_job_data_dcs:
-            if job_dc.job_name in job_name_to_job:
-                if job_dc.status != job_name_to_job[job_dc.job_name].status_str:
-                    _TERMINAL_STATUSES = {"COMPLETED", "FAILED"}
-                    if not (job_dc.status in _TERMINAL_STATUSES and job_name_to_job[
-                        job_dc.job_name].status_str not in _TERMINAL_STATUSES):
-                        # If the job is not changing from a finalized status to a starting status
-                        job_dc.status = job_name_to_job[job_dc.job_name].status_str
+        for job_dc in job_data_dcs:
+            if job_dc.job_name in job_name_to_status:
+                new_status = job_name_to_status[job_dc.job_name]
+                if job_dc.status != new_status:
+                    # If the job is not changing from a finalized status to a starting status
+                    if not (job_dc.status in _TERMINAL_STATUSES and new_status not in _TERMINAL_STATUSES):
+                        job_dc.status = new_status
                         differences.append(job_dc)
         return differences
 
+    def process_job_changes(self, job_changes):
+        """Update the job_data rows and the current experiment_run counters from the status changes of an iteration.
+
+        Only the last job_data rows of the changed jobs are read, and the counters of the
+        current experiment_run are moved from the previous status to the new one.
+
+        :param job_changes: Job name to ``(previous status, new status)`` for the jobs that changed.
+        :return: The updated current experiment run, or None if it could not be updated.
+        """
+        try:
+            if not job_changes:
+                return None
+            job_name_to_status = {job_name: new_status for job_name, (_, new_status) in job_changes.items()}
+            job_data_dcs = self._get_job_data_dcs_with_new_status(
+                self.manager.get_last_job_data_dcs_by_job_names(job_name_to_status), job_name_to_status)
+            if job_data_dcs:
+                self.manager.update_many_job_data_change_status(
+                    [(HUtils.get_current_datetime(), job.status, Models.RowStatus.CHANGED, job._id)
+                     for job in job_data_dcs])
+            current_experiment_run_dc = self.manager.get_experiment_run_dc_with_max_id()
+            for previous_status, new_status in job_changes.values():
+                if previous_status in _RUN_COUNTER_BY_STATUS:
+                    counter = _RUN_COUNTER_BY_STATUS[previous_status]
+                    setattr(current_experiment_run_dc, counter,
+                            max(0, getattr(current_experiment_run_dc, counter) - 1))
+                if new_status in _RUN_COUNTER_BY_STATUS:
+                    counter = _RUN_COUNTER_BY_STATUS[new_status]
+                    setattr(current_experiment_run_dc, counter, getattr(current_experiment_run_dc, counter) + 1)
+            return self.manager.update_experiment_run_dc_by_id(current_experiment_run_dc)
+        except Exception as exp:
+            self._log.log(str(exp), traceback.format_exc())
+            Log.debug(f'Historical Database error: {str(exp)} {traceback.format_exc()}')
+
     def _get_defined_rowtype(self, code):
         if code:
             return code
@@ -21,10 +21,12 @@ import json
 import locale
 import os
 import re
+import sys
 import time
 from collections import OrderedDict
+from collections.abc import Callable
 from dataclasses import dataclass, field
-from functools import reduce
+from functools import cache, lru_cache, reduce
 from pathlib import Path
 from threading import Thread
 from typing import TYPE_CHECKING, Any
@@ -50,6 +52,12 @@ from autosubmit.job.job_common import Status, increase_wallclock_by_chunk
 from autosubmit.job.job_utils import get_split_size, get_split_size_unit
 from autosubmit.job.metrics_processor import UserMetricProcessor
 from autosubmit.job.template import Language, get_template_snippet
+from autosubmit.job.template.placeholders import (
+    CompiledTemplate,
+    compile_template,
+    compile_template_file,
+    read_template_file,
+)
 from autosubmit.log.log import AutosubmitCritical, Log
 from autosubmit.platforms.execution_mode import ExecutionMode
 from autosubmit.platforms.paramiko_platform import ParamikoPlatform
@@ -85,7 +93,111 @@ class RecoveryReport:
     all_succeeded: bool = False
 
 
+@dataclass
+class RenderedScript:
+    """Script of a job rendered with its parameters, used to check and to create the script."""
+    parameters: dict
+    content: str
+    additional_contents: list[str]
+    variables: list[str]
+    undefined_variables: set[str]
+
+
 EXCLUDED = ["_platform", "_children", "_parents", "submitter"]
+
+
+@cache
+def _experiment_tmp_paths(local_root_dir: str, expid: str, local_tmp_dir: str) -> tuple[str, Path]:
+    """Return the tmp and log directories of an experiment.
+
+    The values are cached so that all the jobs of an experiment share the same objects
+    instead of storing a copy each.
+    """
+    tmp_path = os.path.join(local_root_dir, expid, local_tmp_dir)
+    return tmp_path, Path(f"{tmp_path}/LOG_{expid}")
+
+
+_DELETED = object()
+"""Value of a deleted ``_LazyAttribute``."""
+
+
+class _LazyAttribute:
+    """Job attribute stored in the ``_lazy_attributes`` dictionary of the job instead of in a slot.
+
+    The dictionary is only created when one of these attributes is set, so the jobs that never set
+    them only pay for one slot. Until then, reading the attribute returns ``default``, or the value
+    built by ``factory`` from the job, which is then stored. As with a slot, reading a deleted
+    attribute raises ``AttributeError``.
+    """
+
+    __slots__ = ('default', 'factory', 'name')
+
+    def __init__(self, default: Any = None, factory: Callable[['Job'], Any] | None = None) -> None:
+        self.default = default
+        self.factory = factory
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: 'Job | None', owner: type | None = None) -> Any:
+        if instance is None:
+            return self
+        attributes = getattr(instance, '_lazy_attributes', None)
+        if attributes is not None and self.name in attributes:
+            value = attributes[self.name]
+            if value is _DELETED:
+                raise AttributeError(self.name)
+            return value
+        if self.factory is None:
+            return self.default
+        value = self.factory(instance)
+        self.__set__(instance, value)
+        return value
+
+    def __set__(self, instance: 'Job', value: Any) -> None:
+        attributes = getattr(instance, '_lazy_attributes', None)
+        if attributes is None:
+            attributes = instance._lazy_attributes = {}
+        attributes[self.name] = value
+
+    def __delete__(self, instance: 'Job') -> None:
+        self.__get__(instance)
+        self.__set__(instance, _DELETED)
+
+
+@lru_cache(maxsize=1024)
+def _parse_iso_date(date_str: str) -> datetime.datetime:
+    """Parse a date stored in the database.
+
+    The values are cached so that the jobs of the same date share the same object.
+    """
+    return datetime.datetime.fromisoformat(date_str)
+
+
+_NO_LOG_NAMES: dict[tuple, tuple] = {}
+
+
+def _log_names(out: str | None, err: str | None) -> tuple:
+    """Return the ``(out, err)`` tuple of log file names of a job.
+
+    The tuple of the jobs without logs is shared instead of stored once per job.
+    """
+    if not out and not err:
+        return _NO_LOG_NAMES.setdefault((out, err), (out, err))
+    return out, err
+
+
+def _parse_stats_date(string_date: str) -> datetime.datetime | None:
+    """Parse a date of the TOTAL_STATS file.
+
+    The dates are written as ``%Y%m%d%H%M%S``, which is parsed directly, much faster than
+    ``strptime``. Any other format is delegated to ``parse_date``.
+    """
+    if len(string_date) == 14 and string_date.isdigit():
+        return datetime.datetime(int(string_date[0:4]), int(string_date[4:6]), int(string_date[6:8]),
+                                 int(string_date[8:10]), int(string_date[10:12]), int(string_date[12:14]))
+    return parse_date(string_date)
+
 PERSISTENT_ATTRIBUTES = (
     "name",
     "id",
@@ -117,6 +229,10 @@ PERSISTENT_ATTRIBUTES = (
     "log_recovery_call_count",
     "wrapper_type",
 )
+# Columns of the ``jobs`` table written by ``Job.__getstate__``, used for dirty tracking.
+PERSISTED_COLUMNS = tuple(
+    attribute for attribute in PERSISTENT_ATTRIBUTES if attribute not in ("local_logs", "remote_logs")
+) + ("local_logs_out", "local_logs_err", "remote_logs_out", "remote_logs_err")
 
 
 # This decorator contains groups of parameters, with each
@@ -197,115 +313,126 @@ class Job:
     __slots__ = (
         '_children',
         '_chunk',
-        '_chunk_size',
-        '_chunk_size_unit',
-        '_cpmip_thresholds',
-        '_custom_directives',
-        '_delay',
-        '_delay_retrials',
-        '_dependencies',
-        '_export',
         '_fail_count',
         '_frequency',
-        '_hyperthreading',
+        '_lazy_attributes',
         '_local_logs',
         '_log_path',
-        '_log_recovery_retries',
-        '_long_name',
         '_member',
-        '_memory',
-        '_memory_per_task',
         '_name',
-        '_nodes',
-        '_notify_on',
         '_packed',
         '_parents',
-        '_partition',
-        '_platform',
+        '_persisted_state',
         '_platform',
-        '_processors',
-        '_processors_per_node',
-        '_queue',
         '_remote_logs',
         '_retrials',
-        '_scratch_free_space',
-        '_script',
         '_section',
-        '_serial_platform',
-        '_shape',
         '_split',
         '_splits',
         '_status',
+        '_status_index',
         '_synchronize',
-        '_tasks',
-        '_threads',
         '_tmp_path',
-        '_validate_template',
         '_wallclock',
-        '_wallclock_in_seconds',
-        '_wrapper_queue',
-        '_x11',
-        '_x11_options',
-        'additional_files',
-        'check',
-        'check_warnings',
         'current_checkpoint_step',
         'date',
-        'date_format',
         'date_split',
-        'delay_end',
-        'delete_when_edgeless',
-        'distance_weight',
-        'ec_queue',
-        'exclusive',
-        'executable',
         'expid',
-        'ext_header_path',
-        'ext_tailer_path',
-        'file',
         'finish_time_timestamp',
-        'finished_time',
-        'first_wrapped_level',
-        'het',
         'hold',
         'id',
         'is_wrapper',
         'level',
         'log_recovery_call_count',
-        'log_retries',
         'max_checkpoint_step',
-        'max_waiting_jobs',
         'new_status',
-        'packed_during_building',
-        'parameters',
         'platform_name',
         'prev_status',
         'priority',
         'ready_date',
-        'repacked',
         'rerun_only',
-        'reservation',
-        'retry_delay',
         'running',
         'script_name',
-        'skippable',
         'start_time',
         'start_time_timestamp',
-        'stat_file',
         'submit_time_timestamp',
         'submitter',
-        'total_jobs',
-        'type',
-        'undefined_variables',
         'updated',
         'updated_log',
         'updated_stats',
-        'wchunkinc',
-        'workflow_commit',
         'wrapper_name',
-        'wrapper_type'
+        'wrapper_type',
     )
 
+    # Attributes that most jobs never set, for instance the jobs only loaded to evaluate edges or to be
+    # plotted. They are kept in ``_lazy_attributes``, which is only created once one of them is set.
+    # The three variables under this message are related to the #PR2918 that is a development
+    # focused on adding the key information for computing the simulated years for the CPMIPS metrics.
+    _chunk_size = _LazyAttribute()
+    _chunk_size_unit = _LazyAttribute()
+    _cpmip_thresholds = _LazyAttribute(factory=lambda job: {})
+    _custom_directives = _LazyAttribute()
+    _delay = _LazyAttribute()
+    _delay_retrials = _LazyAttribute()
+    _dependencies = _LazyAttribute(factory=lambda job: [])
+    _export = _LazyAttribute("none")
+    _hyperthreading = _LazyAttribute()
+    _log_recovery_retries = _LazyAttribute()
+    _long_name = _LazyAttribute()
+    _memory = _LazyAttribute()
+    _memory_per_task = _LazyAttribute()
+    _nodes = _LazyAttribute()
+    _notify_on = _LazyAttribute()
+    _partition = _LazyAttribute()
+    _processors = _LazyAttribute()
+    _processors_per_node = _LazyAttribute()
+    _queue = _LazyAttribute()
+    _scratch_free_space = _LazyAttribute()
+    _script = _LazyAttribute()
+    _serial_platform = _LazyAttribute()
+    _shape = _LazyAttribute()
+    _tasks = _LazyAttribute()
+    _threads = _LazyAttribute()
+    # Retrials loaded from the database by ``JobList.load_retrials``, None to read the TOTAL_STATS file.
+    _total_stats = _LazyAttribute()
+    _validate_template = _LazyAttribute(False)
+    _wallclock_in_seconds = _LazyAttribute()
+    _wrapper_queue = _LazyAttribute()
+    _x11 = _LazyAttribute()
+    _x11_options = _LazyAttribute()
+    additional_files = _LazyAttribute(factory=lambda job: [])
+    check = _LazyAttribute('true')
+    check_warnings = _LazyAttribute(False)
+    date_format = _LazyAttribute('')
+    delay_end = _LazyAttribute()
+    delete_when_edgeless = _LazyAttribute(False)
+    distance_weight = _LazyAttribute(0)
+    ec_queue = _LazyAttribute()
+    exclusive = _LazyAttribute("")
+    executable = _LazyAttribute()
+    ext_header_path = _LazyAttribute()
+    ext_tailer_path = _LazyAttribute()
+    file = _LazyAttribute()
+    finished_time = _LazyAttribute()
+    first_wrapped_level = _LazyAttribute()
+    het = _LazyAttribute()
+    log_retries = _LazyAttribute(5)
+    max_waiting_jobs = _LazyAttribute()
+    # Retrials written by ``write_stats`` and not saved in the database yet, see ``JobsDbManager.save_jobs_retrials``.
+    new_retrials = _LazyAttribute(factory=lambda job: [])
+    packed_during_building = _LazyAttribute(False)
+    parameters = _LazyAttribute()
+    repacked = _LazyAttribute(0)
+    reservation = _LazyAttribute("")
+    retry_delay = _LazyAttribute()
+    skippable = _LazyAttribute(False)
+    stat_file = _LazyAttribute(factory=lambda job: f"{job.script_name[:-4]}_STAT_")
+    total_jobs = _LazyAttribute()
+    type = _LazyAttribute(Language.BASH)
+    undefined_variables = _LazyAttribute()
+    wchunkinc = _LazyAttribute()
+    workflow_commit = _LazyAttribute()
+
     def __setstate__(self, state: dict[str, Any]) -> None:
         """Restore the job state from persisted metadata.
 
@@ -318,25 +445,29 @@ class Job:
                         'status', 'date']:
                 continue
 
-            if slot in self.__slots__:
+            if self._is_attribute(slot):
                 setattr(self, slot, value)
             else:
                 slot = self.internal_slot_name(slot)
-                if slot in self.__slots__:
+                if self._is_attribute(slot):
                     setattr(self, slot, value)
 
-        self.local_logs = (state.get('_local_logs_out', state.get('local_logs_out', '')),
-                           state.get('_local_logs_err', state.get('local_logs_err', '')))
-        self.remote_logs = (state.get('_remote_logs_out', state.get('remote_logs_out', '')),
-                            state.get('_remote_logs_err', state.get('remote_logs_err', '')))
+        self.local_logs = _log_names(state.get('_local_logs_out', state.get('local_logs_out', '')),
+                                     state.get('_local_logs_err', state.get('local_logs_err', '')))
+        self.remote_logs = _log_names(state.get('_remote_logs_out', state.get('remote_logs_out', '')),
+                                      state.get('_remote_logs_err', state.get('remote_logs_err', '')))
 
         self.status = Status.KEY_TO_VALUE[state['status']]
 
         if date_str := state.get('date'):
-            self.date = datetime.datetime.fromisoformat(date_str)
+            self.date = _parse_iso_date(date_str)
         else:
             self.date = None
 
+    def _is_attribute(self, name: str) -> bool:
+        """Whether ``name`` is a slot or a lazy attribute of the job, see ``_LazyAttribute``."""
+        return name in self.__slots__ or isinstance(getattr(type(self), name, None), _LazyAttribute)
+
     def internal_slot_name(self, slot) -> str:
         """Normalize the slot name to match the expected format.
 
@@ -368,6 +499,24 @@ class Job:
         del job_data["remote_logs"]
         return job_data
 
+    def get_dirty_columns(self, state: dict[str, Any]) -> set[str] | None:
+        """Return the persisted columns that changed since the last flush to the database.
+
+        :param state: Current serialized state, as returned by ``__getstate__``.
+        :return: ``None`` if the job was never flushed, otherwise the set of changed columns.
+        """
+        persisted_state = getattr(self, '_persisted_state', None)
+        if persisted_state is None:
+            return None
+        return {column for column, value in zip(PERSISTED_COLUMNS, persisted_state) if value != state.get(column)}
+
+    def mark_persisted(self, state: dict[str, Any]) -> None:
+        """Record ``state`` as the last version of the job flushed to the database.
+
+        :param state: Serialized state that was written, as returned by ``__getstate__``.
+        """
+        self._persisted_state = tuple(state.get(column) for column in PERSISTED_COLUMNS)
+
     CHECK_ON_SUBMISSION = 'on_submission'
 
     # TODO
@@ -388,124 +537,68 @@ class Job:
     def __init__(self, name=None, job_id=None, status=None, priority=None, loaded_data=None):
         if not name:
             name = ""
+        self._lazy_attributes: dict[str, Any] | None = None
         self.rerun_only = False
-        self.delay_end = None
         self.wrapper_type = None
-        self._wrapper_queue = None
         self._platform: ParamikoPlatform = None
-        self._queue = None
-        self._partition = None
-        self.retry_delay = None
         #: (str): Type of the job, as given on job configuration file. (job: TASKTYPE)
         self._section: str | None = None
         self._wallclock: str | None = None
-        self.wchunkinc = None
-        self._tasks = None
-        self._nodes = None
-        self._threads = None
-        self._processors = None
-        self._memory = None
-        self._memory_per_task = None
         self._chunk = None
         self._member = None
         self.date = None
         self.date_split = None
         self._splits = None
         self._split = None
-        self._delay = None
         self._frequency = None
         self._synchronize = None
-        self.skippable = False
-        self.repacked = 0
-        self._long_name = None
-        self.date_format = ''
-        self.type = Language.BASH
-        self.undefined_variables = None
-        self.log_retries = 5
         self.id = job_id
-        self.file = None
-        self.additional_files = []
-        self.executable = None
         self._local_logs = ('', '')
         self._remote_logs = ('', '')
+        self._status_index = None
         self._status = None
         self.status = status
         self.prev_status = status
         self.new_status = status
         self.priority = priority
-        self._parents = set()
-        self._children = set()
+        # Created on first access, most loaded jobs are never connected to anything.
+        self._parents = None
+        self._children = None
         self._fail_count = 0
         self._platform = None
-        self.check = 'true'
-        self.check_warnings = False
         self.packed = False
         self.hold = False  # type: bool
-        self.distance_weight = 0
         self.level = 0
-        self._export = "none"
-        self._dependencies = []
         self.running = None
-        self.ext_header_path = None
-        self.ext_tailer_path = None
-        self.total_jobs = None
-        self.max_waiting_jobs = None
-        self.exclusive = ""
         self._retrials = 0
         # internal
         self.current_checkpoint_step = 0
         self.max_checkpoint_step = 0
-        self.reservation = ""
-        self.delete_when_edgeless = False
-        # hetjobs
-        self.het = None
         self.updated_log = 0
         self.submit_time_timestamp = None  # for wrappers, all jobs inside a wrapper are submitted at the same time
         self.start_time_timestamp = None
         self.finish_time_timestamp = None  # for wrappers, with inner_retrials, the submission time should be the last finish_time of the previous retrial
-        self._script = None  # Inline code to be executed
         self.ready_date = None
         self.wrapper_name = None
         self.is_wrapper = False
-        self._wallclock_in_seconds = None
-        self._notify_on = None
-        # The three variables under this message are related to the #PR2918 that is a development
-        # focused on adding the key information for computing the simulated years for the CPMIPS metrics.
-        self._cpmip_thresholds = {}
-        self._chunk_size = None
-        self._chunk_size_unit = None
-        self._validate_template = False
-        self._processors_per_node = None
-        self.ec_queue = None
         self.platform_name = None
-        self._serial_platform = None
         self.submitter = None
-        self._shape = None
-        self._x11 = None
-        self._x11_options = None
-        self._hyperthreading = None
-        self._scratch_free_space = None
-        self._delay_retrials = None
-        self._custom_directives = None
-        self.packed_during_building = False
-        self.workflow_commit = None
         self._name = name
         self.name = name
+        self._persisted_state = None
         if loaded_data:
             self.__setstate__(loaded_data)
+            self.mark_persisted(loaded_data)
         self.script_name = self.name + ".cmd"
-        self.stat_file = f"{self.script_name[:-4]}_STAT_"
         """Number of failed attempts to run this job. (FAIL_COUNT)"""
-        self.expid: str = self.name.split('_')[0]
-        BasicConfig.read()
-        self._tmp_path = os.path.join(
+        # Shared by all the jobs of the experiment.
+        self.expid: str = sys.intern(self.name.split('_')[0])
+        BasicConfig.read_cached()
+        self._tmp_path, self._log_path = _experiment_tmp_paths(
             BasicConfig.LOCAL_ROOT_DIR, self.expid, BasicConfig.LOCAL_TMP_DIR)
-        self._log_path = Path(f"{self._tmp_path}/LOG_{self.expid}")
         self.updated = False
-        self.log_recovery_call_count = copy.copy(self.updated_log)
-        self.finished_time = None
-        self.validate_template = False
-        self.finished_time = None
+        self.log_recovery_call_count = self.updated_log
+
     def clean_attributes(self):
         """Reset ephemeral job attributes, keeping only persistent state.
 
@@ -1059,6 +1152,8 @@ class Job:
         :return: parent jobs
         :rtype: set
         """
+        if self._parents is None:
+            self._parents = set()
         return self._parents
 
     @parents.setter
@@ -1076,8 +1171,12 @@ class Job:
     @status.setter
     def status(self, status):
         """
-        Sets the status of the job
+        Sets the status of the job, and moves it in the status index of its job list
         """
+        status_index = getattr(self, '_status_index', None)
+        if status_index is not None and status != self._status:
+            status_index.get(self._status, {}).pop(self, None)
+            status_index.setdefault(status, {})[self] = None
         self._status = status
 
     @property  # type: ignore
@@ -1092,7 +1191,7 @@ class Job:
         """
         Comma separated list of children's names
         """
-        return ",".join([str(child.name) for child in self._children])
+        return ",".join([str(child.name) for child in self._children or ()])
 
     @property  # type: ignore
     def is_serial(self):
@@ -1200,6 +1299,8 @@ class Job:
         :return: child jobs
         :rtype: set
         """
+        if self._children is None:
+            self._children = set()
         return self._children
 
     @children.setter
@@ -1325,7 +1426,7 @@ class Job:
                 num_parents = len(parent)
             for i in range(num_parents):
                 new_parent = parent[i] if isinstance(parent, list) else parent
-                self._parents.add(new_parent)
+                self.parents.add(new_parent)
                 new_parent.__add_child(self)
 
     def add_children(self, children):
@@ -1337,7 +1438,7 @@ class Job:
         """
         for child in (child for child in children if child.name != self.name):
             self.__add_child(child)
-            child._parents.add(self)
+            child.parents.add(self)
 
     def __add_child(self, new_child):
         """
@@ -1398,6 +1499,33 @@ class Job:
             Log.warning(f"Log file {logname} does not exist")
             return 0
 
+    def _read_total_stats(self) -> list[list[str]]:
+        """
+        Returns the fields of every retrial of the job: submit, start, finish and status.
+
+        The retrials loaded from the database are used if available, otherwise they are read from
+        the TOTAL_STATS file associated to job.
+
+        :return: list of fields of each retrial
+        :rtype: list[list[str]]
+        """
+        if self._total_stats is not None:
+            return self._total_stats
+        return self.read_total_stats_file()
+
+    def read_total_stats_file(self) -> list[list[str]]:
+        """
+        Returns the fields of every retrial of the job written in its TOTAL_STATS file.
+
+        :return: list of fields of each retrial
+        :rtype: list[list[str]]
+        """
+        log_name = Path(f"{self._tmp_path}/{self.name}_TOTAL_STATS")
+        if not log_name.exists():
+            return []
+        with open(log_name) as f:
+            return [line.split() for line in f.readlines() if line.strip()]
+
     def _get_from_total_stats(self, index) -> list[datetime.datetime]:
         """
         Returns list of values from given column index position in TOTAL_STATS file associated to job
@@ -1407,17 +1535,7 @@ class Job:
         :return: list of values in column index position
         :rtype: list[datetime.datetime]
         """
-        log_name = Path(f"{self._tmp_path}/{self.name}_TOTAL_STATS")
-        lst = []
-        if log_name.exists() and log_name.stat().st_size > 0:
-            with open(log_name) as f:
-                lines = f.readlines()
-                for line in lines:
-                    fields = line.split()
-                    if len(fields) >= index + 1:
-                        lst.append(parse_date(fields[index]))
-
-        return lst
+        return [_parse_stats_date(fields[index]) for fields in self._read_total_stats() if len(fields) >= index + 1]
 
     def check_submit_time(self, attempt: int) -> int:
         """Return submit time (epoch seconds) from line 0 of the STAT file."""
@@ -1468,24 +1586,19 @@ class Job:
         :return: list of dates of retrial [submit, start, finish] in datetime format
         :rtype: list of list
         """
-        log_name = os.path.join(self._tmp_path, self.name + '_TOTAL_STATS')
         retrials_list: list = []
-        if os.path.exists(log_name):
-            already_completed = False
-            # Read lines of the TOTAL_STATS file starting from last
-            with open(log_name) as f:
-                lines = f.readlines()
-            for retrial in reversed(lines):
-                retrial_fields: list = retrial.split()
-                if Job.is_a_completed_retrial(retrial_fields):
-                    # It's a COMPLETED run
-                    if already_completed:
-                        break
-                    already_completed = True
-                retrial_dates = list(map(lambda y: parse_date(y) if y != 'COMPLETED' and y != 'FAILED' else y,
-                                         retrial_fields))
-                # Inserting list [submit, start, finish] of datetime at the beginning of the list. Restores ordering.
-                retrials_list.insert(0, retrial_dates)
+        already_completed = False
+        # Read the retrials starting from last
+        for retrial_fields in reversed(self._read_total_stats()):
+            if Job.is_a_completed_retrial(retrial_fields):
+                # It's a COMPLETED run
+                if already_completed:
+                    break
+                already_completed = True
+            retrial_dates = list(map(lambda y: _parse_stats_date(y) if y != 'COMPLETED' and y != 'FAILED' else y,
+                                     retrial_fields))
+            # Inserting list [submit, start, finish] of datetime at the beginning of the list. Restores ordering.
+            retrials_list.insert(0, retrial_dates)
         return retrials_list
 
     def get_new_remotelog_name(self, attempt: int):
@@ -1562,8 +1675,28 @@ class Job:
         self.update_start_time(attempt)
         self.write_start_time(attempt)
         self.write_end_time(self.status == Status.COMPLETED, attempt)
+        retrial = [str(self.submit_time_timestamp), str(self.start_time_timestamp),
+                   str(self.finish_time_timestamp), self.status_str]
+        self._append_total_stats(retrial)
+        # Saved in the database with the rest of the job, see ``JobsDbManager.save_jobs_retrials``
+        self.new_retrials.append(retrial)
+        self._total_stats = None
         return True
 
+    def _append_total_stats(self, retrial: list[str]) -> None:
+        """Append a retrial to the TOTAL_STATS file, the export of the retrials stored in the database.
+
+        :param retrial: Fields of the retrial: submit, start, finish and status.
+        """
+        path = Path(self._tmp_path) / f"{self.name}_TOTAL_STATS"
+        separator = ''
+        if path.exists() and path.stat().st_size > 0:
+            with path.open('rb') as f:
+                f.seek(-1, os.SEEK_END)
+                separator = '' if f.read(1) == b'\n' else '\n'
+        with path.open('a', encoding='utf-8') as f:
+            f.write(separator + ' '.join(retrial))
+
     def _update_submit_time_from_stat(self, attempt: int) -> None:
         """Read submit_time from the local STAT file (line 0) and set ``submit_time_timestamp``."""
         submit_epoch = self.check_submit_time(attempt)
@@ -2638,8 +2771,7 @@ class Job:
                 template = "%DEFAULT.EXPID%"
             else:
                 if (Path(as_conf.get_project_dir()) / file).exists():
-                    with open(Path(as_conf.get_project_dir()) / file, 'r') as f:
-                        template = f.read()
+                    template = read_template_file(Path(as_conf.get_project_dir()) / file)
                 else:
                     raise AutosubmitCritical(f"Additional file {file} not found in the project directory.", 6001)
             additional_templates += [template]
@@ -2652,29 +2784,12 @@ class Job:
         :param parameters: Parameters dictionary.
         :return: A tuple with the job script template and a list with the additional file names.
         """
-        if self.script:
-            if self.file:
-                Log.warning(f"Custom script for job {self.name} is being used, file contents are ignored.")
-            template = self.script
-        else:
-            try:
-                if as_conf.get_project_type().lower() != "none" and len(as_conf.get_project_type()) > 0:
-                    template_file = open(os.path.join(as_conf.get_project_dir(), self.file), 'r')
-                    template = ''
-                    template += template_file.read()
-                    template_file.close()
-                else:
-                    if self.type == Language.BASH:
-                        template = 'sleep 5'
-                    elif self.type == Language.PYTHON2 or self.type == Language.PYTHON3 or self.type == Language.PYTHON:
-                        template = 'time.sleep(5)' + "\n"
-                    elif self.type == Language.R:
-                        template = 'Sys.sleep(5)'
-                    else:
-                        template = ''
-            except Exception as e:
-                Log.warning(f'Failed to create the template script {self.file}: {str(e)}')
-                template = ''
+        try:
+            template_file = self._get_template_file(as_conf)
+            template = read_template_file(template_file) if template_file else self._get_inline_template()
+        except Exception as e:
+            Log.warning(f'Failed to create the template script {self.file}: {str(e)}')
+            template = ''
 
         snippet = get_template_snippet(self.type)
 
@@ -2682,6 +2797,60 @@ class Job:
         additional_content = self.update_content_extra(as_conf, self.additional_files)
         return template_content, additional_content
 
+    def compile_content(self, as_conf: AutosubmitConfig,
+                        parameters: dict) -> tuple[list[CompiledTemplate], list[CompiledTemplate]]:
+        """Get the compiled templates of the script of the job and of its additional files.
+
+        The script is split into its header, body and tailer. Only the header depends on the
+        job, the body is parsed once per template file and modification time.
+
+        :param as_conf: Autosubmit configuration.
+        :param parameters: Parameters dictionary.
+        :return: A tuple with the templates of the script, and those of the additional files.
+        """
+        snippet = get_template_snippet(self.type)
+        try:
+            template_file = self._get_template_file(as_conf)
+            if template_file:
+                body = compile_template_file(template_file, snippet.as_body)
+            else:
+                body = compile_template(snippet.as_body(self._get_inline_template()))
+        except (OSError, TypeError) as e:
+            Log.warning(f'Failed to create the template script {self.file}: {str(e)}')
+            body = compile_template(snippet.as_body(''))
+
+        header = compile_template(snippet.as_header(self._platform.get_header(self, parameters), self.executable))
+        script_templates = [header, body, compile_template(snippet.as_tailer())]
+        additional_templates = [compile_template(template)
+                                for template in self.update_content_extra(as_conf, self.additional_files)]
+        return script_templates, additional_templates
+
+    def _get_template_file(self, as_conf: AutosubmitConfig) -> str | None:
+        """Get the path of the template file of the job.
+
+        :param as_conf: Autosubmit configuration.
+        :return: The path, or None if the job has a custom script or the experiment has no project.
+        """
+        if self.script:
+            if self.file:
+                Log.warning(f"Custom script for job {self.name} is being used, file contents are ignored.")
+            return None
+        if as_conf.get_project_type().lower() != "none" and len(as_conf.get_project_type()) > 0:
+            return os.path.join(as_conf.get_project_dir(), self.file)
+        return None
+
+    def _get_inline_template(self) -> str:
+        """Get the template of a job without template file, its custom script or a sleep."""
+        if self.script:
+            return self.script
+        if self.type == Language.BASH:
+            return 'sleep 5'
+        elif self.type == Language.PYTHON2 or self.type == Language.PYTHON3 or self.type == Language.PYTHON:
+            return 'time.sleep(5)' + "\n"
+        elif self.type == Language.R:
+            return 'Sys.sleep(5)'
+        return ''
+
     def get_wrapped_content(self, as_conf: AutosubmitConfig, parameters: dict):
         snippet: TemplateSnippet = get_template_snippet(Language.EMPTY)
         template = f'python $SCRATCH/{self.expid}/LOG_{self.expid}/{self.name}.cmd'
@@ -2728,26 +2897,50 @@ class Job:
                 return True
         return False
 
-    def create_script(self, as_conf: AutosubmitConfig) -> str:
+    def render_script(self, as_conf: AutosubmitConfig) -> RenderedScript:
+        """
+        Render the script of the job, and its additional files, with the current parameters.
+
+        The placeholders without a value, like the undefined variables, are removed,
+        except the default parameters (e.g. ``%Y%``) that are left for the job.
+
+        :param as_conf: Configuration object.
+        :type as_conf: AutosubmitConfig
+        :return: The rendered script.
+        :rtype: RenderedScript
+        """
+        parameters = self.update_parameters(as_conf, set_attributes=False)
+        script_templates, additional_templates = self.compile_content(as_conf, parameters)
+        variables = [variable for template in [*script_templates, *additional_templates]
+                     for variable in template.variables if variable not in as_conf.default_parameters]
+        keep = set(as_conf.default_parameters.values())
+        return RenderedScript(
+            parameters=parameters,
+            content=''.join(template.render(parameters, keep=keep) for template in script_templates),
+            additional_contents=[template.render(parameters, keep=keep) for template in additional_templates],
+            variables=variables,
+            undefined_variables=set(variables) - set(parameters)
+        )
+
+    def create_script(self, as_conf: AutosubmitConfig, rendered: RenderedScript | None = None) -> str:
         """
         Create the script file to be run for the job.
 
         :param as_conf: Configuration object.
         :type as_conf: AutosubmitConfig
+        :param rendered: The script already rendered by ``check_script``, if any.
+        :type rendered: RenderedScript
         :return: Script's filename.
         :rtype: str
         """
         lang = locale.getlocale()[1] or locale.getdefaultlocale()[1] or 'UTF-8'
-        parameters = self.update_parameters(as_conf, set_attributes=False)
-        template_content, additional_templates = self.update_content(as_conf, parameters)
+        if rendered is None:
+            rendered = self.render_script(as_conf)
 
-        for additional_file, additional_template_content in zip(self.additional_files, additional_templates):
-            processed_content = self._substitute_placeholders(additional_template_content, parameters, as_conf)
+        for additional_file, processed_content in zip(self.additional_files, rendered.additional_contents):
             self._write_additional_file(additional_file, processed_content, lang)
 
-        template_content = self._substitute_placeholders(
-            template_content, parameters, as_conf, self.undefined_variables
-        )
+        template_content = rendered.content
 
         script_name = f'{self.name}.cmd'
         self.script_name = script_name
@@ -2840,47 +3033,6 @@ class Job:
                 e.message += f". Generated scripts are located in file://{script_path.parent} the current file is {script_path.name}"
             raise e
 
-    def _substitute_placeholders(
-            self,
-            content: str,
-            parameters: dict,
-            as_conf: AutosubmitConfig,
-            undefined_variables: list[str] | None = None
-    ) -> str:
-        """
-        Replace placeholders in the template content.
-
-        :param content: Template content with placeholders.
-        :type content: str
-        :param parameters: Dictionary of parameters for substitution.
-        :type parameters: dict
-        :param as_conf: Autosubmit configuration object.
-        :type as_conf: AutosubmitConfig
-        :param undefined_variables: List of undefined variable names to remove.
-        :type undefined_variables: list[str], optional
-        :return: Content with placeholders substituted.
-        :rtype: str
-        """
-        if undefined_variables is None:
-            undefined_variables = []
-
-        placeholders = re.findall(r'%(?<!%%)[a-zA-Z0-9_.-]+%(?!%%)', content, flags=re.IGNORECASE)
-        for placeholder in placeholders:
-            if placeholder in as_conf.default_parameters.values():
-                continue
-            key = placeholder[1:-1]
-            value = str(parameters.get(key.upper(), ""))
-            if not value:
-                content = re.sub(r'%(?<!%%)' + key + r'%(?!%%)', '', content, flags=re.IGNORECASE)
-            else:
-                if "\\" in value:
-                    value = re.escape(value)
-                content = re.sub(r'%(?<!%%)' + key + r'%(?!%%)', value, content, flags=re.IGNORECASE)
-        if undefined_variables:
-            for variable in undefined_variables:
-                content = re.sub(r'%(?<!%%)' + variable + r'%(?!%%)', '', content, flags=re.IGNORECASE)
-        return content.replace("%%", "%")
-
     def _write_additional_file(self, additional_file: str, content: str, lang: str) -> None:
         """
         Write additional file with processed content.
@@ -2927,28 +3079,23 @@ class Job:
         os.chmod(os.path.join(self._tmp_path, script_name), 0o755)
         return script_name
 
-    def check_script(self, as_conf: AutosubmitConfig, show_logs="false") -> bool:
+    def check_script(self, as_conf: AutosubmitConfig, show_logs="false", rendered: RenderedScript | None = None) -> bool:
         """Checks if the script is well-formed.
 
         :param as_conf: Autosubmit configuration.
         :param show_logs: Whether to display logs or not.
+        :param rendered: The rendered script to check. If not given, the script is rendered.
         :return: Returns ``True`` if the script is well-formed, otherwise returns ``False``.
         """
-        parameters = self.update_parameters(as_conf, set_attributes=False)
-        template_content, additional_templates = self.update_content(as_conf, parameters)
-        variables = re.findall('%(?<!%%)[a-zA-Z0-9_.-]+%(?!%%)', template_content, flags=re.IGNORECASE)
-        variables = [variable[1:-1] for variable in variables]
-        variables = [variable for variable in variables if variable not in as_conf.default_parameters]
-        for template in additional_templates:
-            variables_tmp = re.findall('%(?<!%%)[a-zA-Z0-9_.-]+%(?!%%)', template, flags=re.IGNORECASE)
-            variables_tmp = [variable[1:-1] for variable in variables_tmp]
-            variables_tmp = [variable for variable in variables_tmp if variable not in as_conf.default_parameters]
-            variables.extend(variables_tmp)
-
-        out = set(parameters).issuperset(set(variables))
+        if rendered is None:
+            rendered = self.render_script(as_conf)
+        parameters = rendered.parameters
+        variables = rendered.variables
+
+        out = not rendered.undefined_variables
         # Check if the variables in the templates are defined in the configurations
         if not out:
-            self.undefined_variables = set(variables) - set(parameters)
+            self.undefined_variables = rendered.undefined_variables
             if str(show_logs).lower() != "false":
                 Log.printlog("The following set of variables to be substituted in template script is not part "
                              f"of parameters set, and will be replaced by a blank value: {self.undefined_variables}", 5013)
@@ -2992,40 +3139,11 @@ class Job:
             self.local_logs = tuple(_aux_local_logs)
         return compressed
 
-    # TODO: To be removed when we rid of the TOTAL_STATS file used across multiple functions
-    def _write_time(self, column: str) -> None:
-        """Write a timestamp to a specific position in the TOTAL_STATS file ensuring that each
-        record has four whitespace-separated fields: submit start end status.
-
-        """
-        if column == "submit":
-            value_to_write = str(self.submit_time_timestamp)
-        elif column == "start":
-            value_to_write = str(self.start_time_timestamp)
-        elif column == "end":
-            value_to_write = str(self.finish_time_timestamp)
-        else:
-            value_to_write = self.status_str
-
-        path = Path(self._tmp_path) / f"{self.name}_TOTAL_STATS"
-        if path.exists():
-            text = path.read_text(encoding='utf-8')
-            lines: list[str] = text.splitlines()
-        else:
-            lines = []
-
-        if not lines or column == "submit":
-            lines.append('submit start end status')
-
-        lines[-1] = re.sub(rf'{column}', value_to_write, lines[-1])
-
-        with path.open('w', encoding='utf-8') as f:
-            f.write('\n'.join(lines))
-
     def write_submit_time(self, attempt: int) -> None:
-        """Writes submit date and time to the ``TOTAL_STATS`` file."""
-        self._write_time("submit")
+        """Writes submit date and time to the history database.
 
+        :param attempt: The fail count to identify the correct database row.
+        """
         exp_history = ExperimentHistory(self.expid)
 
         status = self.status if self.status == Status.COMPLETED else Status.FAILED
@@ -3080,14 +3198,13 @@ class Job:
                     Log.debug(f"Log file {old_log_path} does not exist, skipping rename.")
 
     def write_start_time(self, attempt: int):
-        """Writes start date and time to TOTAL_STATS file and the history database.
+        """Writes start date and time to the history database.
 
         :param attempt: The fail count to identify the correct database row.
         :type attempt: int
         :return: True if successful, False otherwise
         :rtype: bool
         """
-        self._write_time("start")
         exp_history = ExperimentHistory(self.expid)
         # TODO: for compatibility reasons.. convert back to EPOCH for database storage
         status = self.status if self.status == Status.COMPLETED else Status.FAILED
@@ -3105,7 +3222,7 @@ class Job:
         return int(datetime.datetime.strptime(timestamp, "%Y%m%d%H%M%S").timestamp())
 
     def write_end_time(self, completed, attempt):
-        """Writes end timestamp to TOTAL_STATS file and jobs_data.db
+        """Writes end timestamp to jobs_data.db
         :param completed: True if the job has been completed, False otherwise
         :type completed: bool
         :param attempt: number of retrials
@@ -3117,8 +3234,6 @@ class Job:
             self.finish_time_timestamp = datetime.datetime.fromtimestamp(end_time).strftime("%Y%m%d%H%M%S")
         if not self.finish_time_timestamp:
             self.finish_time_timestamp = date2str(datetime.datetime.now(), 'S')
-        self._write_time("end")
-        self._write_time("status")
 
         out, err = self.local_logs
         # Launch first as simple non-threaded function
@@ -3510,7 +3625,9 @@ class WrapperJob(Job):
         # wrapper new_status is checked here
         self.platform.check_all_jobs([self], as_conf)
 
-        inner_jobs_stat_statuses = self.platform.confirm_done_jobs_via_stat(self.job_list)
+        # The inner STAT files are read once and shared by the status and start time checks.
+        inner_jobs_stat_files = self.platform.read_stat_files(self.job_list)
+        inner_jobs_stat_statuses = self.platform.confirm_done_jobs_via_stat(self.job_list, inner_jobs_stat_files)
         wrapper_is_done = self.new_status in [Status.COMPLETED, Status.FAILED]
 
         for inner_job in self.job_list:
@@ -3524,7 +3641,7 @@ class WrapperJob(Job):
             if not inner_job.start_time_timestamp and inner_job.new_status in [
                 Status.RUNNING, Status.COMPLETED, Status.FAILED
             ]
-        ])
+        ], inner_jobs_stat_files)
 
         self._check_wrapper_wallclock_and_handle()
 
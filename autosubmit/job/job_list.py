@@ -18,13 +18,18 @@
 import copy
 import datetime
 import math
+import multiprocessing
 import os
+import pickle
 import re
 import time
 import traceback
+from concurrent.futures import ProcessPoolExecutor
 from contextlib import suppress
+from functools import cache
 from pathlib import Path
 from time import localtime, mktime, strftime
+from types import SimpleNamespace
 from typing import Any
 
 from bscearth.utils.date import date2str, parse_date
@@ -43,6 +48,48 @@ from autosubmit.log.log import AutosubmitCritical, Log
 from autosubmit.monitor.diagram import JobData
 from autosubmit.platforms.platform import Platform
 
+# Serialized job list of a graph generation worker, see ``JobList._add_dependencies_in_parallel``.
+_graph_generation_job_list: bytes | None = None
+
+
+class _DependencyJob:
+    """Job attributes read while adding the dependencies of a section.
+
+    The graph generation workers receive these instead of the jobs, and record the parents that
+    ``JobList.handle_frequency_interval_dependencies`` adds to them.
+    """
+
+    __slots__ = ("chunk", "date", "frequency", "member", "name", "parents", "running", "section", "split", "splits")
+
+    def __init__(self, job: Job) -> None:
+        self.chunk = job.chunk
+        self.date = job.date
+        self.frequency = job.frequency
+        self.member = job.member
+        self.name = job.name
+        self.running = job.running
+        self.section = job.section
+        self.split = job.split
+        self.splits = job.splits
+        self.parents: list[_DependencyJob] = []
+
+    def add_parent(self, *parents: "_DependencyJob | list[_DependencyJob]") -> None:
+        """Record the parents added to the job, see ``Job.add_parent``."""
+        for parent in parents:
+            self.parents.extend(parent if isinstance(parent, list) else [parent])
+
+
+def _init_graph_generation_worker(job_list: bytes) -> None:
+    """Keep the serialized job list of a graph generation worker, each section loads its own copy."""
+    global _graph_generation_job_list
+    _graph_generation_job_list = job_list
+
+
+def _add_section_dependencies_in_worker(job_section: str) -> tuple:
+    """Entry point of the graph generation workers, see ``JobList._add_section_dependencies_isolated``."""
+    job_list, *args = pickle.loads(_graph_generation_job_list)
+    return job_list._add_section_dependencies_isolated(job_section, *args)
+
 
 class JobList:
     """Class to manage the list of jobs to be run by autosubmit"""
@@ -79,6 +126,25 @@ class JobList:
                                  Status.HELD, Status.RUNNING]
         self._IN_SCHEDULER = [Status.SUBMITTED, Status.QUEUING, Status.HELD, Status.RUNNING]
         self._FINAL_STATUSES = [Status.COMPLETED, Status.FAILED, Status.SKIPPED]
+        # Finished jobs whose outgoing edges are already COMPLETED in the database, with their status.
+        self._edges_completion_propagated: dict[str, int] = {}
+        # Ids of the wrappers stored in the database, loaded lazily by ``wrapper_ids``.
+        self._wrapper_ids: set[int] | None = None
+        # Jobs of the graph by status, moved by the ``Job.status`` setter, see ``_get_jobs_by_status``.
+        self._jobs_by_status: dict[int, dict[Job, None]] = {}
+        self._jobs_by_status_graph: DiGraph | None = None
+        self._jobs_by_status_size = 0
+        # Position of each indexed job in the graph, to return the jobs of a status in graph order.
+        self._job_position: dict[Job, int] = {}
+        self._next_job_position = 0
+        # Parents returned by ``DicJobs.get_jobs_filtered`` during ``_add_dependencies``, by filter signature.
+        self._jobs_filtered_cache: dict[tuple, list[Job]] = {}
+        # Sections whose edges are regenerated after a configuration change, None to regenerate all of them.
+        self._sections_to_regenerate: set[str] | None = None
+        # Jobs whose parents were regenerated, their stored edges are replaced by ``save_edges``.
+        self._regenerated_jobs: set[str] | None = None
+        # Last status of each job applied to the experiment history, see ``Autosubmit.process_historical_data_iteration``.
+        self.history_statuses: dict[str, str] = {}
         self.total_size = 0
         self.completed_size = 0
         self.failed_size = 0
@@ -208,7 +274,7 @@ class JobList:
                 if ((len(job.dependencies) > 0 and not job.has_parents() and not
                 job.has_children()) and str(job.delete_when_edgeless).casefold() ==
                         "true".casefold()):
-                    self.graph.remove_node(job.name)
+                    self._remove_job_node(job.name)
 
     def generate(
             self,
@@ -286,6 +352,8 @@ class JobList:
         :param preview: If True, the action will be executed in the wrapper simulation table.
         """
         self.dbmanager.clear_wrappers(preview=preview)
+        if not preview:
+            self._wrapper_ids = None
 
     def reset_updated_logs(self) -> None:
         """Reset updated_log and updated_stats to 0 for all jobs with fail_count == 0."""
@@ -403,7 +471,7 @@ class JobList:
         :type node: Dict[str, Any]
 
         """
-        self.graph.add_node(node["name"], job=Job(loaded_data=node))
+        self.add_job(Job(loaded_data=node))
         job = self.graph.nodes[node["name"]]["job"]
         if not node.get("platform_name", None):
             node["platform_name"] = self._as_conf.jobs_data.get(
@@ -433,15 +501,17 @@ class JobList:
         if differences:
             Log.warning("Differences found in sections, updating graph...")
             self.remove_outdated_information_from_database(differences)
+            self._sections_to_regenerate = self._sections_affected_by(differences)
         if differences:
             full_load = True
         Log.info("Loading jobs and edges from database...")
         nodes = self.load_jobs(full_load, load_failed_jobs)
-        edges = self.load_edges(nodes, full_load)
+        # The edges of the unchanged sections are kept, so they are not rewritten while loading them.
+        edges = self.load_edges(nodes, full_load, remove_unused_edges=not differences)
         self._recreate_graph(nodes, edges, full_load)
         if differences:
-            Log.info(
-                "Differences found in sections, the whole graph will be updated accordingly. This may take a while.")
+            Log.info(f"Differences found in sections, the edges of {len(self._sections_to_regenerate)} sections "
+                     f"will be updated accordingly: {', '.join(sorted(self._sections_to_regenerate))}")
         return False if not differences else True
 
     def remove_outdated_information_from_database(self, differences: dict[str, Any]) -> None:
@@ -452,11 +522,35 @@ class JobList:
         """
         sections = self.build_sections_data_to_store()
         Log.info("Removing outdated information from database based on section differences...")
-        Log.info("All edges will be recreated")  # Not sure how to do this in a more efficient way
-        self.dbmanager.clear_edges()
-        self.dbmanager.clear_unused_nodes(differences)
+        self._edges_completion_propagated.clear()
+        removed_jobs = self.dbmanager.clear_unused_nodes(differences)
+        self.dbmanager.delete_edges_of_jobs(removed_jobs)
         self.dbmanager.save_sections_data(sections)
 
+    def _sections_affected_by(self, differences: dict[str, Any], option: str = "DEPENDENCIES") -> set[str]:
+        """Return the sections whose edges must be regenerated after a configuration change.
+
+        The edges to a job are generated from the dependencies of its section, and from the dependency
+        map of the section, which includes its dependencies transitively (see ``_deep_map_dependencies``).
+        So they change for the changed sections and for every section that depends on one of them,
+        directly or through other sections.
+
+        :param differences: Dictionary containing the differences in sections.
+        :param option: Dependency option key.
+        :return: Names of the current sections to regenerate.
+        """
+        jobs_data = self._as_conf.jobs_data
+        affected = set(differences)
+        pending = {section for section in jobs_data if section not in affected}
+        new_dependents = True
+        while new_dependents:
+            new_dependents = {section for section in pending
+                              if any(self._strip_key(dependency) in affected
+                                     for dependency in jobs_data[section].get(option) or {})}
+            affected.update(new_dependents)
+            pending.difference_update(new_dependents)
+        return {section for section in affected if section in jobs_data}
+
     def compute_section_differences(self) -> dict[str, dict[str, Any]]:
         """Compute the differences between the current sections and the persistent sections in the database.
 
@@ -760,7 +854,7 @@ class JobList:
                 self.graph.remove_edge(parent.name, job_name)
         job.parents.clear()
         job.platform = None
-        self.graph.remove_node(job_name)
+        self._remove_job_node(job_name)
 
     def clear_generate(self):
         self.dependency_map = {}
@@ -780,9 +874,9 @@ class JobList:
             job_list_per_platform[job.platform_name].append(job)
         return job_list_per_platform
 
-    def _add_all_jobs_edge_info(self, dic_jobs, option="DEPENDENCIES"):
+    def _add_all_jobs_edge_info(self, dic_jobs, option="DEPENDENCIES", sections=None):
         jobs_data = dic_jobs.experiment_data.get("JOBS", {})
-        for job_section in jobs_data:
+        for job_section in (section for section in jobs_data if sections is None or section in sections):
             jobs_gen = (job for job in dic_jobs.get_jobs(job_section))
             # This was affecting the main self.as_conf.experiment_data
             dependencies_keys = copy.deepcopy(jobs_data.get(job_section, {}).get(option, None))
@@ -838,6 +932,11 @@ class JobList:
         - add dependencies that couldn't (or not solved yet) be safely added for later pruning,
         - add per-edge metadata to job objects.
 
+        After a configuration change, only the sections found by ``_sections_affected_by`` get their
+        edges regenerated, the edges to the jobs of the other sections are kept as loaded. With
+        ``CONFIG.GRAPH_GENERATION_PROCESSES`` above 1, the sections get their edges in a pool of
+        processes, see ``_add_dependencies_in_parallel``.
+
         :param date_list: List of dates used by the experiment.
         :param member_list: List of members used by the experiment.
         :param chunk_list: List of chunk identifiers used by the experiment.
@@ -846,6 +945,7 @@ class JobList:
         """
         jobs_data = dic_jobs.experiment_data.get("JOBS", {})
         problematic_jobs = {}
+        self._jobs_filtered_cache = {}
         # map dependencies
         self.dependency_map = {}
         self.dependency_map_with_distances = {}
@@ -866,40 +966,239 @@ class JobList:
         for job_section in jobs_data:
             for job in (job for job in dic_jobs.get_jobs(job_section, sort_string=True)):
                 if job.name not in self.graph.nodes:
-                    self.graph.add_node(job.name, job=job)
+                    self.add_job(job)
+
+        sections = self._sections_to_regenerate
+        self._sections_to_regenerate = None
+        processes = int(dic_jobs.experiment_data.get("CONFIG", {}).get("GRAPH_GENERATION_PROCESSES", 1))
+        if (sections is not None or processes > 1) and not self._sections_are_independent(jobs_data, dic_jobs,
+                                                                                          option):
+            sections = None
+            processes = 1
+        if sections is None:
+            sections = list(jobs_data)
+            self._regenerated_jobs = None
+        else:
+            sections = [section for section in jobs_data if section in sections]
+            Log.info(f"Regenerating the edges of {len(sections)} of {len(jobs_data)} sections")
+            self._regenerated_jobs = {name for name, data in self.graph.nodes(data=True)
+                                      if data['job'].section in sections}
+            for job_name in self._regenerated_jobs:
+                self.graph.remove_edges_from(list(self.graph.in_edges(job_name)))
+
+        if processes > 1 and len(sections) > 1:
+            self._add_dependencies_in_parallel(processes, sections, date_list, member_list, chunk_list, dic_jobs,
+                                               option, problematic_jobs)
+        else:
+            for job_section in jobs_data:
+                if job_section in sections:
+                    self._add_section_dependencies(job_section, jobs_data, date_list, member_list, chunk_list,
+                                                   dic_jobs, option, problematic_jobs)
+                else:
+                    self._narrow_dependency_map(job_section, jobs_data, dic_jobs, option)
+
+        self._jobs_filtered_cache = {}
+        self.find_and_delete_redundant_relations(problematic_jobs)
+        self._add_all_jobs_edge_info(dic_jobs, option, sections)
+
+    @staticmethod
+    def _section_dependencies(job_section: str, jobs_data: dict, dic_jobs: DicJobs,
+                              option: str) -> tuple[dict[str, Any] | None, dict[str, Dependency]]:
+        """Parse the dependencies of a section.
 
+        :param job_section: Section whose dependencies are parsed.
+        :param jobs_data: Jobs configuration.
+        :param dic_jobs: DicJobs instance containing job templates and experiment data.
+        :param option: Dependency option key.
+        :return: The dependency keys of the section and their parsed ``Dependency``.
+        """
+        # This was affecting the main self.as_conf.experiment_data
+        dependencies_keys = copy.deepcopy(jobs_data.get(job_section, {}).get(option, None))
+        # call function if dependencies_key is not None
+        dependencies = JobList._manage_dependencies(dependencies_keys, dic_jobs) \
+            if dependencies_keys else {}
+        return dependencies_keys, dependencies
+
+    def _add_section_dependencies(self, job_section: str, jobs_data: dict, date_list: list[Any],
+                                  member_list: list[Any], chunk_list: list[int], dic_jobs: DicJobs, option: str,
+                                  problematic_jobs: dict) -> None:
+        """Add the edges from the parents of the jobs of a section to the graph.
+
+        :param job_section: Section whose jobs get their parents.
+        :param jobs_data: Jobs configuration.
+        :param date_list: List of dates used by the experiment.
+        :param member_list: List of members used by the experiment.
+        :param chunk_list: List of chunk identifiers used by the experiment.
+        :param dic_jobs: DicJobs instance containing job templates and experiment data.
+        :param option: Dependency option key.
+        :param problematic_jobs: Updated with the parents of the jobs that may be redundant.
+        """
+        # Changes when all jobs of a section are added
+        self.depends_on_previous_chunk = {}
+        self.depends_on_previous_split = {}
+        self.depends_on_previous_special_section = {}
+        self.actual_job_depends_on_previous_chunk = False
+        self.actual_job_depends_on_previous_member = False
+        # No changes, no need to recalculate dependencies
+        Log.debug(f"Adding dependencies for {job_section} jobs")
+        # If it does not have dependencies, just append it to job_list and continue
+        dependencies_keys, dependencies = self._section_dependencies(job_section, jobs_data, dic_jobs, option)
+        self.job_names = set()
+        for job in (job for job in dic_jobs.get_jobs(job_section, sort_string=True)):
+            self.actual_job_depends_on_special_chunk = False
+            if dependencies:
+                # Adds the dependencies to the job, and if not possible,
+                # adds the job to the problematic_dependencies
+                problematic_dependencies = self._manage_job_dependencies(dic_jobs, job,
+                                                                         date_list, member_list, chunk_list,
+                                                                         dependencies_keys, dependencies,
+                                                                         self.graph)
+                if len(problematic_dependencies) > 1:
+                    if job_section not in problematic_jobs:
+                        problematic_jobs[job_section] = {}
+                    problematic_jobs[job_section].update({job.name: problematic_dependencies})
+
+    def _add_dependencies_in_parallel(self, processes: int, sections: list[str], date_list: list[Any],
+                                      member_list: list[Any], chunk_list: list[int], dic_jobs: DicJobs, option: str,
+                                      problematic_jobs: dict) -> None:
+        """Add the edges of the given sections in a pool of processes, then merge them into the graph.
+
+        The workers receive a serialized index of the jobs with the attributes read while adding
+        dependencies (see ``_DependencyJob``), never the jobs. Each section returns every change it
+        makes explicitly, and they are merged in section order, so the graph is the same as the one
+        generated with a single process.
+
+        :param processes: Number of worker processes.
+        :param sections: Sections whose jobs get their parents.
+        :param date_list: List of dates used by the experiment.
+        :param member_list: List of members used by the experiment.
+        :param chunk_list: List of chunk identifiers used by the experiment.
+        :param dic_jobs: DicJobs instance containing job templates and experiment data.
+        :param option: Dependency option key.
+        :param problematic_jobs: Updated with the parents of the jobs that may be redundant.
+        """
+        jobs_data = dic_jobs.experiment_data.get("JOBS", {})
+        dependency_jobs: dict[str, _DependencyJob] = {}
+
+        def to_dependency_jobs(jobs: Any) -> Any:
+            if isinstance(jobs, dict):
+                return {key: to_dependency_jobs(value) for key, value in jobs.items()}
+            if isinstance(jobs, list):
+                return [to_dependency_jobs(job) for job in jobs]
+            if jobs.name not in dependency_jobs:
+                dependency_jobs[jobs.name] = _DependencyJob(jobs)
+            return dependency_jobs[jobs.name]
+
+        index = copy.copy(dic_jobs)
+        index._dic = to_dependency_jobs(dic_jobs._dic)
+        index._job_list = {}
+        # Only the jobs configuration is read, the rest of the configuration is not serialized.
+        index.experiment_data = {"JOBS": jobs_data}
+        index.as_conf = SimpleNamespace(experiment_data=index.experiment_data, jobs_data=jobs_data)
+        worker_job_list = JobList.__new__(JobList)
+        worker_job_list.graph = DiGraph()
+        worker_job_list.graph.add_nodes_from((name, {'job': job}) for name, job in dependency_jobs.items())
+        worker_job_list.dependency_map = self.dependency_map
+        worker_job_list.dependency_map_with_distances = self.dependency_map_with_distances
+        worker_job_list._date_list = self._date_list
+        worker_job_list._member_list = self._member_list
+        worker_job_list._chunk_list = self._chunk_list
+        worker_job_list._jobs_filtered_cache = {}
+        serialized = pickle.dumps((worker_job_list, date_list, member_list, chunk_list, index, option),
+                                  protocol=pickle.HIGHEST_PROTOCOL)
+
+        processes = min(processes, len(sections))
+        Log.info(f"Adding the dependencies of {len(sections)} sections with {processes} processes")
+        # The workers are forked from a server process that runs no threads, not from this process.
+        context = multiprocessing.get_context("forkserver")
+        context.set_forkserver_preload([__name__])
+        with ProcessPoolExecutor(max_workers=processes, mp_context=context,
+                                 initializer=_init_graph_generation_worker, initargs=(serialized,)) as pool:
+            results = dict(zip(sections, pool.map(_add_section_dependencies_in_worker, sections)))
+
+        nodes = self.graph.nodes
         for job_section in jobs_data:
-            # Changes when all jobs of a section are added
-            self.depends_on_previous_chunk = {}
-            self.depends_on_previous_split = {}
-            self.depends_on_previous_special_section = {}
-            self.actual_job_depends_on_previous_chunk = False
-            self.actual_job_depends_on_previous_member = False
-            # No changes, no need to recalculate dependencies
-            Log.debug(f"Adding dependencies for {job_section} jobs")
-            # If it does not have dependencies, just append it to job_list and continue
-            # This was affecting the main self.as_conf.experiment_data
-            dependencies_keys = copy.deepcopy(jobs_data.get(job_section, {}).get(option, None))
-            # call function if dependencies_key is not None
-            dependencies = JobList._manage_dependencies(dependencies_keys, dic_jobs) \
-                if dependencies_keys else {}
-            self.job_names = set()
-            for job in (job for job in dic_jobs.get_jobs(job_section, sort_string=True)):
-                self.actual_job_depends_on_special_chunk = False
-                if dependencies:
-                    # Adds the dependencies to the job, and if not possible,
-                    # adds the job to the problematic_dependencies
-                    problematic_dependencies = self._manage_job_dependencies(dic_jobs, job,
-                                                                             date_list, member_list, chunk_list,
-                                                                             dependencies_keys, dependencies,
-                                                                             self.graph)
-                    if len(problematic_dependencies) > 1:
-                        if job_section not in problematic_jobs:
-                            problematic_jobs[job_section] = {}
-                        problematic_jobs[job_section].update({job.name: problematic_dependencies})
+            if job_section in results:
+                edges, parents, splits, section_problematic_jobs = results[job_section]
+                for parent_name, child_name, edge_data in edges:
+                    self.graph.add_edge(parent_name, child_name, **edge_data)
+                for child_name, parent_names in parents.items():
+                    nodes[child_name]['job'].add_parent(*(nodes[parent_name]['job'] for parent_name in parent_names))
+                for job_name, job_splits in splits.items():
+                    nodes[job_name]['job'].splits = job_splits
+                problematic_jobs.update(section_problematic_jobs)
+            self._narrow_dependency_map(job_section, jobs_data, dic_jobs, option)
+
+    def _add_section_dependencies_isolated(self, job_section: str, date_list: list[Any], member_list: list[Any],
+                                           chunk_list: list[int], dic_jobs: DicJobs, option: str) -> tuple:
+        """Add the edges of one section in a graph generation worker and return every change made.
+
+        :param job_section: Section whose jobs get their parents.
+        :param date_list: List of dates used by the experiment.
+        :param member_list: List of members used by the experiment.
+        :param chunk_list: List of chunk identifiers used by the experiment.
+        :param dic_jobs: Serialized DicJobs index, its jobs are ``_DependencyJob``.
+        :param option: Dependency option key.
+        :return: The edges to the jobs of the section, the parents added to its jobs, the new number of
+            splits of its jobs, and its problematic jobs.
+        """
+        jobs_data = dic_jobs.experiment_data.get("JOBS", {})
+        # The sections before this one narrow their dependency map as in the serial loop.
+        for previous_section in jobs_data:
+            if previous_section == job_section:
+                break
+            self._narrow_dependency_map(previous_section, jobs_data, dic_jobs, option)
+
+        section_jobs = dic_jobs.get_jobs(job_section, sort_string=True)
+        splits_before = {job.name: job.splits for job in section_jobs}
+        problematic_jobs: dict = {}
+        self._add_section_dependencies(job_section, jobs_data, date_list, member_list, chunk_list, dic_jobs,
+                                       option, problematic_jobs)
+
+        edges = [(parent_name, job.name, edge_data)
+                 for job in section_jobs
+                 for parent_name, edge_data in self.graph.pred[job.name].items()]
+        parents = {job.name: [parent.name for parent in job.parents] for job in section_jobs if job.parents}
+        splits = {job.name: job.splits for job in section_jobs if job.splits != splits_before[job.name]}
+        return edges, parents, splits, problematic_jobs
+
+    def _sections_are_independent(self, jobs_data: dict, dic_jobs: DicJobs, option: str) -> bool:
+        """Check that the sections can get their edges independently of each other.
+
+        Sections are independent unless a dependency with distance and filters changes the number of
+        splits of its jobs (see ``_normalize_auto_keyword``) to a value that differs between jobs, as
+        the sections processed later read it. Otherwise, only the changed sections are regenerated,
+        and the sections can be added by different processes.
+
+        :param jobs_data: Jobs configuration.
+        :param dic_jobs: DicJobs instance containing job templates and experiment data.
+        :param option: Dependency option key.
+        :return: True if the sections can be processed independently.
+        """
+        for job_section in jobs_data:
+            _, dependencies = self._section_dependencies(job_section, jobs_data, dic_jobs, option)
+            if not any(dependency.distance and dependency.relationships for dependency in dependencies.values()):
+                continue
+            if len({str(job.splits) for job in dic_jobs.get_jobs(job_section)}) > 1:
+                Log.info(f"The splits of {job_section} jobs depend on their chunk, "
+                         f"generating the edges of all sections in order with one process")
+                return False
+        return True
 
-        self.find_and_delete_redundant_relations(problematic_jobs)
-        self._add_all_jobs_edge_info(dic_jobs, option)
+    def _narrow_dependency_map(self, job_section: str, jobs_data: dict, dic_jobs: DicJobs, option: str) -> None:
+        """Narrow the dependency map of a section as adding the dependencies of its jobs does.
+
+        Used for the sections whose edges are not regenerated or are added by another process, so the
+        sections processed after them see the same dependency map.
+
+        :param job_section: Section whose dependency map is narrowed.
+        :param jobs_data: Jobs configuration.
+        :param dic_jobs: DicJobs instance containing job templates and experiment data.
+        :param option: Dependency option key.
+        """
+        dependencies_keys, dependencies = self._section_dependencies(job_section, jobs_data, dic_jobs, option)
+        if dependencies and dic_jobs.get_jobs(job_section):
+            self.dependency_map[job_section] = self.dependency_map[job_section].difference(set(dependencies_keys))
 
     def find_and_delete_redundant_relations(self, problematic_jobs: dict) -> None:
         """Jobs with intrinsic rules than can't be safely not added without messing other workflows.
@@ -928,6 +1227,58 @@ class JobList:
             with suppress(NetworkXError):
                 self.graph.remove_edge(relation_to_delete[0], relation_to_delete[1])
 
+    @staticmethod
+    @cache
+    def _split_dependency_key(dependency_key: str) -> tuple[str, int]:
+        """Split a dependency key into its section and distance, e.g. ``SIM-1`` into ``("SIM", 1)``.
+
+        Keys are parsed once and cached, as every job of a section parses the same keys.
+
+        :param dependency_key: Dependency key as defined in the configuration.
+        :return: The section and the distance, 0 if the key has no distance.
+        :raises ValueError: If the distance is not a number.
+        """
+        if "-" in dependency_key:
+            section, distance = dependency_key.split("-")[:2]
+            return section, int(distance)
+        if "+" in dependency_key:
+            section, distance = dependency_key.split("+")[:2]
+            return section, int(distance)
+        return dependency_key, 0
+
+    def _get_jobs_filtered(self, dic_jobs: DicJobs, section: str, job: Job, filters_to: dict, date: Any,
+                           member: Any, chunk: Any, filters_to_of_parent: dict) -> list[Job]:
+        """Memoized ``DicJobs.get_jobs_filtered``.
+
+        The result only depends on the filters and on the coordinates of the job, so all the jobs
+        of a section with the same shape share it.
+
+        :param dic_jobs: DicJobs instance containing the jobs.
+        :param section: Section of the possible parents.
+        :param job: Current job.
+        :param filters_to: Filters to apply.
+        :param date: Natural date of the dependency.
+        :param member: Natural member of the dependency.
+        :param chunk: Natural chunk of the dependency.
+        :param filters_to_of_parent: Filters of the parent section to the current job section.
+        :return: Possible parents of the job.
+        """
+        key = (
+            section,
+            tuple(filters_to.get(filter_type) for filter_type in ("DATES_TO", "MEMBERS_TO", "CHUNKS_TO", "SPLITS_TO")),
+            date, member, chunk,
+            filters_to_of_parent.get("SPLITS_TO", ""),
+            job.running, bool(job.member), bool(job.chunk), job.split, str(job.splits),
+            # A job is never its own parent, so the result of a section to itself depends on the job
+            job.name if job.section == section else None,
+        )
+        jobs_filtered = self._jobs_filtered_cache.get(key)
+        if jobs_filtered is None:
+            jobs_filtered = dic_jobs.get_jobs_filtered(section, job, filters_to, date, member, chunk,
+                                                       filters_to_of_parent)
+            self._jobs_filtered_cache[key] = jobs_filtered
+        return jobs_filtered
+
     @staticmethod
     def _manage_dependencies(dependencies_keys: dict, dic_jobs: DicJobs) -> dict[Any, Dependency]:
         parameters = dic_jobs.experiment_data["JOBS"]
@@ -1639,8 +1990,8 @@ class JobList:
         else:
             filters_to_apply_of_parent = {}
         # Possible_parents are those that match the filters_to_apply without taking into account redundancy. (filters: FROM_MEMBER, FROM_DATE, FROM_CHUNK, FROM_SPLIT, TO_MEMBER, TO_DATE, TO_CHUNK, TO_SPLIT)
-        possible_parents = [possible_parent for possible_parent in dic_jobs.get_jobs_filtered(
-            dependency.section, job, filters_to_apply, date, member, chunk,
+        possible_parents = [possible_parent for possible_parent in self._get_jobs_filtered(
+            dic_jobs, dependency.section, job, filters_to_apply, date, member, chunk,
             filters_to_apply_of_parent) if possible_parent.name != job.name]
         for parent in possible_parents:
             # Ideally we want to avoid adding edges when the current job already has a path to the parent
@@ -1787,26 +2138,14 @@ class JobList:
 
         # Strip special characters from dependency keys
         for key_aux_stripped in dependencies_keys:
-            if "-" in key_aux_stripped:
-                key_aux_stripped = key_aux_stripped.split("-")[0]
-            elif "+" in key_aux_stripped:
-                key_aux_stripped = key_aux_stripped.split("+")[0]
-            dependencies_keys_without_special_chars.append(key_aux_stripped)
+            dependencies_keys_without_special_chars.append(JobList._split_dependency_key(key_aux_stripped)[0])
 
         # Update dependency map for the current job section
         self.dependency_map[job.section] = self.dependency_map[job.section].difference(set(dependencies_keys))
 
         # Calculate distances for dependencies (e.g., SIM-1, CLEAN-2)
         for dependency_key in dependencies_keys:
-            if "-" in dependency_key:
-                aux_key = dependency_key.split("-")[0]
-                distance = int(dependency_key.split("-")[1])
-            elif "+" in dependency_key:
-                aux_key = dependency_key.split("+")[0]
-                distance = int(dependency_key.split("+")[1])
-            else:
-                aux_key = dependency_key
-                distance = 0
+            aux_key, distance = JobList._split_dependency_key(dependency_key)
 
             # Update distances based on the dependency type ( Once, chunk, member, etc. )
             if dic_jobs.as_conf.jobs_data.get(aux_key, {}).get("RUNNING", "once") == "chunk":
@@ -1844,15 +2183,7 @@ class JobList:
 
         # Calculate maximum distance for dependencies
         for key in self.dependency_map_with_distances[job.section]:
-            if "-" in key:
-                aux_key = key.split("-")[0]
-                distance = int(key.split("-")[1])
-            elif "+" in key:
-                aux_key = key.split("+")[0]
-                distance = int(key.split("+")[1])
-            else:
-                aux_key = key
-                distance = 0
+            aux_key, distance = JobList._split_dependency_key(key)
 
             max_distance = max(max_distance, distance)
 
@@ -2262,6 +2593,64 @@ class JobList:
         """
         return self.job_list
 
+    def _is_status_index_current(self) -> bool:
+        """Whether the status index still matches the graph.
+
+        Jobs added or removed through ``add_job`` and ``_remove_job_node`` keep the index current,
+        any other change to the graph is detected by its identity or its number of nodes.
+        """
+        return self._jobs_by_status_graph is self.graph and self._jobs_by_status_size == len(self.graph)
+
+    def _index_job_status(self, job: Job) -> None:
+        job._status_index = self._jobs_by_status
+        self._jobs_by_status.setdefault(job.status, {})[job] = None
+        self._job_position[job] = self._next_job_position
+        self._next_job_position += 1
+
+    def _unindex_job_status(self, job: Job) -> None:
+        job._status_index = None
+        self._jobs_by_status.get(job.status, {}).pop(job, None)
+        self._job_position.pop(job, None)
+
+    def _rebuild_status_index(self) -> None:
+        """Index all the jobs of the graph by status."""
+        for job in self._job_position:
+            job._status_index = None
+        self._jobs_by_status = {}
+        self._job_position = {}
+        self._next_job_position = 0
+        for job in self.job_list:
+            self._index_job_status(job)
+        self._jobs_by_status_graph = self.graph
+        self._jobs_by_status_size = len(self.graph)
+
+    def _get_jobs_by_status(self, status: int, platform=None) -> list[Job]:
+        """Returns the jobs with the given status, in graph order, without scanning the whole job list.
+
+        :param status: job status
+        :type status: int
+        :param platform: job platform, all platforms if not set
+        :type platform: HPCPlatform
+        :return: jobs with the status
+        :rtype: list
+        """
+        if not self._is_status_index_current():
+            self._rebuild_status_index()
+        jobs = self._jobs_by_status.get(status, {})
+        if platform:
+            jobs = [job for job in jobs if job.platform.name == platform.name]
+        return sorted(jobs, key=self._job_position.__getitem__)
+
+    def _remove_job_node(self, job_name: str) -> None:
+        """Removes the job node from the graph and from the status index."""
+        index_is_current = self._is_status_index_current()
+        job = self.graph.nodes[job_name].get('job')
+        self.graph.remove_node(job_name)
+        if index_is_current:
+            if job is not None:
+                self._unindex_job_status(job)
+            self._jobs_by_status_size = len(self.graph)
+
     def get_date_format(self):
         date_format = ''
         for date in self.get_date_list():
@@ -2297,8 +2686,7 @@ class JobList:
         :rtype: list
         """
 
-        completed_jobs = [job for job in self.job_list if (platform is None or
-                                                           job.platform.name == platform.name) and job.status == Status.COMPLETED]
+        completed_jobs = self._get_jobs_by_status(Status.COMPLETED, platform)
         if wrapper:
             return [job for job in completed_jobs if job.packed is False]
         return completed_jobs
@@ -2330,14 +2718,9 @@ class JobList:
         :return: submitted jobs
         :rtype: list
         """
-        submitted = []
+        submitted = self._get_jobs_by_status(Status.SUBMITTED, platform)
         if hold:
-            submitted = [job for job in self.job_list if (platform is None or
-                                                          job.platform.name == platform.name) and job.status == Status.SUBMITTED
-                         and job.hold == hold]
-        else:
-            submitted = [job for job in self.job_list if (platform is None or
-                                                          job.platform.name == platform.name) and job.status == Status.SUBMITTED]
+            submitted = [job for job in submitted if job.hold == hold]
         if wrapper:
             return [job for job in submitted if job.packed is False]
         return submitted
@@ -2351,8 +2734,7 @@ class JobList:
         :return: running jobs
         :rtype: list
         """
-        running = [job for job in self.job_list if (platform is None or
-                                                    job.platform.name == platform.name) and job.status == Status.RUNNING]
+        running = self._get_jobs_by_status(Status.RUNNING, platform)
         if wrapper:
             return [job for job in running if job.packed is False]
         return running
@@ -2366,8 +2748,7 @@ class JobList:
         :return: queuedjobs
         :rtype: list
         """
-        queuing = [job for job in self.job_list if (platform is None or
-                                                    job.platform.name == platform.name) and job.status == Status.QUEUING]
+        queuing = self._get_jobs_by_status(Status.QUEUING, platform)
         if wrapper:
             return [job for job in queuing if job.packed is False]
         return queuing
@@ -2381,8 +2762,7 @@ class JobList:
         :return: failed jobs
         :rtype: list
         """
-        failed = [job for job in self.job_list if (platform is None or
-                                                   job.platform.name == platform.name) and job.status == Status.FAILED]
+        failed = self._get_jobs_by_status(Status.FAILED, platform)
         if wrapper:
             return [job for job in failed if job.packed is False]
         return failed
@@ -2564,9 +2944,7 @@ class JobList:
         :return: ready jobs
         :rtype: list
         """
-        ready = [job for job in self.job_list if
-                 (platform is None or platform == "" or job.platform.name == platform.name) and
-                 job.status == Status.READY and job.hold is hold]
+        ready = [job for job in self._get_jobs_by_status(Status.READY, platform) if job.hold is hold]
 
         if wrapper:
             return [job for job in ready if job.packed is False]
@@ -2580,8 +2958,7 @@ class JobList:
         :return: prepared jobs
         :rtype: list
         """
-        prepared = [job for job in self.job_list if (platform is None or
-                                                     job.platform.name == platform.name) and job.status == Status.PREPARED]
+        prepared = self._get_jobs_by_status(Status.PREPARED, platform)
         return prepared
 
     def get_delayed(self, platform=None):
@@ -2592,8 +2969,7 @@ class JobList:
         :return: delayed jobs
         :rtype: list
         """
-        delayed = [job for job in self.job_list if (platform is None or
-                                                    job.platform.name == platform.name) and job.status == Status.DELAYED]
+        delayed = self._get_jobs_by_status(Status.DELAYED, platform)
         return delayed
 
     def get_waiting(self, platform=None, wrapper=False):
@@ -2605,8 +2981,7 @@ class JobList:
         :return: waiting jobs
         :rtype: list
         """
-        waiting_jobs = [job for job in self.job_list if (platform is None or
-                                                         job.platform.name == platform.name) and job.status == Status.WAITING]
+        waiting_jobs = self._get_jobs_by_status(Status.WAITING, platform)
         if wrapper:
             return [job for job in waiting_jobs if job.packed is False]
         return waiting_jobs
@@ -2619,8 +2994,7 @@ class JobList:
         :return: waiting jobs
         :rtype: list
         """
-        waiting_jobs = [job for job in self.job_list if (
-                job.platform.type == platform_type and job.status == Status.WAITING)]
+        waiting_jobs = [job for job in self._get_jobs_by_status(Status.WAITING) if job.platform.type == platform_type]
         return waiting_jobs
     def get_held_jobs(self, platform=None):
         """Returns a list of jobs in the platforms (Held).
@@ -2630,8 +3004,7 @@ class JobList:
         :return: jobs in platforms
         :rtype: list
         """
-        return [job for job in self.job_list if (platform is None or
-                                                 job.platform.name == platform.name) and job.status == Status.HELD]
+        return self._get_jobs_by_status(Status.HELD, platform)
 
     def get_unknown(self, platform=None, wrapper=False):
         """Returns a list of jobs on unknown state.
@@ -2642,8 +3015,7 @@ class JobList:
         :return: unknown state jobs
         :rtype: list
         """
-        submitted = [job for job in self.job_list if (platform is None or
-                                                      job.platform.name == platform.name) and job.status == Status.UNKNOWN]
+        submitted = self._get_jobs_by_status(Status.UNKNOWN, platform)
         if wrapper:
             return [job for job in submitted if job.packed is False]
         return submitted
@@ -2740,7 +3112,7 @@ class JobList:
         changed = True
         while changed:
             changed = False
-            for job in [job for job in self.job_list if job.status == Status.WAITING]:
+            for job in self._get_jobs_by_status(Status.WAITING):
                 if job not in jobs_to_unload_set and any(
                         parent in jobs_to_unload_set for parent in job.parents if parent.status != Status.COMPLETED):
                     jobs_to_unload_set.add(job)
@@ -2761,7 +3133,7 @@ class JobList:
                     self.graph.remove_edge(parent.name, job.name)
             job.parents.clear()
             job.platform = None
-            self.graph.remove_node(job.name)
+            self._remove_job_node(job.name)
 
     def get_active(self, platform=None, wrapper=False):
         """Returns a list of active jobs (In platforms queue + Ready).
@@ -2918,6 +3290,10 @@ class JobList:
                 self.dbmanager.save_jobs(self.job_list, reset_log_counters=reset_log_counters)
             else:
                 self.dbmanager.save_jobs(jobs_to_save, reset_log_counters=reset_log_counters)
+            try:
+                self.dbmanager.save_jobs_retrials(jobs_to_save or self.job_list)
+            except Exception as e:
+                Log.warning(f"Failed to save the retrials of the jobs in the database: {e}")
             Log.info("Jobs saved.")
 
     def load_jobs(self, full_load: bool = False, load_failed_jobs: bool = False) -> list[Job]:
@@ -2963,12 +3339,38 @@ class JobList:
         """
         if not self.disable_save:
             Log.info("Saving edges to the database...")
-            self.dbmanager.save_edges(self.graph_dict)
+            if self._regenerated_jobs is None:
+                self.dbmanager.save_edges(self.graph_dict)
+            else:
+                # Only the parents of these jobs were regenerated, the other stored edges are still valid.
+                regenerated_edges = [edge for edge in self.graph_dict if edge["e_to"] in self._regenerated_jobs]
+                self.dbmanager.replace_edges_to(self._regenerated_jobs, regenerated_edges)
+                self._regenerated_jobs = None
+            self._edges_completion_propagated.clear()
             Log.info("Edges saved.")
 
-    def load_edges(self, job_list, full_load=False) -> dict[str, Any]:
+    def load_edges(self, job_list, full_load=False, remove_unused_edges=True) -> dict[str, Any]:
         """Loads the job edges"""
-        return self.dbmanager.load_edges(job_list, full_load)
+        return self.dbmanager.load_edges(job_list, full_load, remove_unused_edges)
+
+    def load_retrials(self, jobs: list[Job]) -> None:
+        """Load the retrials of the given jobs from the database with a single query.
+
+        The retrials of the jobs without stored retrials, e.g. of experiments run with a previous
+        version, are imported from their TOTAL_STATS file.
+
+        :param jobs: Jobs whose retrials are loaded.
+        """
+        retrials = self.dbmanager.select_retrials(job.name for job in jobs)
+        imported = {}
+        for job in jobs:
+            if job.name not in retrials:
+                retrials[job.name] = job.read_total_stats_file()
+                if retrials[job.name]:
+                    imported[job.name] = retrials[job.name]
+            job._total_stats = retrials[job.name]
+        if imported and not self.disable_save:
+            self.dbmanager.save_retrials(imported)
 
     def update_status_log(self):
 
@@ -3308,13 +3710,28 @@ class JobList:
         self.update_two_step_jobs()
 
         if not self.disable_save:
-            for job in self.job_list:
-                if job.status in (Status.COMPLETED, Status.FAILED, Status.SKIPPED):
-                        self.dbmanager.update_outgoing_edges_completion(job.name, Status.VALUE_TO_KEY.get(job.status, ''))
+            self._propagate_edges_completion()
 
         Log.debug('Update finished')
         return save_jobs
 
+    def _propagate_edges_completion(self) -> None:
+        """Mark the satisfied outgoing edges of newly finished jobs as COMPLETED in the database.
+
+        All the jobs are sent in one batch. Jobs whose outgoing edges are all COMPLETED
+        are remembered, and skipped until their status changes.
+        """
+        jobs_status: dict[str, str] = {}
+        for job in self.job_list:
+            if job.status in self._FINAL_STATUSES:
+                if self._edges_completion_propagated.get(job.name) != job.status:
+                    jobs_status[job.name] = Status.VALUE_TO_KEY.get(job.status, '')
+            else:
+                self._edges_completion_propagated.pop(job.name, None)
+
+        for job_name in self.dbmanager.update_outgoing_edges_completion_many(jobs_status):
+            self._edges_completion_propagated[job_name] = Status.KEY_TO_VALUE[jobs_status[job_name]]
+
     def is_wrapper_still_running(self, job: Job) -> bool:
         """
         Check if the wrapper job for a given job is still running.
@@ -3616,6 +4033,8 @@ class JobList:
             wrappers.append(self._wrapper_job_dict(wrapper_job))
         if wrappers:
             self.dbmanager.save_wrappers(wrappers, preview=preview, run_id=self.run_id)
+            if not preview:
+                self.wrapper_ids.update(int(wrapper_info['id']) for wrapper_info, _ in wrappers)
 
     def load_wrappers(self, preview: bool = False) -> None:
         """Load wrapper jobs and their inner jobs from the database, and populate the job package map.
@@ -3761,7 +4180,7 @@ class JobList:
 
         for parent in job.parents:
             parent.children.remove(job)
-        self.graph.remove_node(job.name)
+        self._remove_job_node(job.name)
 
     def rerun(self, job_list_unparsed, as_conf, monitor=False):
         """Updates job list to rerun the jobs specified by a job list.
@@ -3933,10 +4352,10 @@ class JobList:
                      (bcolors.BOLD + bcolors.CODE_TO_COLOR[job.status]
                       if nocolor is False else '') + job.name + \
                      (bcolors.ENDC + bcolors.ENDC if nocolor is False else '')
-            if len(job._children) > 0:
+            if len(job.children) > 0:
                 level += 1
-                children = job._children
-                total_children = len(job._children)
+                children = job.children
+                total_children = len(job.children)
                 # Writes children number and status if color are not being showed
                 result += (" ~ [" + str(total_children) +
                            (" children] " if total_children > 1 else " child] ") +
@@ -4203,7 +4622,15 @@ class JobList:
         self._as_conf = as_conf
 
     def add_job(self, job: Job):
+        index_is_current = self._is_status_index_current()
+        replaced_job = self.graph.nodes[job.name].get('job') if job.name in self.graph else None
         self.graph.add_node(job.name, job=job)
+        if index_is_current:
+            if replaced_job is not None and replaced_job is not job:
+                self._unindex_job_status(replaced_job)
+            if replaced_job is not job:
+                self._index_job_status(job)
+            self._jobs_by_status_size = len(self.graph)
 
     def recover_last_data(self, finished_jobs: list["Job"] | None = None) -> None:
         """Recover job IDs and log names for completed, failed, and skipped jobs from experiment history.
@@ -4279,6 +4706,7 @@ class JobList:
                 wrappers.append(self._wrapper_job_dict(wrapper_job)[0])
             if wrappers:
                 self.dbmanager.update_wrapper_status(wrappers)
+                self.wrapper_ids.update(int(wrapper['id']) for wrapper in wrappers)
 
     def get_wrappers_id_from_db(self) -> list[int]:
         """Get a list of all wrapper job IDs from the database.
@@ -4288,5 +4716,19 @@ class JobList:
         """
         return [id for _, id in self.dbmanager.get_wrappers_id_from_db()]
 
+    @property
+    def wrapper_ids(self) -> set[int]:
+        """Set of the wrapper job IDs stored in the database.
+
+        It is read from the database on first access, and then kept in sync
+        by ``save_wrappers`` and ``update_db_wrappers``.
+
+        :return: Set of wrapper job IDs.
+        :rtype: Set[int]
+        """
+        if self._wrapper_ids is None:
+            self._wrapper_ids = set(self.get_wrappers_id_from_db())
+        return self._wrapper_ids
+
     def get_failed_from_db(self):
         return self.dbmanager.get_failed_job_data()
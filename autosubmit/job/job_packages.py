@@ -20,8 +20,8 @@ import locale
 import os
 import random
 import re
-import tarfile
 import time
+from concurrent.futures import Executor, Future
 from contextlib import suppress
 from datetime import timedelta
 from pathlib import Path
@@ -29,7 +29,7 @@ from typing import TYPE_CHECKING
 
 from bscearth.utils.date import date2str, sum_str_hours
 
-from autosubmit.job.job import Job
+from autosubmit.job.job import Job, RenderedScript
 from autosubmit.job.job_common import Status
 from autosubmit.log.log import AutosubmitCritical, Log
 from autosubmit.platforms.execution_mode import ExecutionMode
@@ -86,6 +86,8 @@ class JobPackageBase:
         self.name = None
         self.is_wrapped = False
         self._job_scripts = None
+        self._rendered_scripts: dict[str, RenderedScript] = {}
+        self._job_script_futures: dict[str, Future] = {}
         self.nodes = ""
         self._common_script = None
         self._jobs = jobs
@@ -174,29 +176,65 @@ class JobPackageBase:
                     Log.warning(
                         f"[section: {job.section}]: Additional file: {additional_file} does not exist, skipping check")
 
-    def build_scripts(self, configuration: 'AutosubmitConfig') -> None:
-        """Submit jobs one by one without using threads.
+    def build_scripts(self, configuration: 'AutosubmitConfig', executor: Executor | None = None) -> None:
+        """Check and create the scripts of the jobs.
 
         :param configuration: Autosubmit basic configuration.
         :type configuration: AutosubmitConfig
+        :param executor: Executor to write the scripts of the jobs, or None to write them one by one.
         :return: None.
         """
         Log.debug("Checking Scripts")
+        self._rendered_scripts = {}
         for job in self.jobs:
-            if (job.file or job.script) and not job.check_script(configuration, show_logs=job.check_warnings):
-                Log.warning(f"Job {job.name} script or file has empty variables. "
-                            f"These variables were set to an empty value")
+            if job.file or job.script:
+                # The script is rendered once, for both the check and the creation of the script
+                rendered = self._rendered_scripts[job.name] = job.render_script(configuration)
+                if not job.check_script(configuration, show_logs=job.check_warnings, rendered=rendered):
+                    Log.warning(f"Job {job.name} script or file has empty variables. "
+                                f"These variables were set to an empty value")
 
             self._custom_directives |= set(getattr(job, "custom_directives", []))
 
         Log.debug("Building scripts")
-        self._create_scripts(configuration)
+        self._create_scripts(configuration, executor)
 
-    def generate_scripts(self, configuration: 'AutosubmitConfig', only_generate: bool = False) -> None:
+    def generate_scripts(self, configuration: 'AutosubmitConfig', only_generate: bool = False,
+                         executor: Executor | None = None) -> None:
         if not only_generate:
             self._clean_previous_run()
         self.check_job_files_exists(configuration, only_generate)
-        self.build_scripts(configuration)
+        self.build_scripts(configuration, executor)
+
+    def _create_job_scripts(self, configuration: 'AutosubmitConfig', executor: Executor | None = None) -> None:
+        """Create the script of each job of the package.
+
+        The scripts are rendered one by one, as the parameters of the jobs are computed from the
+        shared configuration. With an ``executor``, writing and checking the rendered scripts is
+        left to it, and ``wait_for_scripts`` must be called before using the scripts.
+
+        :param configuration: Autosubmit basic configuration.
+        :param executor: Executor to write the scripts, or None to write them one by one.
+        """
+        for job in self.jobs:
+            rendered = self._rendered_scripts.pop(job.name, None)
+            if executor is None:
+                self._job_scripts[job.name] = job.create_script(configuration, rendered=rendered)
+            else:
+                if rendered is None:
+                    rendered = job.render_script(configuration)
+                self._job_script_futures[job.name] = executor.submit(
+                    job.create_script, configuration, rendered=rendered)
+
+    def wait_for_scripts(self) -> None:
+        """Wait for the scripts of the jobs being written by an executor.
+
+        The scripts are collected in the order of the jobs, so the error raised, if any,
+        is the one of the first job whose script could not be created.
+        """
+        futures, self._job_script_futures = self._job_script_futures, {}
+        for job_name, future in futures.items():
+            self._job_scripts[job_name] = future.result()
 
     def _clean_previous_run(self):
         """ Clean previous run logs on local and platform. """
@@ -208,12 +246,19 @@ class JobPackageBase:
         self.platform.delete_previous_run_files_by_job_names([job.name for job in self.jobs if job.fail_count == 0])
         self.platform.delete_previous_stat_files_by_job_names([job.name for job in self.jobs if job.fail_count == 0])
 
-    def _create_scripts(self, configuration: 'AutosubmitConfig'):
+    def _create_scripts(self, configuration: 'AutosubmitConfig', executor: Executor | None = None):
+        raise NotImplementedError  # pragma: no cover
+
+    def get_files_to_send(self) -> list[str]:
+        """Local files of the package to be sent to the platform.
+
+        :return: The names of the files, relative to the temporary directory.
+        """
         raise NotImplementedError  # pragma: no cover
 
     def send_files(self):
         """ Send local files to the platform. """
-        raise NotImplementedError  # pragma: no cover
+        self.platform.send_files(self.get_files_to_send())
 
     def process_jobs_to_submit(self, job_id: int) -> None:
         for job in self.jobs:
@@ -238,17 +283,15 @@ class JobPackageSimple(JobPackageBase):
         self.export = jobs[0].export
         self.name = jobs[0].name
 
-    def _create_scripts(self, configuration: 'AutosubmitConfig'):
-        for job in self.jobs:
-            self._job_scripts[job.name] = job.create_script(configuration)
+    def _create_scripts(self, configuration: 'AutosubmitConfig', executor: Executor | None = None):
+        self._create_job_scripts(configuration, executor)
 
-    def send_files(self):
-        # TODO: Add tests when the slurm container is available.
+    def get_files_to_send(self) -> list[str]:
+        files = []
         for job in self.jobs:
-            self.platform.send_file(self._job_scripts[job.name])
-            for f in job.additional_files:
-                real_name = job.construct_real_additional_file_name(f)
-                self.platform.send_file(real_name)
+            files.append(self._job_scripts[job.name])
+            files.extend(job.construct_real_additional_file_name(f) for f in job.additional_files)
+        return files
 
 
 class JobPackageSimpleWrapped(JobPackageSimple):
@@ -260,15 +303,13 @@ class JobPackageSimpleWrapped(JobPackageSimple):
         super().__init__(jobs)
         self._job_wrapped_scripts = {}
 
-    def _create_scripts(self, configuration: 'AutosubmitConfig'):
-        super()._create_scripts(configuration)
+    def _create_scripts(self, configuration: 'AutosubmitConfig', executor: Executor | None = None):
+        super()._create_scripts(configuration, executor)
         for job in self.jobs:
             self._job_wrapped_scripts[job.name] = job.create_wrapped_script(configuration)
 
-    def send_files(self):
-        super().send_files()
-        for job in self.jobs:
-            self.platform.send_file(self._job_wrapped_scripts[job.name])
+    def get_files_to_send(self) -> list[str]:
+        return super().get_files_to_send() + [self._job_wrapped_scripts[job.name] for job in self.jobs]
 
 
 class JobPackageThread(JobPackageBase):
@@ -457,9 +498,10 @@ class JobPackageThread(JobPackageBase):
     def set_job_dependency(self, dependency):
         self._job_dependency = dependency
 
-    def _create_scripts(self, configuration: 'AutosubmitConfig'):
-        for i in range(len(self.jobs)):
-            self._job_scripts[self.jobs[i].name] = self.jobs[i].create_script(configuration)
+    def _create_scripts(self, configuration: 'AutosubmitConfig', executor: Executor | None = None):
+        self._create_job_scripts(configuration, executor)
+        # The common script lists the scripts of the jobs
+        self.wait_for_scripts()
         self._common_script = self._create_common_script()
 
     def _create_common_script(self, filename: str = ""):
@@ -475,34 +517,12 @@ class JobPackageThread(JobPackageBase):
         os.chmod(os.path.join(self._tmp_path, script_file), 0o755)
         return script_file
 
-    def send_files(self):
-        Log.debug("Check remote dir")
-        self.platform.check_remote_log_dir()
-        output_filepath = 'wrapper_scripts.tar'
-        if callable(self.platform.remove_multiple_files):
-            filenames = ""
-            for job in self.jobs:
-                filenames += " " + self.platform.remote_log_dir + "/" + job.name + ".cmd"
-            self.platform.remove_multiple_files(filenames)
-        tar_path = os.path.join(self._tmp_path, output_filepath)
-        Log.debug("Compressing multiple_files")
-        with tarfile.open(tar_path, "w") as tar:
-            for job in self.jobs:
-                jfile = os.path.join(self._tmp_path, self._job_scripts[job.name])
-                with open(jfile, 'rb') as f:
-                    info = tar.gettarinfo(jfile, self._job_scripts[job.name])
-                    tar.addfile(info, f)
-        tar.close()
-        os.chmod(tar_path, 0o755)
-        self.platform.send_file(tar_path, check=False)
-        Log.debug("Uncompress - send_command")
-        self.platform.send_command(f"cd {self.platform.get_files_path()}; tar -xvf {output_filepath}")
-        Log.debug("Send_file: common_script")
-        self.platform.send_file(self._common_script)
+    def get_files_to_send(self) -> list[str]:
+        files = [self._job_scripts[job.name] for job in self.jobs]
+        files.append(self._common_script)
         for job in self.jobs:
-            for f in job.additional_files:
-                real_name = job.construct_real_additional_file_name(f)
-                self.platform.send_file(real_name)
+            files.extend(job.construct_real_additional_file_name(f) for f in job.additional_files)
+        return files
 
     def _common_script_content(self) -> str:
         pass  # pragma: no cover
@@ -547,9 +567,10 @@ class JobPackageThreadWrapped(JobPackageThread):
     def _project(self):
         return self._platform.project
 
-    def _create_scripts(self, configuration: 'AutosubmitConfig'):
-        for i in range(len(self.jobs)):
-            self._job_scripts[self.jobs[i].name] = self.jobs[i].create_script(configuration)
+    def _create_scripts(self, configuration: 'AutosubmitConfig', executor: Executor | None = None):
+        self._create_job_scripts(configuration, executor)
+        # The common script lists the scripts of the jobs
+        self.wait_for_scripts()
         self._common_script = self._create_common_script()
 
     def _create_common_script(self, filename: str = ""):
@@ -560,10 +581,8 @@ class JobPackageThreadWrapped(JobPackageThread):
         os.chmod(os.path.join(self._tmp_path, script_file), 0o755)
         return script_file
 
-    def send_files(self):
-        for job in self.jobs:
-            self.platform.send_file(self._job_scripts[job.name])
-        self.platform.send_file(self._common_script)
+    def get_files_to_send(self) -> list[str]:
+        return [self._job_scripts[job.name] for job in self.jobs] + [self._common_script]
 
 
 class JobPackageVertical(JobPackageThread):
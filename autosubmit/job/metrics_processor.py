@@ -146,27 +146,39 @@ class UserMetricRepository:
         """
         Store the metric value in the database. Will overwrite the value if it already exists.
         """
+        self.store_metrics(run_id, job_name, {metric_name: metric_value})
+
+    def store_metrics(self, run_id: int, job_name: str, metrics: dict[str, Any]):
+        """
+        Store the values of several metrics of a job in a single transaction.
+        Will overwrite the values that already exist.
+        """
+        if not metrics:
+            return
+        modified = datetime.now(tz=timezone.utc).isoformat(timespec="seconds")
         with self.engine.connect() as conn, conn.begin():
-            # Delete the existing metric
+            # Delete the existing metrics
             conn.execute(
                 delete(self.table).where(
                     self.table.c.run_id == run_id,
                     self.table.c.job_name == job_name,
-                    self.table.c.metric_name == metric_name,
+                    self.table.c.metric_name.in_(list(metrics)),
                 )
             )
 
-            # Insert the new metric
+            # Insert the new metrics
             conn.execute(
-                insert(self.table).values(
-                    run_id=run_id,
-                    job_name=job_name,
-                    metric_name=metric_name,
-                    metric_value=str(metric_value),
-                    modified=datetime.now(tz=timezone.utc).isoformat(
-                        timespec="seconds"
-                    ),
-                )
+                insert(self.table),
+                [
+                    {
+                        "run_id": run_id,
+                        "job_name": job_name,
+                        "metric_name": metric_name,
+                        "metric_value": str(metric_value),
+                        "modified": modified,
+                    }
+                    for metric_name, metric_value in metrics.items()
+                ],
             )
 
 
@@ -179,6 +191,7 @@ class UserMetricProcessor:
         self.run_id = run_id
         self.user_metric_repository = UserMetricRepository(job.expid)
         self._processed_metrics = {}
+        self._metric_folder: str | None = None
 
     def read_metrics_specs(self) -> list[MetricSpec]:
         try:
@@ -212,50 +225,59 @@ class UserMetricProcessor:
         """
         Store the metric value in the database
         """
-        self.user_metric_repository.store_metric(
-            self.run_id, self.job.name, metric_name, metric_value
-        )
-        self._processed_metrics[metric_name] = metric_value
+        self.store_metrics({metric_name: metric_value})
+
+    def store_metrics(self, metrics: dict[str, Any]):
+        """
+        Store the values of several metrics in the database at once
+        """
+        self.user_metric_repository.store_metrics(self.run_id, self.job.name, metrics)
+        self._processed_metrics.update(metrics)
 
     def get_metric_path(self, metric_spec: MetricSpec) -> str:
         """
         Get the path to the metric file
         """
-        parameters = self.job.update_parameters(self.as_conf)
-        metric_folder = parameters.get("CURRENT_METRIC_FOLDER")
-        return str(Path(metric_folder).joinpath(metric_spec.filename))
+        if self._metric_folder is None:
+            # The parameters of the job are only computed once for all the metrics
+            parameters = self.job.update_parameters(self.as_conf)
+            self._metric_folder = parameters.get("CURRENT_METRIC_FOLDER")
+        return str(Path(self._metric_folder).joinpath(metric_spec.filename))
 
     def process_metrics(self):
         """
         Process the metrics of the job
+
+        All the metric files are read from the platform at once, and all the values are
+        stored in a single transaction.
         """
         # Read the metrics specs from the config
         metrics_specs = self.read_metrics_specs()
 
-        # Process the metrics specs
-        for metric_spec in metrics_specs:
-            # Path to the metric file
-            spec_path = self.get_metric_path(metric_spec)
+        # Path to the metric file of each spec, and the most that must be read from each file
+        specs_paths = [(metric_spec, self.get_metric_path(metric_spec)) for metric_spec in metrics_specs]
+        files: dict[str, int] = {}
+        for metric_spec, spec_path in specs_paths:
+            max_size = metric_spec.max_read_size_mb * 1024 * 1024
+            files[spec_path] = max(files.get(spec_path, 0), max_size)
 
-            # Read the file from remote platform, it will replace the decoding errors.
-            try:
-                content = self.job.platform.read_file(
-                    spec_path, max_size=(metric_spec.max_read_size_mb * 1024 * 1024)
-                )
-                Log.debug(f"Read file {spec_path}")
-                content = content.decode(
-                    encoding=locale.getlocale()[1], errors="replace"
-                ).strip()
-            except Exception as exc:
-                Log.printlog(
-                    f"Error reading metric file at {spec_path}: {str(exc)}", code=6018
-                )
+        contents = self.job.platform.read_files(files) if files else {}
+
+        metrics: dict[str, Any] = {}
+        for metric_spec, spec_path in specs_paths:
+            content = contents.get(spec_path)
+            if content is None:
+                Log.printlog(f"Error reading metric file at {spec_path}", code=6018)
                 continue
+            # Replace the decoding errors
+            content = content[:metric_spec.max_read_size_mb * 1024 * 1024].decode(
+                encoding=locale.getlocale()[1], errors="replace"
+            ).strip()
 
             # Process the content based on the selector type
             if metric_spec.selector.type == MetricSpecSelectorType.TEXT:
                 # Store the content as a metric
-                self.store_metric(metric_spec.name, content)
+                metrics[metric_spec.name] = content
             elif metric_spec.selector.type == MetricSpecSelectorType.JSON:
                 # Parse the JSON content and store the metrics
                 try:
@@ -266,7 +288,7 @@ class UserMetricProcessor:
                     if key:
                         for k in key:
                             value = value[k]
-                    self.store_metric(metric_spec.name, value)
+                    metrics[metric_spec.name] = value
                 except Exception as e:
                     Log.printlog(
                         f"Error processing JSON content in file {spec_path}: {str(e)}", code=6018
@@ -277,4 +299,5 @@ class UserMetricProcessor:
                     f"for metric {metric_spec.name}", code=6019,
                 )
 
+        self.store_metrics(metrics)
         return self._processed_metrics
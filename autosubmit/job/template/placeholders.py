@@ -0,0 +1,155 @@
+# Copyright 2015-2025 Earth Sciences Department, BSC-CNS
+#
+# This file is part of Autosubmit.
+#
+# Autosubmit is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Autosubmit is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Autosubmit.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Substitution of the ``%KEY%`` placeholders of the job templates.
+
+A template is parsed once into its literal text and its placeholders, and
+then rendered for each job in a single pass. ``%%`` in the literal text
+renders as ``%``, so ``%%KEY%%`` renders as the literal text ``%KEY%``,
+while the values of the placeholders are inserted as they are.
+"""
+
+import re
+from collections.abc import Callable, Iterable, Mapping
+from functools import lru_cache
+from pathlib import Path
+
+PLACEHOLDER_PATTERN = re.compile(r'%(?<!%%)[a-zA-Z0-9_.-]+%(?!%%)')
+"""A placeholder, not preceded nor followed by an escaped ``%%``."""
+
+TEMPLATE_CACHE_SIZE = 64
+"""Number of compiled templates kept in memory."""
+
+_template_files: dict[str, tuple[int, int, str]] = {}
+"""Content of the template files read, with their modification time and size."""
+
+_compiled_template_files: dict[tuple[str, Callable[[str], str] | None], tuple[int, int, 'CompiledTemplate']] = {}
+"""Compiled templates of the template files, with their modification time and size."""
+
+
+class CompiledTemplate:
+    """A template split into its literal text and its placeholders.
+
+    The escaped ``%%`` of the literal text are replaced by ``%`` once, when the template is parsed.
+
+    :param content: Template content with placeholders.
+    """
+
+    __slots__ = ('_literals', '_placeholders')
+
+    def __init__(self, content: str):
+        literals = []
+        placeholders = []
+        position = 0
+        for match in PLACEHOLDER_PATTERN.finditer(content):
+            literals.append(content[position:match.start()].replace('%%', '%'))
+            placeholders.append(match.group())
+            position = match.end()
+        literals.append(content[position:].replace('%%', '%'))
+        self._literals = tuple(literals)
+        self._placeholders = tuple(placeholders)
+
+    @property
+    def placeholders(self) -> tuple[str, ...]:
+        """The placeholders of the template, with their ``%``, in order of appearance."""
+        return self._placeholders
+
+    @property
+    def variables(self) -> list[str]:
+        """The names of the variables of the template, in order of appearance."""
+        return [placeholder[1:-1] for placeholder in self._placeholders]
+
+    def render(self, parameters: Mapping, keep: Iterable[str] = ()) -> str:
+        """Substitute every placeholder by the value of its variable.
+
+        Variables are case-insensitive, their value is the one of the parameter
+        with the name in upper case, inserted as it is. Placeholders without a
+        value are removed.
+
+        :param parameters: Parameters dictionary.
+        :param keep: Placeholders, with their ``%``, to be left as they are.
+        :return: The rendered template.
+        """
+        keep = set(keep)
+        values: dict[str, str] = {}
+        parts = [self._literals[0]]
+        for placeholder, literal in zip(self._placeholders, self._literals[1:]):
+            value = values.get(placeholder)
+            if value is None:
+                if placeholder in keep:
+                    value = placeholder
+                else:
+                    value = str(parameters.get(placeholder[1:-1].upper(), ''))
+                values[placeholder] = value
+            parts.append(value)
+            parts.append(literal)
+        return ''.join(parts)
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def compile_template(content: str) -> CompiledTemplate:
+    """Get the compiled template of a content.
+
+    The templates are cached, so the short contents shared by several jobs,
+    like the ``SCRIPT`` of a section, are only parsed once.
+
+    :param content: Template content with placeholders.
+    :return: The compiled template.
+    """
+    return CompiledTemplate(content)
+
+
+def read_template_file(path: str | Path) -> str:
+    """Read a template file, only reading it again from disk when it is modified.
+
+    The jobs of the same section share the same template file.
+
+    :param path: Path to the template file.
+    :return: The content of the file.
+    :raises OSError: If the file cannot be read.
+    """
+    path = str(path)
+    stat = Path(path).stat()
+    cached = _template_files.get(path)
+    if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+    with open(path, 'r') as template_file:
+        content = template_file.read()
+    _template_files[path] = (stat.st_mtime_ns, stat.st_size, content)
+    return content
+
+
+def compile_template_file(path: str | Path, wrap: Callable[[str], str] | None = None) -> CompiledTemplate:
+    """Get the compiled template of a file, only parsing it again when it is modified.
+
+    The jobs of the same section share the same template file, so it is only
+    parsed once for all of them.
+
+    :param path: Path to the template file.
+    :param wrap: Function applied to the content of the file before parsing it.
+    :return: The compiled template.
+    :raises OSError: If the file cannot be read.
+    """
+    path = str(path)
+    stat = Path(path).stat()
+    cached = _compiled_template_files.get((path, wrap))
+    if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+    content = read_template_file(path)
+    template = CompiledTemplate(wrap(content) if wrap else content)
+    _compiled_template_files[(path, wrap)] = (stat.st_mtime_ns, stat.st_size, template)
+    return template
@@ -37,6 +37,7 @@ from autosubmit.platforms.paramiko_platform import (
     ParamikoPlatform,
     ParamikoPlatformException,
 )
+from autosubmit.platforms.platform import Platform
 from autosubmit.platforms.platform_type import PlatformType
 from autosubmit.platforms.wrappers.wrapper_factory import EcWrapperFactory
 
@@ -223,29 +224,28 @@ class EcPlatform(ParamikoPlatform):
                 f"Couldn't create {self.remote_log_dir} on {self.host}", 6004, str(e)
             )
 
-    def confirm_done_jobs_via_stat(self, job_list: list) -> dict[str, "Status"]:
-        """Confirm job statuses via STAT files using ecaccess commands.
+    def read_stat_files(self, job_list: list) -> dict[str, list[str]]:
+        """Read the remote STAT files of the jobs using ecaccess commands.
 
-        Overrides the base ``awk``-based implementation because EcPlatform runs
-        commands locally via subprocess and cannot read remote files directly.
+        Overrides the base single remote command because EcPlatform runs commands
+        locally via subprocess and cannot read remote files directly. The remote log
+        directory is listed once, and only the STAT files found are downloaded.
 
-        STAT format: submit_time (L0), start_time (L1), end_time (L2), status (L3).
-        A single numeric line means the job is submitted but not yet started → QUEUING.
-
-        :param job_list: Jobs to confirm.
-        :return: Mapping of job names to resolved statuses.
+        :param job_list: Jobs whose STAT files are read.
+        :return: Mapping of job names to the lines of their STAT file. Jobs without
+            STAT file, or whose STAT file could not be downloaded, are not included.
         """
         if not job_list:
             return {}
 
-        result: dict[str, Status] = {}
+        stat_files: dict[str, list[str]] = {}
 
         # List files in the remote log directory
         try:
             self.send_command(f"ecaccess-file-dir {self._ec_retry_flag} {self.host}:{self.remote_log_dir}")
             dir_output = self.get_ssh_output()
         except Exception:
-            return result
+            return stat_files
 
         # Build a set of available STAT file names
         # ecaccess-file-dir output format: filename|size  NNNN
@@ -276,55 +276,61 @@ class EcPlatform(ParamikoPlatform):
                 continue
             content = local_path.read_text().strip()
             if content:
-                lines = content.splitlines()
-                if len(lines) == 1 and lines[-1].isdigit():
-                    result[job.name] = Status.QUEUING
-                else:
-                    result[job.name] = self._resolve_status(lines[-1])
+                stat_files[job.name] = content.splitlines()
             local_path.unlink(missing_ok=True)
 
+        return stat_files
+
+    def confirm_done_jobs_via_stat(
+            self, job_list: list, stat_files: dict[str, list[str]] | None = None) -> dict[str, "Status"]:
+        """Confirm job statuses via STAT files downloaded with ecaccess commands.
+
+        STAT format: submit_time (L0), start_time (L1), end_time (L2), status (L3).
+        A single numeric line means the job is submitted but not yet started → QUEUING.
+
+        :param job_list: Jobs to confirm.
+        :param stat_files: STAT file lines by job name, as returned by ``read_stat_files``.
+            Read from the platform if not given.
+        :return: Mapping of job names to resolved statuses.
+        """
+        if not job_list:
+            return {}
+        if stat_files is None:
+            stat_files = self.read_stat_files(job_list)
+
+        result: dict[str, Status] = {}
+        for job in job_list:
+            lines = stat_files.get(job.name)
+            if not lines:
+                continue
+            if len(lines) == 1 and lines[-1].isdigit():
+                result[job.name] = Status.QUEUING
+            else:
+                result[job.name] = self._resolve_status(lines[-1])
         return result
 
-    def set_start_time_from_remote_stat_file(self, job_list: list) -> None:
+    def set_start_time_from_remote_stat_file(
+            self, job_list: list, stat_files: dict[str, list[str]] | None = None) -> None:
         """Set ``start_time_timestamp`` from line 1 (second line) of each remote STAT file.
 
         Reads line 1 (not line 0) because L0 is now submit_time.
 
         :param job_list: Jobs whose start times should be filled from remote STAT files.
+        :param stat_files: STAT file lines by job name, as returned by ``read_stat_files``.
+            Read from the platform if not given.
         """
         if not job_list:
             return
-
-        # List files in the remote log directory
-        self.send_command(f"ecaccess-file-dir {self._ec_retry_flag} {self.host}:{self.remote_log_dir}")
-        dir_output = self.get_ssh_output()
-
-        # ecaccess-file-dir output format: filename|size  NNNN
-        available_stats: set[str] = set()
-        for line in dir_output.splitlines():
-            file_name = Path(line.strip().split("|")[0].rstrip("/")).name if line.strip() else ""
-            if "_STAT_" in file_name:
-                available_stats.add(file_name)
+        if stat_files is None:
+            stat_files = self.read_stat_files(job_list)
 
         for job in job_list:
-            stat_name = f"{job.name}_STAT_{job.fail_count}"
-            if stat_name not in available_stats:
+            lines = stat_files.get(job.name)
+            if not lines:
                 continue
-
-            remote_path = f"{self.host}:{self.remote_log_dir}/{stat_name}"
-            local_path = Path(self.tmp_path) / stat_name
-
             try:
-                subprocess.check_output(
-                    f"{self.get_cmd} {remote_path} {local_path}",
-                    shell=True,
-                    stderr=subprocess.DEVNULL,
-                )
-                content = local_path.read_text().strip()
-                if content:
-                    lines = content.splitlines()
-                    start_epoch = float(lines[1]) if len(lines) >= 2 else float(lines[0])
-                    job.start_time_timestamp = datetime.datetime.fromtimestamp(start_epoch).strftime("%Y%m%d%H%M%S")
+                start_epoch = float(lines[1]) if len(lines) >= 2 else float(lines[0])
+                job.start_time_timestamp = datetime.datetime.fromtimestamp(start_epoch).strftime("%Y%m%d%H%M%S")
             except Exception:
                 Log.warning(
                     f"Could not parse start time from STAT file for job {job.name}. "
@@ -485,6 +491,13 @@ class EcPlatform(ParamikoPlatform):
                                                                                        filename)), 6005, str(e))
         return True
 
+    def send_files(self, filenames: list[str]) -> None:
+        """Sends the files one by one, as the commands of this platform do not run on the remote host.
+
+        :param filenames: The names of the files to send.
+        """
+        Platform.send_files(self, filenames)
+
     def move_file(self, src, dest, must_exist=False):
         command = (f"ecaccess-file-move {self._ec_retry_flag} {self.host}:{os.path.join(self.remote_log_dir, src)} "
                    f"{self.host}:{os.path.join(self.remote_log_dir, dest)}")
@@ -28,6 +28,7 @@ from autosubmit.log.log import AutosubmitError, Log
 from autosubmit.platforms.execution_mode import ExecutionMode
 from autosubmit.platforms.headers.local_header import LocalHeader
 from autosubmit.platforms.paramiko_platform import ParamikoPlatform
+from autosubmit.platforms.platform import Platform
 from autosubmit.platforms.platform_type import PlatformType
 
 if TYPE_CHECKING:
@@ -234,6 +235,13 @@ class LocalPlatform(ParamikoPlatform):
             raise
         return True
 
+    def send_files(self, filenames: list[str]) -> None:
+        """Sends the files one by one, as copying them locally has no round trips to save.
+
+        :param filenames: The names of the files to send.
+        """
+        Platform.send_files(self, filenames)
+
     def remove_multiple_files(self, filenames: str) -> str:
         """Creates a shell script to remove multiple files in the remote and sets the appropriate permissions.
 
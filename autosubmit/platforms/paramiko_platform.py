@@ -15,6 +15,7 @@
 # You should have received a copy of the GNU General Public License
 # along with Autosubmit.  If not, see <http://www.gnu.org/licenses/>.
 
+import base64
 import datetime
 import hashlib
 import locale
@@ -23,9 +24,13 @@ import os
 import random
 import re
 import select
+import shlex
+import shutil
 import socket
 import sys
-from contextlib import suppress
+import tarfile
+from collections.abc import Iterator
+from contextlib import contextmanager, suppress
 from io import BufferedReader
 from pathlib import Path
 from threading import Thread
@@ -52,6 +57,15 @@ if TYPE_CHECKING:
     from autosubmit.job.job_packages import JobPackageBase
     from autosubmit.platforms.headers import PlatformHeader
 
+_READ_FILES_MARKER = "AUTOSUBMIT_READ_FILES"
+"""Printed before the content of the files read by ``ParamikoPlatform.read_files``."""
+
+_SEND_FILES_ARCHIVE = "send_files"
+"""Prefix of the archive of the files sent by ``ParamikoPlatform.send_files``."""
+
+_GET_FILES_ARCHIVE = "get_files"
+"""Prefix of the archive of the files copied by ``ParamikoPlatform.get_files``."""
+
 
 def threaded(fn):
     def wrapper(*args, **kwargs):
@@ -185,6 +199,8 @@ class ParamikoPlatform(Platform):
         # Pre-submission snapshot used by get_submitted_jobs_by_name to exclude
         # stale processes from previous runs on process-based platforms.
         self._pre_submission_pids: dict[str, set[int]] = {}
+        # Log files requested inside ``batch_logs_files``, by experiment.
+        self._logs_files_batch: dict[str, list[str]] | None = None
 
     @property
     def header(self) -> 'PlatformHeader':
@@ -513,12 +529,115 @@ class ParamikoPlatform(Platform):
             raise AutosubmitError(f'Cannot send file {local_path} to {remote_path}. '
                                   f'An unexpected error occurred: {str(e)}', 6004)
 
+    def send_files(self, filenames: list[str]) -> None:
+        """Send several files at once, as a tar archive extracted on the platform.
+
+        The remote log directory is checked and the previous files are removed only once,
+        instead of once per file. Falls back to sending the files one by one if the archive
+        cannot be created, sent, or extracted.
+
+        :param filenames: The names of the files to send.
+        """
+        filenames = list(dict.fromkeys(filenames))
+        if len(filenames) < 2:
+            return super().send_files(filenames)
+
+        archive = f"{_SEND_FILES_ARCHIVE}_{self.name}.tar"
+        archive_path = os.path.join(self.tmp_path, archive)
+        try:
+            with tarfile.open(archive_path, "w") as tar:
+                for filename in filenames:
+                    tar.add(os.path.join(self.tmp_path, filename), arcname=os.path.basename(filename))
+            self.check_remote_log_dir()
+            self.remove_multiple_files("".join(
+                f" {shlex.quote(os.path.join(self.get_files_path(), os.path.basename(filename)))}"
+                for filename in filenames))
+            self.send_file(archive, check=False)
+            quoted = shlex.quote(archive)
+            if not self.send_command(f"cd {shlex.quote(self.get_files_path())}; tar -xpf {quoted} && rm -f {quoted}",
+                                     ignore_log=True):
+                raise AutosubmitError(f"Cannot extract {archive}: {self.get_ssh_output()}", 6004)
+        except Exception as e:
+            Log.debug(f"Error sending files {filenames} in a single archive, sending them one by one: {str(e)}")
+            super().send_files(filenames)
+        finally:
+            with suppress(OSError):
+                os.remove(archive_path)
+
     def get_logs_files(self, exp_id: str, remote_logs: tuple[str, str]) -> None:
         (job_out_filename, job_err_filename) = remote_logs
+        if self._logs_files_batch is not None:
+            self._logs_files_batch.setdefault(exp_id, []).extend([job_out_filename, job_err_filename])
+            return
         self.get_files(
             [job_out_filename, job_err_filename], False, f"LOG_{exp_id}"
         )
 
+    @contextmanager
+    def batch_logs_files(self) -> Iterator[None]:
+        """Copy the log files requested with ``get_logs_files`` in the block together, when it ends.
+
+        The log files of every job of the block are copied with a single ``get_files``.
+        """
+        self._logs_files_batch = {}
+        try:
+            yield
+        finally:
+            batch, self._logs_files_batch = self._logs_files_batch, None
+            for exp_id, filenames in batch.items():
+                self.get_files(filenames, False, f"LOG_{exp_id}")
+
+    def get_files(self, files, must_exist=True, relative_path=''):
+        """Copies several files at once, as a tar archive created on the platform.
+
+        The log files copied are removed from the platform with the archive, if configured.
+        Falls back to copying the files one by one if the archive cannot be created, copied,
+        or extracted. The files missing from the archive are also copied one by one.
+
+        :param files: file names
+        :type files: [str]
+        :param must_exist: If True, raises an exception if file can not be copied
+        :type must_exist: bool
+        :param relative_path: relative path inside tmp folder
+        :type relative_path: str
+        """
+        files = list(dict.fromkeys(files))
+        if len(files) < 2:
+            return super().get_files(files, must_exist, relative_path)
+
+        archive = f"{_GET_FILES_ARCHIVE}_{self.name}_{os.getpid()}.tar"
+        local_path = os.path.join(self.tmp_path, relative_path)
+        archive_path = os.path.join(self.tmp_path, archive)
+        remote_files = [archive]
+        copied = set()
+        try:
+            os.makedirs(local_path, exist_ok=True)
+            quoted = " ".join(shlex.quote(filename) for filename in files)
+            if not self.send_command(f"cd {shlex.quote(self.get_files_path())} && "
+                                     f"ls -1 -- {quoted} 2>/dev/null | tar -cf {shlex.quote(archive)} -T -",
+                                     ignore_log=True):
+                raise AutosubmitError(f"Cannot create {archive}: {self.get_ssh_output()}", 6004)
+            self._ftpChannel.get(os.path.join(self.get_files_path(), archive), archive_path)
+            with tarfile.open(archive_path) as tar:
+                for member in tar.getmembers():
+                    if not member.isfile() or member.name not in files:
+                        continue
+                    with tar.extractfile(member) as src, open(os.path.join(local_path, member.name), "wb") as dst:
+                        shutil.copyfileobj(src, dst)
+                    copied.add(member.name)
+                    if self.remove_log_files_on_transfer and re.match(r".*\.(out|err)(\.(xz|gz))?$", member.name):
+                        remote_files.append(member.name)
+        except (AutosubmitError, OSError, SSHException, tarfile.TarError) as e:
+            Log.debug(f"Error copying files {files} in a single archive, copying them one by one: {str(e)}")
+        finally:
+            with suppress(OSError):
+                os.remove(archive_path)
+            with suppress(Exception):
+                self.send_command(f"cd {shlex.quote(self.get_files_path())} && "
+                                  f"rm -f {' '.join(shlex.quote(filename) for filename in remote_files)}",
+                                  ignore_log=True)
+        super().get_files([filename for filename in files if filename not in copied], must_exist, relative_path)
+
     def _chunked_md5(self, file_buffer: BufferedReader) -> str:
         """Calculate the MD5 checksum of a file in chunks to avoid high memory usage.
 
@@ -943,16 +1062,15 @@ class ParamikoPlatform(Platform):
 
         return scheduler_job_status, None
 
-    def confirm_done_jobs_via_stat(self, job_list: list) -> dict[str, "Status"]:
-        """Read remote STAT files and resolve job status from their last line.
+    def read_stat_files(self, job_list: list) -> dict[str, list[str]]:
+        """Read the remote STAT files of the jobs with a single remote command.
 
-        STAT format (four lines): submit_time, start_time, end_time, status.
-        - If the file has a single numeric line the job is treated as QUEUING
-          (submitted but not yet started).
-        - Otherwise the last line is passed to ``_resolve_status``.
+        The command prints one line per existing STAT file: its path, a tab, and the
+        lines of the file joined by tabs. The output is parsed in one pass.
 
-        :param job_list: Jobs to confirm via STAT files.
-        :return: Mapping of job names to resolved Status.
+        :param job_list: Jobs whose STAT files are read.
+        :return: Mapping of job names to the lines of their STAT file. Jobs without
+            STAT file are not included.
         """
         if not job_list:
             return {}
@@ -961,26 +1079,53 @@ class ParamikoPlatform(Platform):
             str(Path(self.remote_log_dir) / f"{job.name}_STAT_{job.fail_count}"): job.name
             for job in job_list
         }
-        result: dict[str, str] = {job.name: "" for job in job_list}
-
         paths_str = " ".join(f'"{p}"' for p in file_to_job)
-        cmd = f'for f in {paths_str}; do res=$(awk \'END{{if(NR==1 && $0 ~ /^[0-9]+$/) print "QUEUING"; else print $0}}\' "$f" 2>/dev/null); printf "%s: \\"%s\\"\\n" "$f" "${{res:-None}}"; done'
+        cmd = (
+            f'for f in {paths_str}; do '
+            f'if [ -f "$f" ]; then printf "%s\\t" "$f"; paste -s -d "\\t" "$f"; fi; '
+            f'done'
+        )
         self.send_command(cmd, ignore_log=True)
 
-        output = self._ssh_output
-        for line in output.splitlines():
-            parts = line.split(":", 1)
-            if len(parts) != 2:
-                Log.debug(f"Unexpected STAT output line (no separator): {line}")
-                continue
-            current_path = parts[0].strip()
-            job = file_to_job.get(current_path)
-            if not job:
-                Log.debug(f"STAT file path did not match any job: {current_path}")
+        stat_files: dict[str, list[str]] = {}
+        for line in self._ssh_output.splitlines():
+            path, separator, content = line.partition("\t")
+            job_name = file_to_job.get(path.strip())
+            if not separator or not job_name:
+                Log.debug(f"Unexpected STAT output line: {line}")
                 continue
-            status = parts[1].strip().strip('"')
-            result[job] = self._resolve_status(status)
+            stat_files[job_name] = [stat_line.strip() for stat_line in content.split("\t") if stat_line.strip()]
+        return stat_files
+
+    def confirm_done_jobs_via_stat(
+            self, job_list: list, stat_files: dict[str, list[str]] | None = None) -> dict[str, "Status"]:
+        """Resolve job status from the last line of their remote STAT files.
+
+        STAT format (four lines): submit_time, start_time, end_time, status.
+        - If the file has a single numeric line the job is treated as QUEUING
+          (submitted but not yet started).
+        - Otherwise the last line is passed to ``_resolve_status``.
 
+        :param job_list: Jobs to confirm via STAT files.
+        :param stat_files: STAT file lines by job name, as returned by ``read_stat_files``.
+            Read from the platform if not given.
+        :return: Mapping of job names to resolved Status.
+        """
+        if not job_list:
+            return {}
+        if stat_files is None:
+            stat_files = self.read_stat_files(job_list)
+
+        result: dict[str, Status] = {}
+        for job in job_list:
+            stat_lines = stat_files.get(job.name)
+            if not stat_lines:
+                last_line = "None"
+            elif len(stat_lines) == 1 and stat_lines[0].isdigit():
+                last_line = "QUEUING"
+            else:
+                last_line = stat_lines[-1]
+            result[job.name] = self._resolve_status(last_line)
         return result
 
     def _check_jobid_in_queue(self, ssh_output: str, job_list_cmd: str) -> bool:
@@ -1053,7 +1198,9 @@ class ParamikoPlatform(Platform):
             # This only indicates that the scheduler has released the job resources.
             job_list_status = self.get_ssh_output()
             # Ideally, we should rely in stat files, as it indicates that every IO file has been flushed, the data is on the login node and the job is really finished.
-            stat_statuses = self.confirm_done_jobs_via_stat(job_list)
+            # One remote read per poll serves both the status confirmation and the start times.
+            stat_files = self.read_stat_files(job_list)
+            stat_statuses = self.confirm_done_jobs_via_stat(job_list, stat_files)
 
             if retries >= 0:
                 Log.debug('Successful check job command')
@@ -1100,7 +1247,8 @@ class ParamikoPlatform(Platform):
             # check and set if there is any_job without timestamp
             self.set_start_time_from_remote_stat_file([job for job in job_list if
                                                        not job.start_time_timestamp and job.new_status in [
-                                                           Status.RUNNING, Status.COMPLETED, Status.FAILED]])
+                                                           Status.RUNNING, Status.COMPLETED, Status.FAILED]],
+                                                    stat_files)
             # Safeguard 3: Is over_wallclock?
             for job in [job for job in job_list if
                         job.new_status == Status.RUNNING and str(job.wrapper_type).lower() == "none"]:
@@ -1116,45 +1264,28 @@ class ParamikoPlatform(Platform):
         else:
             raise AutosubmitError("Failed to check job status after multiple retries", 6000)
 
-    def set_start_time_from_remote_stat_file(self, job_list: list["Job"]) -> None:
+    def set_start_time_from_remote_stat_file(
+            self, job_list: list["Job"], stat_files: dict[str, list[str]] | None = None) -> None:
         """Set ``start_time_timestamp`` from line 1 (second line) of each remote STAT file.
 
         STAT format: submit_time (L0), start_time (L1), end_time (L2), status (L3).
         Reads line 1 (not line 0) because submit_time was written at submission time.
 
         :param job_list: Jobs whose start times should be filled from remote STAT files.
+        :param stat_files: STAT file lines by job name, as returned by ``read_stat_files``.
+            Read from the platform if not given.
         """
         if not job_list:
             return
+        if stat_files is None:
+            stat_files = self.read_stat_files(job_list)
 
-        file_to_job: dict[str, Job] = {
-            str(Path(self.remote_log_dir) / f"{job.name}_STAT_{job.fail_count}"): job
-            for job in job_list
-        }
-
-        paths_str = " ".join(f'"{p}"' for p in file_to_job)
-        cmd = (
-            f'for f in {paths_str}; do '
-            f'res=$(sed -n \'2p\' "$f" 2>/dev/null); '
-            f'printf "%s: \\"%s\\"\\n" "$f" "${{res:-None}}"; '
-            f'done'
-        )
-        self.send_command(cmd, ignore_log=True)
-        output = self._ssh_output
-
-        for line in output.splitlines():
-            parts = line.split(":", 1)
-            if len(parts) != 2:
-                continue
-            current_path = parts[0].strip()
-            raw_value = parts[1].strip().strip('"')
-            job = file_to_job.get(current_path)
-            if not job:
-                continue
+        for job in job_list:
+            stat_lines = stat_files.get(job.name, [])
             try:
-                start_epoch = float(raw_value)
+                start_epoch = float(stat_lines[1])
                 job.start_time_timestamp = datetime.datetime.fromtimestamp(start_epoch).strftime("%Y%m%d%H%M%S")
-            except (ValueError, OSError):
+            except (IndexError, ValueError, OSError):
                 Log.warning(
                     f"Could not parse start time from STAT file for job {job.name}. "
                     f"Using current datetime."
@@ -1703,6 +1834,47 @@ class ParamikoPlatform(Platform):
             Log.debug(f"Error reading file {src}: {str(e)}")
             return None
 
+    def read_files(self, files: dict[str, int | None]) -> dict[str, bytes | None]:
+        """Read the content of several files as bytes with a single SSH command.
+
+        Every file is printed base64 encoded in its own line, so the binary content
+        survives the decoding of the command output. Falls back to reading the files
+        one by one through SFTP if the command or its output are not as expected.
+
+        :param files: file paths, and the maximum size to read from each of them
+        :return: the content of each file path, None if the file could not be read
+        """
+        if len(files) < 2:
+            return super().read_files(files)
+
+        cmd_list = ["command -v base64 > /dev/null || exit 1", f"echo {_READ_FILES_MARKER}"]
+        for src, max_size in files.items():
+            quoted = shlex.quote(str(src))
+            read = f"head -c {int(max_size)} {quoted}" if max_size else f"cat {quoted}"
+            cmd_list.append(
+                f"if [ -f {quoted} ] && [ -r {quoted} ]; then echo OK; {read} | base64 | tr -d '\\n'; echo; "
+                f"else echo MISSING; fi"
+            )
+        try:
+            self.send_command("; ".join(cmd_list), ignore_log=True)
+            output = self.get_ssh_output()
+            lines = output[output.index(_READ_FILES_MARKER) + len(_READ_FILES_MARKER):].split()
+            contents: dict[str, bytes | None] = {}
+            for src in files:
+                status = lines.pop(0)
+                if status == "MISSING":
+                    contents[src] = None
+                elif status == "OK":
+                    # An empty file only prints its status
+                    encoded = lines.pop(0) if lines and lines[0] not in ("OK", "MISSING") else ""
+                    contents[src] = base64.b64decode(encoded, validate=True)
+                else:
+                    raise ValueError(f"Unexpected status {status} reading {src}")
+            return contents
+        except Exception as e:
+            Log.debug(f"Error reading files {list(files)} in a single command, reading them one by one: {str(e)}")
+            return super().read_files(files)
+
     def compress_file(self, file_path):
         Log.debug(f"Compressing file {file_path} using {self.remote_logs_compress_type}")
         try:
@@ -18,10 +18,13 @@
 import atexit
 import multiprocessing
 import os
+import queue
 import time
 import traceback
 from abc import ABC
-from contextlib import suppress
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext, suppress
 from multiprocessing.queues import Queue
 from multiprocessing.synchronize import Event
 
@@ -48,6 +51,9 @@ if TYPE_CHECKING:
     from autosubmit.job.job_list import JobList
     from autosubmit.job.job_packages import JobPackageBase
 
+LOG_RECOVERY_BATCH_SIZE = 100
+"""Maximum number of queued jobs the log recovery process loads, retrieves and saves together."""
+
 
 def _init_logs_log_process(as_conf: 'AutosubmitConfig', platform_name: str) -> None:
     Log.set_console_level(as_conf.experiment_data.get("LOG_RECOVERY_CONSOLE_LEVEL", "DEBUG"))
@@ -412,6 +418,11 @@ class Platform(ABC):
         metadata, generates job scripts, transfers files to the platform, and
         collects the jobs prepared for later submission handling.
 
+        The scripts of all the packages are generated before sending any file.
+        With ``CONFIG.SCRIPT_GENERATION_THREADS`` greater than one, they are
+        written and checked by that many threads. The files of all the packages
+        are then sent together.
+
         :param as_conf: Autosubmit configuration for the current experiment.
         :type as_conf: AutosubmitConfig
         :param job_list: Job container used to inspect ready jobs and register
@@ -436,12 +447,20 @@ class Platform(ABC):
         # Submitting by sections allows to detect Scheduler misconfiguration derived from a bad configuration without submitting any job.
         scripts_to_submit_by_section: dict[str, dict[str, JobPackageBase]] = {}
         x11_scripts_to_submit_by_section: dict[str, dict[str, JobPackageBase]] = {}
+        # The scripts are rendered one by one, and written by a pool of threads shared by all the packages
+        threads = max(1, int(as_conf.experiment_data.get("CONFIG", {}).get("SCRIPT_GENERATION_THREADS", 1)))
+        with ThreadPoolExecutor(max_workers=threads, thread_name_prefix=f"{self.name}_scripts") \
+                if threads > 1 and not only_wrappers else nullcontext() as executor:
+            for package in packages_to_submit:
+                self.prepare_dry_run_if_applicable(job_list, package, only_wrappers, inspect, as_conf)
+                if not only_wrappers:
+                    package.generate_scripts(as_conf, inspect, executor)
+        for package in packages_to_submit:
+            package.wait_for_scripts()
+        if not inspect and not only_wrappers:
+            # The files of all the packages are sent at once
+            self.send_files([filename for package in packages_to_submit for filename in package.get_files_to_send()])
         for package in packages_to_submit:
-            self.prepare_dry_run_if_applicable(job_list, package, only_wrappers, inspect, as_conf)
-            if not only_wrappers:
-                package.generate_scripts(as_conf, inspect)
-            if not inspect and not only_wrappers:
-                package.send_files()
             if package.x11:
                 x11_scripts_to_submit_by_section.setdefault(package.sections, {})[
                     f"{package.name}.cmd"] = package
@@ -598,6 +617,16 @@ class Platform(ABC):
         """
         raise NotImplementedError  # pragma: no cover
 
+    def send_files(self, filenames: list[str]) -> None:
+        """Sends several local files to the platform.
+
+        Platforms that can send several files in a single round trip should override this.
+
+        :param filenames: The names of the files to send.
+        """
+        for filename in filenames:
+            self.send_file(filename)
+
     def move_file(self, src, dest):
         """Moves a file on the platform.
 
@@ -660,6 +689,15 @@ class Platform(ABC):
         """
         raise NotImplementedError  # pragma: no cover
 
+    @contextmanager
+    def batch_logs_files(self) -> Iterator[None]:
+        """Copy the log files requested with ``get_logs_files`` in the block together, when it ends.
+
+        Platforms that can copy several files in a single round trip should override this.
+        By default, the log files are copied when they are requested.
+        """
+        yield
+
     def get_checkpoint_files(self, job):
         """Get all the checkpoint files of a job.
 
@@ -840,6 +878,8 @@ class Platform(ABC):
 
         if self.cleanup_event is not None:
             self.cleanup_event.set()
+            if self.work_event is not None:
+                self.work_event.set()  # Wake up the worker blocked in ``wait_for_work``
 
         if self.log_recovery_process:
             self.log_recovery_process.join(timeout=60)
@@ -988,8 +1028,8 @@ class Platform(ABC):
         """
         if (self.work_event is not None and self.cleanup_event is not None and
                 self.log_recovery_process is not None and self.log_recovery_process.is_alive()):
-            self.work_event.clear()
             self.cleanup_event.set()
+            self.work_event.set()  # Wake up the worker blocked in ``wait_for_work``
             self.log_recovery_process.join(timeout=60)
 
         if (self.log_recovery_process is not None
@@ -1004,41 +1044,43 @@ class Platform(ABC):
             self.cleanup_event = None
 
     def wait_for_work(self) -> bool:
-        """Waits until there is work, or the keep alive timeout is reached.
+        """Blocks until there is work or a cleanup request, or the keep alive timeout is reached.
+
+        The main process sets ``work_event`` when it queues a job, sends a keep alive signal or asks for a cleanup.
 
         :return: True if there is work to process, False otherwise.
         """
-        process_log = False
-        start_time = time.time()
-        while (time.time() - start_time) < self.keep_alive_timeout:
-            if self.work_event.is_set() or not self.recovery_queue.empty() or self.cleanup_event.is_set():
-                process_log = True
-                break
-            time.sleep(1)
-        else:
-            # Final check in case something arrived just after the last sleep
-            if self.work_event.is_set() or not self.recovery_queue.empty() or self.cleanup_event.is_set():
-                process_log = True
-
+        process_log = (self.work_event.is_set() or not self.recovery_queue.empty() or self.cleanup_event.is_set()
+                       or self.work_event.wait(timeout=self.keep_alive_timeout)
+                       or not self.recovery_queue.empty() or self.cleanup_event.is_set())
         self.work_event.clear()
         return process_log
 
-    def recover_job_log(self, jobs_db_manager: 'JobsDbManager', as_conf: 'AutosubmitConfig') -> None:
-        """Recovers log files for jobs from the recovery queue and retries failed jobs.
+    def _get_log_recovery_batch(self) -> list[dict[str, Any]]:
+        """Drains up to ``LOG_RECOVERY_BATCH_SIZE`` entries from the recovery queue.
+
+        :return: The queued job entries, in queue order.
         """
-        from autosubmit.job.job import Job
-        if self.recovery_queue is None:
-            raise AutosubmitCritical("As the recovery job was initialized some of"
-                                     "the variable were not properly initialized")
-        while not self.recovery_queue.empty():
-            job_data = self.recovery_queue.get(timeout=5)
-            job = Job(loaded_data=jobs_db_manager.load_job_by_name(job_data["name"]))
-            job.platform_name = self.name  # Change the original platform to this process platform.
-            job.platform = self
+        batch = []
+        try:
+            batch.append(self.recovery_queue.get(timeout=5))
+            while len(batch) < LOG_RECOVERY_BATCH_SIZE:
+                batch.append(self.recovery_queue.get_nowait())
+        except queue.Empty:
+            pass
+        return batch
+
+    def _recover_logs_of_job(self, job: 'Job', job_ids: list[Any]) -> None:
+        """Retrieves the logs of every queued submission of ``job``, one after another.
+
+        :param job: The job, loaded from the database.
+        :param job_ids: The job ids of the queued submissions, in queue order.
+        """
+        for job_id in job_ids:
             # TODO: handle missing job IDs (id=0). During an Autosubmit run, a job's log
             # may fail to be retrieved. When recovery or setstatus or while running, later, it  tries to recover
             # it, the job id is 0 because it was never persisted.
-            job.id = job_data["id"]
+            job.id = job_id
             report = job.retrieve_logfiles()
             job.send_cpmip_notification(self._as_conf)
 
@@ -1058,7 +1100,48 @@ class Platform(ABC):
                     f"{self.name}(log_recovery): Job {job.name} recovered "
                     f"{len(report.attempts)} attempt(s)."
                 )
-            jobs_db_manager.save_job_log(job)
+
+    def recover_job_log(self, jobs_db_manager: 'JobsDbManager', as_conf: 'AutosubmitConfig') -> None:
+        """Recovers log files for jobs from the recovery queue and retries failed jobs.
+
+        The queue is drained in batches. The jobs of a batch are loaded with one query, their logs are
+        checked one job after another and copied together, and the log information of the batch is
+        saved with one update. A job whose recovery fails does not prevent saving the rest of the batch.
+        """
+        from autosubmit.job.job import Job
+        if self.recovery_queue is None:
+            raise AutosubmitCritical("As the recovery job was initialized some of"
+                                     "the variable were not properly initialized")
+        while not self.recovery_queue.empty():
+            batch = self._get_log_recovery_batch()
+            if not batch:
+                break
+            # A job queued more than once in the batch recovers its submissions in order.
+            job_ids_by_name: dict[str, list[Any]] = {}
+            for job_data in batch:
+                job_ids_by_name.setdefault(job_data["name"], []).append(job_data["id"])
+            jobs = []
+            for loaded_data in jobs_db_manager.load_jobs_by_names(list(job_ids_by_name)):
+                job = Job(loaded_data=loaded_data)
+                job.platform_name = self.name  # Change the original platform to this process platform.
+                job.platform = self
+                jobs.append(job)
+
+            errors = {}
+            with self.batch_logs_files():
+                for job in jobs:
+                    try:
+                        self._recover_logs_of_job(job, job_ids_by_name[job.name])
+                    except Exception as e:
+                        errors[job.name] = e
+            if errors:
+                Log.warning(f"{self.name}(log_recovery): Failed to recover the logs of {len(errors)} job(s): "
+                            f"{', '.join(f'{name}: {error}' for name, error in errors.items())}")
+            jobs_db_manager.save_jobs_log(jobs)
+            try:
+                jobs_db_manager.save_jobs_retrials(jobs)
+            except Exception as e:
+                Log.warning(f"{self.name}(log_recovery): Failed to save the retrials of the jobs in the database: {e}")
 
     def recover_platform_job_logs(self, as_conf: 'AutosubmitConfig') -> None:
         """Recovers the logs of the jobs that have been submitted.
@@ -1109,6 +1192,16 @@ class Platform(ABC):
         """
         raise NotImplementedError  # pragma: no cover
 
+    def read_files(self, files: dict[str, int | None]) -> dict[str, bytes | None]:
+        """Read the content of several files as bytes.
+
+        Platforms that can fetch several files in a single round trip should override this.
+
+        :param files: file paths, and the maximum size to read from each of them
+        :return: the content of each file path, None if the file could not be read
+        """
+        return {src: self.read_file(src, max_size=max_size) for src, max_size in files.items()}
+
     def compress_file(self, file_path: str) -> str | None:
         """Compress a file.
 
@@ -1148,10 +1241,20 @@ class Platform(ABC):
         """
         raise NotImplementedError  # pragma: no cover
 
-    def confirm_done_jobs_via_stat(self, job_list: list) -> dict[str, "Status"]:
+    def read_stat_files(self, job_list: list) -> dict[str, list[str]]:
+        """Read the STAT files of the jobs from the remote log directory in a single pass.
+
+        :param job_list: List of jobs whose STAT files are read.
+        :return: Mapping of job names to the lines of their STAT file.
+        """
+        raise NotImplementedError  # pragma: no cover
+
+    def confirm_done_jobs_via_stat(
+            self, job_list: list, stat_files: dict[str, list[str]] | None = None) -> dict[str, "Status"]:
         """Confirm that jobs marked as done are actually completed by checking their STAT files.
 
         :param job_list: List of jobs to confirm.
+        :param stat_files: STAT file lines by job name, as returned by ``read_stat_files``.
         :return: List of jobs that are confirmed as completed.
         """
         raise NotImplementedError  # pragma: no cover
@@ -123,6 +123,10 @@ class JobStat:
     def name(self):
         return self._name
 
+    @property
+    def processors(self):
+        return self._processors
+
     def get_as_dict(self):
         return {
             "name": self._name,
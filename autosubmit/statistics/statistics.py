@@ -16,16 +16,52 @@
 # along with Autosubmit.  If not, see <http://www.gnu.org/licenses/
 
 from datetime import datetime, timedelta
-from typing import Union
+from typing import Any
+
+import numpy as np
 
 from autosubmit.job.job import Job
 from autosubmit.statistics.jobs_stat import JobStat
 from autosubmit.statistics.stats_summary import StatsSummary
-from autosubmit.statistics.utils import parse_number_processors, timedelta2hours
+from autosubmit.statistics.utils import parse_number_processors, timedeltas2hours
 
 _COMPLETED_RETRIAL = 1
 _FAILED_RETRIAL = 0
 
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+# The smallest 64-bit integer is ``NaT`` when viewed as a ``datetime64`` or ``timedelta64``.
+_NAT = np.iinfo(np.int64).min
+
+
+def _retrial_time(retrial: list[Any], field: int) -> datetime | None:
+    """Return the date of the retrial at the given field (submit, start, finish), or ``None`` if missing."""
+    return retrial[field] if len(retrial) > field and type(retrial[field]) is datetime else None
+
+
+def _retrial_times(retrials: list[list[Any]], field: int) -> np.ndarray:
+    """Return the dates of the retrials at the given field as ``datetime64``, ``NaT`` where missing.
+
+    The dates are converted to integers first, as NumPy is much slower converting ``datetime`` objects.
+    """
+    times = (_retrial_time(retrial, field) for retrial in retrials)
+    microseconds = ((time - _EPOCH) // _MICROSECOND if time else _NAT for time in times)
+    return np.fromiter(microseconds, dtype=np.int64, count=len(retrials)).view("datetime64[us]")
+
+
+def _sum_by_job(times: np.ndarray, job_indexes: np.ndarray, mask: np.ndarray, jobs_count: int) -> np.ndarray:
+    """Add up the time deltas of the masked retrials of each job, ignoring the ``NaT`` values."""
+    mask = mask & ~np.isnat(times)
+    totals = np.zeros(jobs_count, dtype=np.int64)
+    np.add.at(totals, job_indexes[mask], times[mask].astype(np.int64))
+    return totals.view("timedelta64[us]")
+
+
+def _time_deltas(jobs_stat: list[JobStat], attribute: str) -> np.ndarray:
+    """Return the given time delta attribute of the job statistics as a ``timedelta64`` array."""
+    microseconds = (getattr(job_stat, attribute) // _MICROSECOND for job_stat in jobs_stat)
+    return np.fromiter(microseconds, dtype=np.int64, count=len(jobs_stat)).view("timedelta64[us]")
+
 
 class Statistics:
 
@@ -60,55 +96,82 @@ class Statistics:
         self.totals = [" Description text \n", "Line 1"]
 
     def calculate_statistics(self) -> "Statistics":
-        for index, job in enumerate(self._jobs):
-            retrials = job.get_last_retrials()
-            for retrial in retrials:
-                job_stat = self._name_to_jobstat_dict.setdefault(job.name, JobStat(job.name, parse_number_processors(
-                    job.processors), job.total_wallclock, job.section, job.date, job.member, job.chunk, job.processors_per_node, job.tasks, job.nodes, job.exclusive))
-                job_stat.inc_retrial_count()
-                if Job.is_a_completed_retrial(retrial):
-                    job_stat.inc_completed_retrial_count()
-                    job_stat.submit_time = retrial[0]
-                    job_stat.start_time = retrial[1]
-                    job_stat.finish_time = retrial[2]
-                    adjusted_queue = max(job_stat.start_time - job_stat.submit_time, timedelta()) - timedelta(
-                        seconds=self._queue_time_fixes.get(job.name, 0))
-                    job_stat.completed_queue_time += max(adjusted_queue, timedelta())
-                    job_stat.completed_run_time += max(job_stat.finish_time - job_stat.start_time, timedelta())
-                else:
-                    job_stat.inc_failed_retrial_count()
-                    job_stat.submit_time = retrial[0] if len(retrial) >= 1 and type(retrial[0]) is datetime else None
-                    job_stat.start_time = retrial[1] if len(retrial) >= 2 and type(retrial[1]) is datetime else None
-                    job_stat.finish_time = retrial[2] if len(retrial) >= 3 and type(retrial[2]) is datetime else None
-                    if job_stat.finish_time and job_stat.start_time:
-                        job_stat.failed_run_time += max(job_stat.finish_time - job_stat.start_time, timedelta())
-                    if job_stat.start_time and job_stat.submit_time:
-                        adjusted_failed_queue = max(job_stat.start_time - job_stat.submit_time,
-                                                    timedelta()) - timedelta(
-                            seconds=self._queue_time_fixes.get(job.name, 0))
-                        job_stat.failed_queue_time += max(adjusted_failed_queue, timedelta())
+        retrials: list[list[Any]] = []
+        retrial_job_indexes: list[int] = []
+        last_retrials: list[list[Any]] = []
+        queue_time_fixes: list[int] = []
+        job_indexes: dict[str, int] = {}
+        for job in self._jobs:
+            job_retrials = job.get_last_retrials()
+            if not job_retrials:
+                continue
+            if job.name not in job_indexes:
+                job_indexes[job.name] = len(job_indexes)
+                self._name_to_jobstat_dict[job.name] = JobStat(job.name, parse_number_processors(
+                    job.processors), job.total_wallclock, job.section, job.date, job.member, job.chunk, job.processors_per_node, job.tasks, job.nodes, job.exclusive)
+                last_retrials.append([])
+                queue_time_fixes.append(self._queue_time_fixes.get(job.name, 0))
+            index = job_indexes[job.name]
+            last_retrials[index] = job_retrials[-1]
+            retrials.extend(job_retrials)
+            retrial_job_indexes.extend([index] * len(job_retrials))
+
+        jobs_count = len(job_indexes)
+        retrial_job_indexes = np.array(retrial_job_indexes, dtype=np.int64)
+        completed = np.array([Job.is_a_completed_retrial(retrial) for retrial in retrials], dtype=bool)
+        submit_times, start_times, finish_times = (_retrial_times(retrials, field) for field in range(3))
+        queue_time_fixes = np.array(queue_time_fixes, dtype="timedelta64[s]")[retrial_job_indexes]
+        no_time = np.timedelta64(0, "us")
+        # Missing dates are NaT, which propagates to the times and is skipped when adding them up.
+        queue_times = np.maximum(np.maximum(start_times - submit_times, no_time) - queue_time_fixes, no_time)
+        run_times = np.maximum(finish_times - start_times, no_time)
+
+        retrial_counts = np.bincount(retrial_job_indexes, minlength=jobs_count)
+        completed_counts = np.bincount(retrial_job_indexes[completed], minlength=jobs_count)
+        completed_queue_times = _sum_by_job(queue_times, retrial_job_indexes, completed, jobs_count)
+        completed_run_times = _sum_by_job(run_times, retrial_job_indexes, completed, jobs_count)
+        failed_queue_times = _sum_by_job(queue_times, retrial_job_indexes, ~completed, jobs_count)
+        failed_run_times = _sum_by_job(run_times, retrial_job_indexes, ~completed, jobs_count)
+
+        for index, job_stat in enumerate(self._name_to_jobstat_dict.values()):
+            job_stat.retrial_count = int(retrial_counts[index])
+            job_stat.completed_retrial_count = int(completed_counts[index])
+            job_stat.failed_retrial_count = job_stat.retrial_count - job_stat.completed_retrial_count
+            job_stat.submit_time = _retrial_time(last_retrials[index], 0)
+            job_stat.start_time = _retrial_time(last_retrials[index], 1)
+            job_stat.finish_time = _retrial_time(last_retrials[index], 2)
+            job_stat.completed_queue_time = completed_queue_times[index].item()
+            job_stat.completed_run_time = completed_run_times[index].item()
+            job_stat.failed_queue_time = failed_queue_times[index].item()
+            job_stat.failed_run_time = failed_run_times[index].item()
+        now = datetime.now()
         self.jobs_stat = sorted(self._name_to_jobstat_dict.values(), key=lambda x: (
-            x.date if x.date else datetime.now(), x.member if x.member else "", x.section if x.section else "", x.chunk))
+            x.date if x.date else now, x.member if x.member else "", x.section if x.section else "", x.chunk))
         return self
 
     def calculate_summary(self) -> "Statistics":
         stat_summary = StatsSummary()
-        for job in self.jobs_stat:
-            job_stat_dict = job.get_as_dict()
-            # Counter
-            stat_summary.submitted_count += job_stat_dict["submittedCount"]
-            stat_summary.run_count += job_stat_dict["retrialCount"]
-            stat_summary.completed_count += job_stat_dict["completedCount"]
-            stat_summary.failed_count += job_stat_dict["failedCount"]
-            # Consumption
-            stat_summary.expected_consumption += job_stat_dict["expectedConsumption"]
-            stat_summary.real_consumption += job_stat_dict["realConsumption"]
-            stat_summary.failed_real_consumption += job_stat_dict["failedRealConsumption"]
-            # CPU Consumption
-            stat_summary.expected_cpu_consumption += job_stat_dict["expectedCpuConsumption"]
-            stat_summary.cpu_consumption += job_stat_dict["cpuConsumption"]
-            stat_summary.failed_cpu_consumption += job_stat_dict["failedCpuConsumption"]
-            stat_summary.total_queue_time += job_stat_dict["completedQueueTime"] + job_stat_dict["failedQueueTime"]
+        processors = np.array([job.processors for job in self.jobs_stat], dtype=np.int64)
+        wallclocks = np.array([job.expected_real_consumption for job in self.jobs_stat], dtype=float)
+        completed_run_times = _time_deltas(self.jobs_stat, "completed_run_time")
+        failed_run_times = _time_deltas(self.jobs_stat, "failed_run_time")
+        queue_times = (timedeltas2hours(_time_deltas(self.jobs_stat, "completed_queue_time")) +
+                       timedeltas2hours(_time_deltas(self.jobs_stat, "failed_queue_time")))
+        # Counter
+        stat_summary.submitted_count = sum(job.retrial_count for job in self.jobs_stat)
+        stat_summary.run_count = stat_summary.submitted_count
+        stat_summary.completed_count = sum(job.completed_retrial_count for job in self.jobs_stat)
+        stat_summary.failed_count = sum(job.failed_retrial_count for job in self.jobs_stat)
+        # Consumption
+        stat_summary.expected_consumption = float(wallclocks.sum())
+        stat_summary.real_consumption = float(timedeltas2hours(failed_run_times + completed_run_times).sum())
+        stat_summary.failed_real_consumption = float(timedeltas2hours(failed_run_times).sum())
+        # CPU Consumption
+        stat_summary.expected_cpu_consumption = float((wallclocks * processors).sum())
+        stat_summary.cpu_consumption = float((timedeltas2hours(processors * completed_run_times) +
+                                              timedeltas2hours(processors * failed_run_times)).sum())
+        stat_summary.failed_cpu_consumption = float(timedeltas2hours(processors * failed_run_times).sum())
+        stat_summary.total_queue_time = float(queue_times.sum())
         stat_summary.calculate_consumption_percentage()
         self.summary = stat_summary
         return self
@@ -117,37 +180,20 @@ class Statistics:
         """Make the data compatible to the old format."""
         self.start_times = [job.start_time for job in self.jobs_stat]
         self.end_times = [job.finish_time for job in self.jobs_stat]
-        self.queued = [timedelta2hours(job.completed_queue_time) for job in self.jobs_stat]
-        self.run = [timedelta2hours(job.completed_run_time) for job in self.jobs_stat]
+        queued = timedeltas2hours(_time_deltas(self.jobs_stat, "completed_queue_time"))
+        run = timedeltas2hours(_time_deltas(self.jobs_stat, "completed_run_time"))
+        fail_queued = timedeltas2hours(_time_deltas(self.jobs_stat, "failed_queue_time"))
+        fail_run = timedeltas2hours(_time_deltas(self.jobs_stat, "failed_run_time"))
+        self.queued = queued.tolist()
+        self.run = run.tolist()
         self.failed_jobs = [job.failed_retrial_count for job in self.jobs_stat]
-        if len(self.failed_jobs) == 0:
-            self.max_fail = 0
-        else:
-            self.max_fail = max(self.failed_jobs)
-        self.fail_run = [timedelta2hours(job.failed_run_time) for job in self.jobs_stat]
-        self.fail_queued = [timedelta2hours(job.failed_queue_time) for job in self.jobs_stat]
+        self.max_fail = max(self.failed_jobs, default=0)
+        self.fail_run = fail_run.tolist()
+        self.fail_queued = fail_queued.tolist()
         self.wallclocks = [job.expected_real_consumption for job in self.jobs_stat]
-        if len(self.wallclocks) == 0:
-            self.threshold = 0.0
-        else:
-            self.threshold = max(self.wallclocks)
-        if len(self.queued) == 0:
-            max_queue = 0.0
-        else:
-            max_queue = max(self.queued)
-        if len(self.run) == 0:
-            max_run = 0.0
-        else:
-            max_run = max(self.run)
-        if len(self.fail_queued) == 0:
-            max_fail_queue = 0.0
-        else:
-            max_fail_queue = max(self.fail_queued)
-        if len(self.fail_run) == 0:
-            max_fail_run = 0.0
-        else:
-            max_fail_run = max(self.fail_run)
-        self.max_time = max(max_queue, max_run, max_fail_queue, max_fail_run, self.threshold)
+        self.threshold = max(self.wallclocks, default=0.0)
+        max_times = [float(times.max(initial=0.0)) for times in (queued, run, fail_queued, fail_run)]
+        self.max_time = max(*max_times, self.threshold)
         return self
 
     def build_failed_jobs(self) -> "Statistics":
@@ -18,8 +18,11 @@
 """Utility code for the statistics package of Autosubmit."""
 
 from datetime import datetime, timedelta
+from itertools import chain
 from math import ceil
 
+import numpy as np
+
 from autosubmit.job.job import Job
 from autosubmit.log.log import AutosubmitCritical
 
@@ -38,7 +41,8 @@ def filter_by_section(jobs: list[Job], section: str | None) -> list[Job]:
     :return: List of jobs, filtered by the optional section name (``"Any"`` section is ignored).
     """
     if section and section.lower() != "any":
-        return [job for job in jobs if job.section == section]
+        sections = np.array([job.section for job in jobs], dtype=object)
+        return _select(jobs, sections == section)
     return jobs
 
 
@@ -72,12 +76,28 @@ def filter_by_time_period(jobs: list[Job], hours_span: int | None) -> tuple[list
 
     start_time = current_time - timedelta(hours=int(hours_span))
 
-    filtered_jobs = [
-        job for job in jobs
-        if job.check_started_after(start_time) or job.check_running_after(start_time)
-    ]
+    started_after = _any_after([job.check_retrials_start_time() for job in jobs], start_time)
+    running_after = _any_after([job.check_retrials_end_time() for job in jobs], start_time)
+
+    return _select(jobs, started_after | running_after), start_time, current_time
+
+
+def _select(jobs: list[Job], mask: np.ndarray) -> list[Job]:
+    """Return the jobs whose position in the boolean mask is ``True``."""
+    return [jobs[index] for index in np.flatnonzero(mask)]
+
+
+def _any_after(times_per_job: list[list[datetime]], date_limit: datetime) -> np.ndarray:
+    """Return a boolean mask of the jobs with any of their times after the date limit.
 
-    return filtered_jobs, start_time, current_time
+    :param times_per_job: The retrial times of each job.
+    :param date_limit: The reference date.
+    :return: A boolean array with one value per job.
+    """
+    counts = np.fromiter(map(len, times_per_job), dtype=np.int64, count=len(times_per_job))
+    times = np.array(list(chain.from_iterable(times_per_job)), dtype="datetime64[us]")
+    job_indexes = np.repeat(np.arange(len(times_per_job)), counts)
+    return np.bincount(job_indexes[times > np.datetime64(date_limit, "us")], minlength=len(times_per_job)) > 0
 
 
 def timedelta2hours(delta_time: timedelta) -> float:
@@ -94,6 +114,19 @@ def timedelta2hours(delta_time: timedelta) -> float:
     return delta_time.days * 24 + delta_time.seconds / 3600.0
 
 
+def timedeltas2hours(delta_times: np.ndarray) -> np.ndarray:
+    """Convert an array of NumPy time deltas to numbers of hours.
+
+    The vectorized version of :func:`timedelta2hours`, it returns exactly
+    the same values, ignoring the microseconds too.
+
+    :param delta_times: A ``timedelta64`` NumPy array.
+    :return: A float array with the time in hours.
+    """
+    seconds = delta_times.astype("timedelta64[s]").astype(np.int64)
+    return (seconds // 86400) * 24 + (seconds % 86400) / 3600.0
+
+
 def parse_number_processors(processors: str) -> int:
     """Parse the number of processors.
 
@@ -14,6 +14,7 @@
 #
 # You should have received a copy of the GNU General Public License
 # along with Autosubmit.  If not, see <http://www.gnu.org/licenses/>.
+import time
 from pathlib import Path
 from typing import Any
 
@@ -23,7 +24,7 @@ from ruamel.yaml import YAML
 from autosubmit.config.basicconfig import BasicConfig
 from autosubmit.config.yamlparser import YAMLParserFactory
 from autosubmit.database.db_manager_job_list import JobsDbManager
-from autosubmit.database.tables import WrapperJobsTable
+from autosubmit.database.tables import JobsTable, WrapperJobsTable
 from autosubmit.job.job import Job
 from autosubmit.job.job_list import JobList
 
@@ -1337,6 +1338,57 @@ def test_with_createcw_command_differences(
     assert len(unexpected_in_db) == 0, f"Unexpected jobs in DB: {unexpected_in_db}"
 
 
+@pytest.mark.parametrize(
+    "changed_jobs",
+    [
+        pytest.param({"INI": {"RUNNING": "date"}}, id="first_section"),
+        pytest.param({"SIM": {"SPLITS": 2}}, id="middle_section"),
+        pytest.param({"POST": {"DEPENDENCIES": {"SIM": {}}}}, id="dependencies"),
+        pytest.param({"INI": {"RUNNING": "chunk", "DEPENDENCIES": {"POST-1": {}}}}, id="transitive_dependents"),
+    ]
+)
+def test_regenerated_edges_match_full_generation(autosubmit_exp: Any, changed_jobs: dict[str, Any]) -> None:
+    """Regenerating the edges of the changed sections and their dependents gives the full generation edges.
+
+    :param autosubmit_exp: Fixture to create an experiment.
+    :param changed_jobs: Options that change in each job section.
+    """
+    experiment_data = {
+        'EXPERIMENT': {
+            'DATELIST': '20000101 20010101',
+            'MEMBERS': 'fc0 fc1',
+            'CHUNKSIZEUNIT': 'month',
+            'CHUNKSIZE': '4',
+            'NUMCHUNKS': '3',
+            'CHUNKINI': '',
+            'CALENDAR': 'standard',
+        },
+        'JOBS': {
+            'INI': {'SCRIPT': 'echo "Hello World"', 'RUNNING': 'member'},
+            'SIM': {'SCRIPT': 'echo "Hello World"', 'RUNNING': 'chunk', 'DEPENDENCIES': {'INI': {}, 'SIM-1': {}}},
+            'POST': {'SCRIPT': 'echo "Hello World"', 'RUNNING': 'chunk', 'DEPENDENCIES': {'SIM': {}, 'POST-1': {}}},
+            'CLEAN': {'SCRIPT': 'echo "Hello World"', 'RUNNING': 'member', 'DEPENDENCIES': {'POST': {}}},
+            'REPORT': {'SCRIPT': 'echo "Hello World"', 'RUNNING': 'once', 'DEPENDENCIES': {'CLEAN': {}}},
+        },
+    }
+    as_exp = autosubmit_exp(experiment_data=experiment_data)
+    for section, options in changed_jobs.items():
+        experiment_data['JOBS'][section].update(options)
+    with open(as_exp.exp_path / 'conf' / 'additional_data.yml', 'w') as fh:
+        YAML().dump(experiment_data, fh)
+    db_manager = _create_db_manager(schema=as_exp.expid)
+
+    def _edges() -> set[tuple[str, str, str, int]]:
+        return {(edge['e_from'], edge['e_to'], edge['min_trigger_status'], edge['from_step'])
+                for edge in db_manager.select_edges()}
+
+    _assert_exit_code("SUCCESS", as_exp.autosubmit.create(as_exp.expid, noplot=True, hide=False, force=False))
+    regenerated_edges = _edges()
+    _assert_exit_code("SUCCESS", as_exp.autosubmit.create(as_exp.expid, noplot=True, hide=False, force=True))
+
+    assert regenerated_edges == _edges()
+
+
 def _wrapper_info(name: str, id: int, status: int = 1, **overrides) -> dict[str, Any]:
     """Helper to build a wrapper_info dict with defaults matching WrapperInfoTable."""
     info = {
@@ -1512,3 +1564,38 @@ def test_save_wrappers_integrity_error_logged(
     info, jobs = db_manager.load_wrappers(preview=False)
     assert len(info) == 1
     assert len(jobs) == 1
+
+
+@pytest.mark.profile
+def test_select_children_jobs_benchmark(tmp_path: Path, mocker):
+    """Benchmark ``select_children_jobs`` on a synthetic experiment with 100k edges.
+
+    Every parent has ``fan_out`` children and every child has two parents, one of them
+    loaded in memory as ``COMPLETED`` and the other ``COMPLETED`` in the database only.
+    """
+    parents, fan_out = 1_000, 50
+    mocker.patch("autosubmit.config.basicconfig.BasicConfig.LOCAL_ROOT_DIR", str(tmp_path))
+    db_manager = _create_db_manager(schema="t000")
+    db_manager.create_table(JobsTable.name)
+
+    jobs = [{"name": f"parent_{i}", "status": "COMPLETED", "fail_count": 0} for i in range(parents)]
+    jobs += [{"name": f"extra_{i}", "status": "COMPLETED", "fail_count": 0} for i in range(parents)]
+    jobs += [{"name": f"child_{i}_{j}", "status": "WAITING", "fail_count": 0}
+             for i in range(parents) for j in range(fan_out)]
+    db_manager.upsert_many(JobsTable.name, jobs, ["name"])
+    edge = {"min_trigger_status": "COMPLETED", "completion_status": "WAITING", "from_step": 0, "fail_ok": False}
+    edges = []
+    for i in range(parents):
+        for j in range(fan_out):
+            edges.append({"e_from": f"parent_{i}", "e_to": f"child_{i}_{j}", **edge})
+            edges.append({"e_from": f"extra_{i}", "e_to": f"child_{i}_{j}", **edge})
+    db_manager.save_edges(edges)
+    assert len(edges) == 100_000
+
+    job_list = [(("name", f"parent_{i}"), ("status", "COMPLETED")) for i in range(parents)]
+    start = time.perf_counter()
+    result = db_manager.select_children_jobs(list(job_list))
+    elapsed = time.perf_counter() - start
+
+    assert len(result) == parents + parents * fan_out
+    assert elapsed < 30, f"select_children_jobs took {elapsed:.3f}s for {len(edges)} edges"
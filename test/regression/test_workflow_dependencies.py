@@ -8,6 +8,7 @@ from typing import Any
 import pytest
 
 from autosubmit.config.basicconfig import BasicConfig
+from autosubmit.job.job_list import JobList
 from test.regression.utils.common import create_database, init_expid
 
 PROFILE = False  # Enable/disable profiling ( speed up the tests )
@@ -232,9 +233,10 @@ def get_workflow_folder() -> list[str]:
     return sorted([f.name for f in Path(workflow_dir).iterdir() if f.is_dir() and "pycache" not in f.name])
 
 
+@pytest.mark.parametrize("graph_generation_processes", [1, 4], ids=["serial", "parallel"])
 @pytest.mark.parametrize("expid", get_workflow_folder())
-def test_workflows_dependencies(prepare_workflow_runs: Any, expid: str, current_tmpdir: Path, mocker: Any,
-                                prepare_basic_config: Any) -> None:
+def test_workflows_dependencies(prepare_workflow_runs: Any, expid: str, graph_generation_processes: int,
+                                current_tmpdir: Path, mocker: Any, prepare_basic_config: Any) -> None:
     """
     Compare current workflow dependencies with the reference ones.
 
@@ -242,6 +244,8 @@ def test_workflows_dependencies(prepare_workflow_runs: Any, expid: str, current_
     :type prepare_workflow_runs: Any
     :param expid: Experiment ID.
     :type expid: str
+    :param graph_generation_processes: Number of processes used to add the dependencies.
+    :type graph_generation_processes: int
     :param current_tmpdir: Temporary directory for the current test.
     :type current_tmpdir: Path
     :param mocker: Mocking object for patching.
@@ -263,6 +267,9 @@ def test_workflows_dependencies(prepare_workflow_runs: Any, expid: str, current_
     mocker.patch.object(BasicConfig, 'read', return_value=True)
     if PROFILE:
         profiler.enable()
+    if graph_generation_processes > 1:
+        Path(f"{current_tmpdir}/workflows/{expid}/conf/graph_generation.yml").write_text(
+            f"CONFIG:\n  GRAPH_GENERATION_PROCESSES: {graph_generation_processes}\n")
 
     init_expid(os.environ["AUTOSUBMIT_CONFIGURATION"], platform='local', expid=expid, full_load=True, test_type='test')
 
@@ -309,3 +316,93 @@ def test_workflows_dependencies(prepare_workflow_runs: Any, expid: str, current_
     if PROFILE:
         stats = pstats.Stats(profiler).sort_stats('cumtime')
         stats.print_stats()
+
+
+@pytest.mark.parametrize("expid", ["frequency", "splits", "auto-monarch-op1", "DestinE-end-to-end-new-minimal"])
+def test_parallel_graph_generation_matches_serial(prepare_workflow_runs: Any, expid: str, current_tmpdir: Path,
+                                                  mocker: Any, prepare_basic_config: Any) -> None:
+    """Adding the dependencies with a pool of processes changes the jobs as adding them with one process.
+
+    :param prepare_workflow_runs: Fixture to prepare workflow runs.
+    :param expid: Experiment ID.
+    :param current_tmpdir: Temporary directory for the current test.
+    :param mocker: Mocking object for patching.
+    :param prepare_basic_config: Fixture to prepare basic configuration.
+    """
+    generated = []
+    add_dependencies = JobList._add_dependencies
+
+    def add_dependencies_and_keep_jobs(job_list: JobList, *args: Any, **kwargs: Any) -> None:
+        add_dependencies(job_list, *args, **kwargs)
+        generated.append({
+            name: (sorted((parent, sorted(edge_data.items()))
+                          for parent, _, edge_data in job_list.graph.in_edges(name, data=True)),
+                   sorted(parent.name for parent in job.parents), str(job.splits))
+            for name, job in job_list.graph.nodes(data='job')
+        })
+
+    mocker.patch.object(BasicConfig, 'read', return_value=True)
+    mocker.patch.object(JobList, '_add_dependencies', add_dependencies_and_keep_jobs)
+    init_expid(os.environ["AUTOSUBMIT_CONFIGURATION"], platform='local', expid=expid, full_load=True, test_type='test')
+    Path(f"{current_tmpdir}/workflows/{expid}/conf/graph_generation.yml").write_text(
+        "CONFIG:\n  GRAPH_GENERATION_PROCESSES: 4\n")
+    init_expid(os.environ["AUTOSUBMIT_CONFIGURATION"], platform='local', expid=expid, full_load=True, test_type='test')
+
+    serial, parallel = generated
+    assert parallel == serial
+
+
+def test_parallel_graph_generation_keeps_the_parents_added_by_frequency(
+        prepare_workflow_runs: Any, current_tmpdir: Path, mocker: Any, prepare_basic_config: Any) -> None:
+    """The parents added by ``handle_frequency_interval_dependencies`` in a worker are added to the jobs.
+
+    The workers run in this process, so the frequency of the ``POSTPROCESS`` jobs can be patched.
+
+    :param prepare_workflow_runs: Fixture to prepare workflow runs.
+    :param current_tmpdir: Temporary directory for the current test.
+    :param mocker: Mocking object for patching.
+    :param prepare_basic_config: Fixture to prepare basic configuration.
+    """
+    class InlinePool:
+        def __init__(self, max_workers: int, mp_context: Any, initializer: Any, initargs: tuple) -> None:
+            initializer(*initargs)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *args: object) -> None:
+            pass
+
+        def map(self, function: Any, iterable: Any) -> Any:
+            return map(function, iterable)
+
+    generated = []
+    add_dependencies = JobList._add_dependencies
+    handle_frequency_interval_dependencies = JobList.handle_frequency_interval_dependencies
+
+    def add_dependencies_and_keep_parents(job_list: JobList, *args: Any, **kwargs: Any) -> None:
+        add_dependencies(job_list, *args, **kwargs)
+        generated.append({name: sorted(parent.name for parent in job.parents)
+                          for name, job in job_list.graph.nodes(data='job')})
+
+    def handle_with_frequency(chunk: Any, chunk_list: Any, date: Any, date_list: Any, dic_jobs: Any, job: Any,
+                              *args: Any) -> None:
+        if job.section == "POSTPROCESS":
+            job.frequency = 3
+        handle_frequency_interval_dependencies(chunk, chunk_list, date, date_list, dic_jobs, job, *args)
+
+    mocker.patch.object(BasicConfig, 'read', return_value=True)
+    mocker.patch.object(JobList, '_add_dependencies', add_dependencies_and_keep_parents)
+    mocker.patch.object(JobList, 'handle_frequency_interval_dependencies', staticmethod(handle_with_frequency))
+    mocker.patch('autosubmit.job.job_list.ProcessPoolExecutor', InlinePool)
+    init_expid(os.environ["AUTOSUBMIT_CONFIGURATION"], platform='local', expid="frequency", full_load=True,
+               test_type='test')
+    Path(f"{current_tmpdir}/workflows/frequency/conf/graph_generation.yml").write_text(
+        "CONFIG:\n  GRAPH_GENERATION_PROCESSES: 4\n")
+    init_expid(os.environ["AUTOSUBMIT_CONFIGURATION"], platform='local', expid="frequency", full_load=True,
+               test_type='test')
+
+    serial, parallel = generated
+    assert serial["a005_19900101_Member1_3_POSTPROCESS"] == ["a005_19900101_Member1_1_SIM",
+                                                            "a005_19900101_Member1_2_SIM"]
+    assert parallel == serial
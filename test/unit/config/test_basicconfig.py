@@ -50,6 +50,7 @@ def test_read_file_config(tmp_path):
     path = {tmp_path}
     [historicdb]
     path = {tmp_path}
+    backup_interval = 120
     [historiclog]
     path = {tmp_path}
     [autosubmitapi]
@@ -78,6 +79,7 @@ def test_read_file_config(tmp_path):
     assert BasicConfig.GLOBAL_LOG_DIR == f'{tmp_path}'
     assert BasicConfig.HISTORICAL_LOG_DIR == f'{tmp_path}'
     assert BasicConfig.JOBDATA_DIR == f'{tmp_path}'
+    assert BasicConfig.JOBDATA_BACKUP_INTERVAL == 120
     assert BasicConfig.LOCAL_ASLOG_DIR == 'ASLOGS'
     assert BasicConfig.LOCAL_PROJ_DIR == 'proj'
     assert BasicConfig.LOCAL_ROOT_DIR == f'{tmp_path}'
@@ -23,3 +23,32 @@ def test_load_parameters(autosubmit_config):
                                     'M': '%M%', 'M_': '%M_%', 'm': '%m%', 'm_': '%m_%'})
     parameters = as_conf.load_parameters()
     assert parameters['VAR.DEEP_VAR'] == ['%NOTFOUND%', '%TEST%', '%TEST2%']
+
+
+def test_load_parameters_snapshot_shared_per_generation(autosubmit_config, mocker):
+    as_conf = autosubmit_config(expid='a000', experiment_data={'VAR': {'DEEP_VAR': 'value'}})
+    load_database_parameters = mocker.spy(as_conf, '_load_database_parameters')
+
+    parameters = as_conf.load_parameters()
+    parameters['JOBNAME'] = 'a000_SIM'
+    parameters['VAR.DEEP_VAR'] = 'job value'
+    other_parameters = as_conf.load_parameters()
+
+    # The database is queried, and the data flattened, once per generation
+    assert load_database_parameters.call_count == 1
+    assert other_parameters['VAR.DEEP_VAR'] == 'value'
+    assert 'JOBNAME' not in other_parameters
+    assert as_conf.parameters_snapshot['DEFAULT.DESCRIPTION'] == 'test experiment'
+
+    generation = as_conf.parameters_generation
+    as_conf.experiment_data['VAR']['DEEP_VAR'] = 'new value'
+    assert as_conf.load_parameters()['VAR.DEEP_VAR'] == 'value'
+
+    as_conf.invalidate_parameters()
+    assert as_conf.parameters_generation == generation + 1
+    assert as_conf.load_parameters()['VAR.DEEP_VAR'] == 'new value'
+    assert load_database_parameters.call_count == 2
+
+    as_conf.experiment_data = {'VAR': {'DEEP_VAR': 'reloaded value'}}
+    assert as_conf.load_parameters()['VAR.DEEP_VAR'] == 'reloaded value'
+    assert load_database_parameters.call_count == 3
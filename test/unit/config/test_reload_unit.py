@@ -15,6 +15,7 @@
 # You should have received a copy of the GNU General Public License
 # along with Autosubmit.  If not, see <http://www.gnu.org/licenses/>.
 
+import os
 import time
 from pathlib import Path
 
@@ -92,3 +93,21 @@ def test_needs_reload(autosubmit_config, tmpdir, current_loaded_files, reload_wh
         as_conf.experiment_data["CONFIG"]["RELOAD_WHILE_RUNNING"] = False
 
     assert as_conf.needs_reload() == expected_result
+
+
+def test_needs_reload_checks_files_once_per_interval(autosubmit_config, mocker):
+    as_conf = autosubmit_config(expid='a000', experiment_data={})
+    conf_file = Path(as_conf.basic_config.LOCAL_ROOT_DIR) / as_conf.expid / 'conf' / 'test.yml'
+    conf_file.write_text('VAR: 1')
+    as_conf.current_loaded_files = {str(conf_file): time.time() + 1000}
+    getmtime = mocker.spy(os.path, 'getmtime')
+
+    assert not as_conf.needs_reload()
+    assert not as_conf.needs_reload()
+    assert getmtime.call_count == 1
+
+    # Modifying the experiment data forces a new check
+    as_conf.invalidate_parameters()
+    as_conf.current_loaded_files[str(conf_file)] = time.time() - 1000
+    assert as_conf.needs_reload()
+    assert getmtime.call_count == 2
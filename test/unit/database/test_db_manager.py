@@ -20,6 +20,7 @@ from contextlib import nullcontext as does_not_raise
 
 import pytest
 
+from autosubmit.database import db_manager as db_manager_module
 from autosubmit.database.db_manager import DbManager
 from autosubmit.database.session import get_engine
 from autosubmit.database.tables import ExperimentTable
@@ -40,3 +41,23 @@ def test_delete_where_raises_empty_data():
     db_manager = DbManager(db_path=':memory:', schema='abc')
     with pytest.raises(ValueError):
         db_manager.delete_where(ExperimentTable.name, {})
+
+
+def test_create_table_once_per_manager(tmp_path, mocker):
+    """Tables are only created, and checked for missing columns, the first time."""
+    db_manager = DbManager(db_path=str(tmp_path / 'test.db'))
+    inspect = mocker.patch('autosubmit.database.db_manager.inspect', wraps=db_manager_module.inspect)
+
+    db_manager.create_table(ExperimentTable.name)
+    db_manager.create_table(ExperimentTable.name)
+    assert inspect.call_count == 1
+
+    db_manager.drop_table(ExperimentTable.name)
+    db_manager.create_table(ExperimentTable.name)
+    assert inspect.call_count == 2
+    db_manager.insert(ExperimentTable.name, {'name': 'a000', 'description': 'test'})
+
+    db_manager.reset_created_tables()
+    db_manager.create_table(ExperimentTable.name)
+    assert inspect.call_count == 3
+    assert db_manager.count(ExperimentTable.name) == 1
@@ -15,11 +15,27 @@
 # You should have received a copy of the GNU General Public License
 # along with Autosubmit.  If not, see <http://www.gnu.org/licenses/>.
 
+from collections import OrderedDict
 from typing import Union
 
 import pytest
+from sqlalchemy import text
 
-from autosubmit.database.session import _resolve_engine, get_engine
+from autosubmit.database import session
+from autosubmit.database.session import (
+    SQLiteEngineRegistry,
+    _resolve_engine,
+    get_engine,
+)
+
+
+@pytest.fixture
+def sqlite_engines(mocker):
+    """Use the SQLite backend with an empty engine registry."""
+    mocker.patch("autosubmit.config.basicconfig.BasicConfig.DATABASE_BACKEND", "sqlite")
+    mocker.patch.object(SQLiteEngineRegistry, "_engines", OrderedDict())
+    yield SQLiteEngineRegistry._engines
+    SQLiteEngineRegistry.dispose()
 
 
 @pytest.mark.parametrize(
@@ -65,3 +81,69 @@ def test_get_engine_unsupported_backend(mocker):
     )
     with pytest.raises(ValueError):
         get_engine(db_path="dummy_path")
+
+
+def test_get_engine_sqlite_reuses_engine_per_database(sqlite_engines, tmp_path):
+    engine = get_engine(db_path=tmp_path / "db" / "a.db")
+    assert (tmp_path / "db" / "a.db").exists()
+    assert get_engine(db_path=str(tmp_path / "db" / "a.db")) is engine
+    assert get_engine(db_path=tmp_path / "b.db") is not engine
+
+    with engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "delete"
+        assert conn.execute(text("PRAGMA busy_timeout")).scalar() == session.SQLITE_BUSY_TIMEOUT
+
+
+def test_get_engine_sqlite_sets_configured_journal_mode(sqlite_engines, tmp_path, mocker):
+    mocker.patch("autosubmit.config.basicconfig.BasicConfig.DATABASE_JOURNAL_MODE", "wal")
+    with get_engine(db_path=tmp_path / "a.db").connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert conn.execute(text("PRAGMA synchronous")).scalar() == 1
+
+
+def test_get_engine_sqlite_keeps_journal_mode(sqlite_engines, tmp_path, mocker):
+    mocker.patch("autosubmit.config.basicconfig.BasicConfig.DATABASE_JOURNAL_MODE", "WAL")
+    with get_engine(db_path=tmp_path / "a.db").connect() as conn:
+        conn.execute(text("SELECT 1"))
+    SQLiteEngineRegistry.dispose()
+
+    mocker.patch("autosubmit.config.basicconfig.BasicConfig.DATABASE_JOURNAL_MODE", "")
+    with get_engine(db_path=tmp_path / "a.db").connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+
+
+def test_get_engine_sqlite_rejects_invalid_journal_mode(sqlite_engines, tmp_path, mocker):
+    mocker.patch("autosubmit.config.basicconfig.BasicConfig.DATABASE_JOURNAL_MODE",
+                 "WAL; DROP TABLE job_list")
+    with pytest.raises(ValueError), get_engine(db_path=tmp_path / "a.db").connect():
+        pass
+
+
+def test_get_engine_sqlite_recreates_deleted_database(sqlite_engines, tmp_path):
+    db_path = tmp_path / "a.db"
+    engine = get_engine(db_path=db_path)
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE t (c INTEGER)"))
+    db_path.unlink()
+
+    new_engine = get_engine(db_path=db_path)
+    assert new_engine is not engine
+    assert db_path.exists()
+    with new_engine.connect() as conn:
+        assert conn.execute(text("SELECT count(*) FROM sqlite_master")).scalar() == 0
+
+
+def test_get_engine_sqlite_forked_process(sqlite_engines, tmp_path, mocker):
+    engine = get_engine(db_path=tmp_path / "a.db")
+    mocker.patch.object(SQLiteEngineRegistry, "_pid", -1)
+    assert get_engine(db_path=tmp_path / "a.db") is not engine
+
+
+def test_get_engine_sqlite_disposes_least_recently_used(sqlite_engines, tmp_path, mocker):
+    mocker.patch.object(session, "SQLITE_ENGINES_LIMIT", 2)
+    first = get_engine(db_path=tmp_path / "a.db")
+    get_engine(db_path=tmp_path / "b.db")
+    assert get_engine(db_path=tmp_path / "a.db") is first
+    get_engine(db_path=tmp_path / "c.db")
+
+    assert list(sqlite_engines) == [str(tmp_path / "a.db"), str(tmp_path / "c.db")]
@@ -0,0 +1,163 @@
+# Copyright 2015-2025 Earth Sciences Department, BSC-CNS
+#
+# This file is part of Autosubmit.
+#
+# Autosubmit is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Autosubmit is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Autosubmit.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Tests for the background backup of the historical database."""
+
+import sqlite3
+import threading
+from contextlib import closing
+from pathlib import Path
+
+from autosubmit.config.basicconfig import BasicConfig
+from autosubmit.history.database_backup import HistoricalDatabaseBackup, _RestartCounter
+
+
+def _create_database(path: Path, rows: int) -> None:
+    with closing(sqlite3.connect(path)) as conn:
+        conn.execute("CREATE TABLE IF NOT EXISTS job_data (id INTEGER PRIMARY KEY, job_name TEXT)")
+        conn.executemany("INSERT INTO job_data (job_name) VALUES (?)", [(f"job_{i}",) for i in range(rows)])
+        conn.commit()
+
+
+def _count_rows(path: Path) -> int:
+    with closing(sqlite3.connect(path)) as conn:
+        return conn.execute("SELECT COUNT(*) FROM job_data").fetchone()[0]
+
+
+def test_backup_is_rate_limited(tmp_path):
+    """A new backup is only written after the interval, unless it is forced."""
+    database_path = tmp_path / "job_data_a000.db"
+    backup_path = tmp_path / "job_data_a000.db.bak"
+    _create_database(database_path, 10)
+    backup = HistoricalDatabaseBackup(database_path, backup_path, interval=3600)
+
+    assert backup.request()
+    backup.wait()
+    assert _count_rows(backup_path) == 10
+    assert not backup_path.with_name(f"{backup_path.name}.tmp").exists()
+
+    _create_database(database_path, 5)
+    assert not backup.request()
+    backup.wait()
+    assert _count_rows(backup_path) == 10
+
+    assert backup.request(force=True)
+    backup.wait()
+    assert _count_rows(backup_path) == 15
+
+
+def test_forced_backup_is_queued_while_running(tmp_path, mocker):
+    """A forced backup requested during a running one is written after it, with the latest changes."""
+    database_path = tmp_path / "job_data_a000.db"
+    backup_path = tmp_path / "job_data_a000.db.bak"
+    _create_database(database_path, 10)
+    backup = HistoricalDatabaseBackup(database_path, backup_path, interval=3600)
+    written, release = threading.Event(), threading.Event()
+    write_backup = backup._backup
+
+    def _blocking_backup() -> None:
+        write_backup()
+        written.set()
+        release.wait()
+
+    mocker.patch.object(backup, "_backup", side_effect=_blocking_backup)
+
+    assert backup.request()
+    written.wait()
+    assert _count_rows(backup_path) == 10
+    _create_database(database_path, 5)
+    assert not backup.request()
+    assert backup.request(force=True)
+    release.set()
+    backup.wait()
+
+    assert backup._backup.call_count == 2
+    assert _count_rows(backup_path) == 15
+    assert not backup.running
+
+
+def test_backup_of_missing_database(tmp_path):
+    """Nothing is written when the historical database does not exist."""
+    backup_path = tmp_path / "job_data_a000.db.bak"
+    backup = HistoricalDatabaseBackup(tmp_path / "job_data_a000.db", backup_path, interval=0)
+
+    assert backup.request()
+    backup.wait()
+    assert not backup_path.exists()
+
+
+def test_for_experiment_returns_shared_instance(tmp_path, monkeypatch):
+    """Every caller of an experiment shares the same backup, and its rate limit."""
+    monkeypatch.setattr(BasicConfig, "JOBDATA_DIR", str(tmp_path))
+    monkeypatch.setattr(BasicConfig, "JOBDATA_BACKUP_INTERVAL", 42)
+    monkeypatch.setattr(HistoricalDatabaseBackup, "_instances", {})
+
+    backup = HistoricalDatabaseBackup.for_experiment("a000")
+
+    assert backup is HistoricalDatabaseBackup.for_experiment("a000")
+    assert backup is not HistoricalDatabaseBackup.for_experiment("a001")
+    assert backup.database_path == tmp_path / "job_data_a000.db"
+    assert backup.backup_path == tmp_path / "job_data_a000.db.bak"
+    assert backup.interval == 42
+
+
+def test_backup_in_steps_does_not_block_writers(tmp_path, mocker):
+    """A writer can commit between two steps of the copy, and the backup includes its changes."""
+    database_path = tmp_path / "job_data_a000.db"
+    backup_path = tmp_path / "job_data_a000.db.bak"
+    _create_database(database_path, 2000)
+    mocker.patch("autosubmit.history.database_backup.BACKUP_PAGES_PER_STEP", 1)
+    log_debug = mocker.patch("autosubmit.history.database_backup.Log.debug")
+    backup = HistoricalDatabaseBackup(database_path, backup_path, interval=0)
+    restart_counter = _RestartCounter.__call__
+
+    with closing(sqlite3.connect(database_path, timeout=0)) as writer:
+        def _write_after_first_step(counter, *args) -> None:
+            if counter._remaining is None:
+                writer.execute("INSERT INTO job_data (job_name) VALUES ('written_during_backup')")
+                writer.commit()
+            restart_counter(counter, *args)
+
+        mocker.patch.object(_RestartCounter, "__call__", _write_after_first_step)
+        backup._backup()
+
+    assert _count_rows(backup_path) == 2001
+    assert "Jobs_data database backup completed." in [call.args[0] for call in log_debug.call_args_list]
+    assert not any("one step" in call.args[0] for call in log_debug.call_args_list)
+
+
+def test_backup_restarted_too_many_times_is_copied_in_one_step(tmp_path, mocker):
+    """A copy in steps that keeps starting over is finished in a single step."""
+    database_path = tmp_path / "job_data_a000.db"
+    backup_path = tmp_path / "job_data_a000.db.bak"
+    _create_database(database_path, 2000)
+    mocker.patch("autosubmit.history.database_backup.BACKUP_PAGES_PER_STEP", 1)
+    log_debug = mocker.patch("autosubmit.history.database_backup.Log.debug")
+    backup = HistoricalDatabaseBackup(database_path, backup_path, interval=0)
+    restart_counter = _RestartCounter.__call__
+
+    with closing(sqlite3.connect(database_path, timeout=0)) as writer:
+        def _write_between_steps(counter, *args) -> None:
+            writer.execute("INSERT INTO job_data (job_name) VALUES ('written_during_backup')")
+            writer.commit()
+            restart_counter(counter, *args)
+
+        mocker.patch.object(_RestartCounter, "__call__", _write_between_steps)
+        backup._backup()
+
+    assert any("one step" in call.args[0] for call in log_debug.call_args_list)
+    assert _count_rows(backup_path) == _count_rows(database_path)
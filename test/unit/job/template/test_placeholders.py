@@ -0,0 +1,120 @@
+# Copyright 2015-2025 Earth Sciences Department, BSC-CNS
+#
+# This file is part of Autosubmit.
+#
+# Autosubmit is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Autosubmit is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Autosubmit.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Unit tests for the placeholders of the job templates."""
+
+import os
+
+import pytest
+
+from autosubmit.job.template.placeholders import (
+    CompiledTemplate,
+    compile_template,
+    compile_template_file,
+    read_template_file,
+)
+
+_PARAMETERS = {
+    'JOBNAME': 'a000_SIM',
+    'CHUNK': 1,
+    'DEFAULT.EXPID': 'a000',
+    'PATH': 'C:\\data\\file.nc',
+    'EMPTY': '',
+    'FORMAT': '%%Y%%m%%d',
+}
+
+
+@pytest.mark.parametrize(
+    'content,expected',
+    [
+        ('echo %JOBNAME%', 'echo a000_SIM'),
+        ('echo %jobname% %JobName%', 'echo a000_SIM a000_SIM'),
+        ('%DEFAULT.EXPID%_%CHUNK%', 'a000_1'),
+        ('echo %UNDEFINED%%EMPTY%.', 'echo %EMPTY%.'),
+        ('echo %UNDEFINED% %EMPTY%.', 'echo  .'),
+        ('echo %%JOBNAME%%', 'echo %JOBNAME%'),
+        ('date +%%Y%%m%%d', 'date +%Y%m%d'),
+        ('printf "100%%"', 'printf "100%"'),
+        ('copy %PATH%', 'copy C:\\data\\file.nc'),
+        ('date +%FORMAT% +%%H', 'date +%%Y%%m%%d +%H'),
+        ('no placeholders', 'no placeholders'),
+        ('', ''),
+    ],
+    ids=[
+        'placeholder',
+        'case insensitive',
+        'dotted keys and numbers',
+        'escaped adjacent placeholder',
+        'undefined and empty are removed',
+        'escaped placeholder',
+        'escaped date format',
+        'escaped percent',
+        'backslashes',
+        'values are not unescaped',
+        'no placeholders',
+        'empty',
+    ]
+)
+def test_render(content: str, expected: str):
+    assert CompiledTemplate(content).render(_PARAMETERS) == expected
+
+
+def test_render_keeps_placeholders():
+    template = CompiledTemplate('date %Y%%m% %JOBNAME% %d%')
+
+    assert template.variables == ['Y', 'JOBNAME', 'd']
+    assert template.placeholders == ('%Y%', '%JOBNAME%', '%d%')
+    assert template.render(_PARAMETERS, keep=['%Y%', '%d%']) == 'date %Y%%m% a000_SIM %d%'
+
+
+def test_compile_template_is_cached():
+    content = 'echo %JOBNAME%'
+
+    assert compile_template(content) is compile_template(content.encode().decode())
+
+
+def test_compile_template_file(tmp_path):
+    template_file = tmp_path / 'template.sh'
+    template_file.write_text('echo %JOBNAME% 100%%')
+
+    template = compile_template_file(template_file)
+    assert template.render(_PARAMETERS) == 'echo a000_SIM 100%'
+    assert compile_template_file(str(template_file)) is template
+    assert compile_template_file(template_file, str.upper).render(_PARAMETERS) == 'ECHO a000_SIM 100%'
+
+    # A modified file is parsed again
+    template_file.write_text('echo %CHUNK%')
+    os.utime(template_file, ns=(1, 1))
+    assert compile_template_file(template_file).render(_PARAMETERS) == 'echo 1'
+
+    with pytest.raises(OSError):
+        compile_template_file(tmp_path / 'missing.sh')
+
+
+def test_read_template_file(tmp_path):
+    template_file = tmp_path / 'template.sh'
+    template_file.write_text('echo %JOBNAME%')
+
+    assert read_template_file(template_file) == 'echo %JOBNAME%'
+
+    # A modified file is read again
+    template_file.write_text('echo %CHUNK%')
+    os.utime(template_file, ns=(1, 1))
+    assert read_template_file(str(template_file)) == 'echo %CHUNK%'
+
+    with pytest.raises(OSError):
+        read_template_file(tmp_path / 'missing.sh')
@@ -16,6 +16,8 @@
 # along with Autosubmit.  If not, see <http://www.gnu.org/licenses/>.
 
 
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from unittest.mock import MagicMock
 
 import pytest
@@ -270,7 +272,7 @@ def test_job_package_generate_scripts(mocker, local, tmp_path, error, target_fun
 
         mock_clean_previous_run.assert_called_once()
         mock_check_job_files_exists.assert_called_once_with(configuration, False)
-        mock_build_scripts.assert_called_once_with(configuration)
+        mock_build_scripts.assert_called_once_with(configuration, None)
 
 
 def test_check_job_files_exists_no_additional_job_skip_check(local, mocker, tmp_path, jobs):
@@ -323,6 +325,28 @@ def test_job_package_send_files_uses_current_public_api(mocker, local, tmp_path)
     ]
 
 
+def test_job_package_get_files_to_send(local, tmp_path) -> None:
+    """The scripts and the additional files of the jobs are sent, in the order of the jobs."""
+    jobs = [
+        Job("a000_job1", "1", Status.READY, 0),
+        Job("a000_job2", "2", Status.READY, 0),
+    ]
+    for job in jobs:
+        job.platform = local
+        job.wallclock = '00:05'
+        job._tmp_path = tmp_path
+        job.additional_files = []
+    jobs[0].additional_files = ["templates/extra.inp"]
+
+    job_package = JobPackageSimple(jobs)
+    job_package._job_scripts = {
+        "a000_job1": "a000_job1.cmd",
+        "a000_job2": "a000_job2.cmd",
+    }
+
+    assert job_package.get_files_to_send() == ["a000_job1.cmd", "extra_job1", "a000_job2.cmd"]
+
+
 def test_build_scripts_with_empty_variables_warning(jobs, mocker):
     """Test that building scripts that contain empty variables show a warning to users."""
     jobs = jobs[0:1]
@@ -330,6 +354,7 @@ def test_build_scripts_with_empty_variables_warning(jobs, mocker):
     job_package = JobPackageSimple(jobs)
     mocked_log = mocker.patch('autosubmit.job.job_packages.Log')
     with (
+        mocker.patch.object(Job, "render_script"),
         mocker.patch.object(Job, "check_script", return_value=False),
         mocker.patch.object(job_package, "_create_scripts", return_value=None)
     ):
@@ -339,6 +364,61 @@ def test_build_scripts_with_empty_variables_warning(jobs, mocker):
     assert f'Job {jobs[0].name} script or file has empty variables' in mocked_log.warning.call_args[0][0]
         
 
+def test_build_scripts_renders_each_script_once(jobs, as_conf, mocker):
+    """Test that the script of each job is rendered once, for both the check and the creation of the script."""
+    as_conf.experiment_data['JOBS']['SIM'] = {}
+    for job in jobs:
+        job.section = 'SIM'
+        job.script = 'echo %JOBNAME% %UNDEFINED_VARIABLE%'
+        Path(job._tmp_path).mkdir(parents=True, exist_ok=True)
+    job_package = JobPackageSimple(jobs)
+    mocker.patch.object(LocalPlatform, 'get_header', return_value='')
+    update_parameters = mocker.spy(Job, 'update_parameters')
+    compile_content = mocker.spy(Job, 'compile_content')
+
+    job_package.build_scripts(as_conf)
+
+    assert update_parameters.call_count == len(jobs)
+    assert compile_content.call_count == len(jobs)
+    for job in jobs:
+        assert job.undefined_variables == {'UNDEFINED_VARIABLE'}
+        script = Path(job._tmp_path, job_package._job_scripts[job.name]).read_text()
+        assert f'echo {job.name} \n' in script
+    assert job_package._rendered_scripts == {}
+
+
+def test_build_scripts_with_executor(jobs, as_conf, mocker):
+    """Test that the scripts written by an executor are the same, and kept in the order of the jobs."""
+    as_conf.experiment_data['JOBS']['SIM'] = {}
+    for job in jobs:
+        job.section = 'SIM'
+        job.script = 'echo %JOBNAME%'
+        Path(job._tmp_path).mkdir(parents=True, exist_ok=True)
+    mocker.patch.object(LocalPlatform, 'get_header', return_value='')
+    job_package = JobPackageSimple(jobs)
+    job_package.build_scripts(as_conf)
+    expected = [Path(job._tmp_path, job_package._job_scripts[job.name]).read_text() for job in jobs]
+
+    job_package = JobPackageSimple(jobs)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        job_package.build_scripts(as_conf, executor)
+        job_package.wait_for_scripts()
+
+    assert list(job_package._job_scripts) == [job.name for job in jobs]
+    assert [Path(job._tmp_path, job_package._job_scripts[job.name]).read_text() for job in jobs] == expected
+
+
+def test_wait_for_scripts_raises_first_error(jobs, as_conf, mocker):
+    """Test that the error raised is the one of the first job whose script could not be created."""
+    job_package = JobPackageSimple(jobs)
+    mocker.patch.object(Job, 'render_script')
+    mocker.patch.object(Job, 'create_script', side_effect=[ValueError('first'), ValueError('second')])
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        job_package._create_scripts(as_conf, executor)
+    with pytest.raises(ValueError, match='first'):
+        job_package.wait_for_scripts()
+
+
 def test_job_package_properties(jobs):
     """Test basic properties created during the simple package instantiation."""
     job_package = JobPackageSimple(jobs)
@@ -22,7 +22,9 @@ from typing import Any
 
 import pytest
 from pytest_mock import MockerFixture
+from sqlalchemy import select
 
+from autosubmit.config.basicconfig import BasicConfig
 from autosubmit.job.job import Job
 from autosubmit.job.metrics_processor import (
     MAX_FILE_SIZE_MB,
@@ -30,6 +32,7 @@ from autosubmit.job.metrics_processor import (
     MetricSpecSelector,
     MetricSpecSelectorType,
     UserMetricProcessor,
+    UserMetricRepository,
 )
 from autosubmit.platforms.locplatform import LocalPlatform
 
@@ -215,9 +218,9 @@ def test_process_metrics(disable_metric_repository, mocker: MockerFixture):
     as_conf = mocker.MagicMock()
     job = mocker.MagicMock()
     job.name = "test_job"
+    job.update_parameters.return_value = {"CURRENT_METRIC_FOLDER": "/metrics/test_job"}
     job.platform = mocker.MagicMock()
-    job.platform.read_file = mocker.MagicMock()
-    job.platform.read_file.return_value = b'{"key1": "value1", "key2": "value2"}'
+    job.platform.read_files = mocker.MagicMock()
 
     mock_read_metrics_specs =  mocker.patch("autosubmit.job.metrics_processor.UserMetricProcessor.read_metrics_specs")
     mock_read_metrics_specs.return_value = [
@@ -235,33 +238,44 @@ def test_process_metrics(disable_metric_repository, mocker: MockerFixture):
                 type=MetricSpecSelectorType.JSON, key=["key2"]
             ),
         ),
+        # The third metric reads a file that is missing on the platform
+        MetricSpec(
+            name="metric3",
+            filename="file3",
+            selector=MetricSpecSelector(type=MetricSpecSelectorType.TEXT, key=None),
+        ),
     ]
+    job.platform.read_files.side_effect = lambda files: {
+        path: None if path.endswith("file3") else b'{"key1": "value1", "key2": "value2"}'
+        for path in files
+    }
 
     # Mocking the repository
-    mock_store_metric = mocker.MagicMock()
+    mock_store_metrics = mocker.MagicMock()
     mock_repo = mocker.MagicMock()
-    mock_repo.store_metric = mock_store_metric
+    mock_repo.store_metrics = mock_store_metrics
 
     user_metric_processor = UserMetricProcessor(as_conf, job)
     user_metric_processor.user_metric_repository = mock_repo
-    user_metric_processor.process_metrics()
+    processed_metrics = user_metric_processor.process_metrics()
 
     assert mock_read_metrics_specs.call_count == 1
 
-    assert job.platform.read_file.call_count == 2
-
-    assert mock_store_metric.call_count == 2
-
-    assert mock_store_metric.call_args_list[0][0][1] == "test_job"
-    assert mock_store_metric.call_args_list[0][0][2] == "metric1"
-    assert (
-        mock_store_metric.call_args_list[0][0][3]
-        == '{"key1": "value1", "key2": "value2"}'
-    )
+    # The parameters of the job are computed once, and all the files are read at once
+    assert job.update_parameters.call_count == 1
+    assert job.platform.read_files.call_count == 1
+    assert list(job.platform.read_files.call_args[0][0]) == [
+        str(Path("/metrics/test_job", filename)) for filename in ("file1", "file2", "file3")
+    ]
 
-    assert mock_store_metric.call_args_list[1][0][1] == "test_job"
-    assert mock_store_metric.call_args_list[1][0][2] == "metric2"
-    assert mock_store_metric.call_args_list[1][0][3] == "value2"
+    # All the metrics are stored in a single call
+    assert mock_store_metrics.call_count == 1
+    assert mock_store_metrics.call_args[0][1] == "test_job"
+    assert mock_store_metrics.call_args[0][2] == {
+        "metric1": '{"key1": "value1", "key2": "value2"}',
+        "metric2": "value2",
+    }
+    assert processed_metrics == mock_store_metrics.call_args[0][2]
 
 
 def test_get_current_metric_folder(autosubmit_config):
@@ -316,3 +330,28 @@ def test_get_current_metric_folder_placeholder(autosubmit_config, local: LocalPl
     assert parameters["CURRENT_METRIC_FOLDER"] == str(
         Path(parameters["CURRENT_ROOTDIR"]).joinpath("my_metrics_folder", job_name)
     )
+
+
+def test_store_metrics_overwrites_values(tmp_path, mocker: MockerFixture):
+    mocker.patch.object(BasicConfig, "LOCAL_ROOT_DIR", str(tmp_path))
+    mocker.patch.object(BasicConfig, "LOCAL_TMP_DIR", "tmp")
+    mocker.patch.object(BasicConfig, "DATABASE_BACKEND", "sqlite")
+    Path(tmp_path, _EXPID, "tmp").mkdir(parents=True)
+
+    repository = UserMetricRepository(_EXPID)
+    repository.store_metrics(1, "test_job", {"metric1": "old", "metric2": 2})
+    repository.store_metrics(1, "test_job", {"metric1": "new", "metric3": {"key": "value"}})
+    repository.store_metric(2, "test_job", "metric1", "other run")
+    repository.store_metrics(1, "test_job", {})
+
+    with repository.engine.connect() as conn:
+        rows = conn.execute(
+            select(repository.table.c.run_id, repository.table.c.metric_name, repository.table.c.metric_value)
+        ).all()
+
+    assert sorted(tuple(row) for row in rows) == [
+        (1, "metric1", "new"),
+        (1, "metric2", "2"),
+        (1, "metric3", "{'key': 'value'}"),
+        (2, "metric1", "other run"),
+    ]
@@ -16,7 +16,9 @@
 # along with Autosubmit.  If not, see <http://www.gnu.org/licenses/>.
 
 import os
+import subprocess
 from collections.abc import Generator
+from datetime import datetime
 from getpass import getuser
 from pathlib import Path
 from tempfile import TemporaryDirectory
@@ -28,6 +30,7 @@ from autosubmit.autosubmit import Autosubmit
 from autosubmit.job.job import Job
 from autosubmit.job.job_common import Status
 from autosubmit.log.log import AutosubmitCritical, AutosubmitError
+from autosubmit.platforms.ecplatform import EcPlatform
 from autosubmit.platforms.locplatform import LocalPlatform
 
 # noinspection PyProtectedMember
@@ -1110,3 +1113,225 @@ def test_resolve_stat_status(
         mock_log.warning.assert_called_once()
     else:
         mock_log.warning.assert_not_called()
+
+
+def test_read_stat_files_single_command(paramiko_platform, mocker):
+    """The STAT files of all jobs are read with one command and shared by both STAT checks."""
+    paramiko_platform.remote_log_dir = '/remote/LOG_a000'
+    queuing = Job('a000_QUEUING', '1', Status.QUEUING, 0)
+    running = Job('a000_RUNNING', '2', Status.RUNNING, 0)
+    completed = Job('a000_COMPLETED', '3', Status.RUNNING, 0)
+    missing = Job('a000_MISSING', '4', Status.RUNNING, 0)
+    job_list = [queuing, running, completed, missing]
+
+    def _send_command(cmd, **_):
+        paramiko_platform._ssh_output = (
+            '/remote/LOG_a000/a000_QUEUING_STAT_0\t1715769500\n'
+            '/remote/LOG_a000/a000_RUNNING_STAT_0\t1715769500\t1715769600\n'
+            '/remote/LOG_a000/a000_COMPLETED_STAT_0\t1715769500\t1715769600\t1715769700\tCOMPLETED\n'
+            'unexpected line\n'
+        )
+
+    send_command = mocker.patch.object(paramiko_platform, 'send_command', side_effect=_send_command)
+
+    stat_files = paramiko_platform.read_stat_files(job_list)
+
+    assert send_command.call_count == 1
+    assert stat_files == {
+        'a000_QUEUING': ['1715769500'],
+        'a000_RUNNING': ['1715769500', '1715769600'],
+        'a000_COMPLETED': ['1715769500', '1715769600', '1715769700', 'COMPLETED'],
+    }
+
+    statuses = paramiko_platform.confirm_done_jobs_via_stat(job_list, stat_files)
+    assert statuses['a000_QUEUING'] == paramiko_platform._resolve_status('QUEUING')
+    assert statuses['a000_COMPLETED'] == Status.COMPLETED
+    assert statuses['a000_MISSING'] == paramiko_platform._resolve_status('None')
+
+    paramiko_platform.set_start_time_from_remote_stat_file([running, completed], stat_files)
+    assert send_command.call_count == 1
+    assert completed.start_time_timestamp == datetime.fromtimestamp(1715769600).strftime('%Y%m%d%H%M%S')
+
+
+def test_read_files_single_command(paramiko_platform, mocker, tmp_path):
+    """The metric files are read with one command, which is run here by the local shell."""
+    text = tmp_path / 'text'
+    text.write_text('some text')
+    binary = tmp_path / 'with spaces'
+    binary.write_bytes(bytes(range(256)))
+    empty = tmp_path / 'empty'
+    empty.touch()
+    missing = tmp_path / 'missing'
+
+    def _send_command(cmd, **_):
+        paramiko_platform._ssh_output = subprocess.run(
+            cmd, shell=True, capture_output=True, text=True).stdout
+
+    send_command = mocker.patch.object(paramiko_platform, 'send_command', side_effect=_send_command)
+    read_file = mocker.patch.object(paramiko_platform, 'read_file')
+
+    contents = paramiko_platform.read_files({
+        str(text): 4, str(binary): None, str(empty): 10, str(missing): 10
+    })
+
+    assert send_command.call_count == 1
+    assert read_file.call_count == 0
+    assert contents == {
+        str(text): b'some',
+        str(binary): bytes(range(256)),
+        str(empty): b'',
+        str(missing): None,
+    }
+
+
+def test_read_files_falls_back_to_read_file(paramiko_platform, mocker):
+    """If the output of the command is not the expected one, the files are read one by one."""
+    def _send_command(cmd, **_):
+        paramiko_platform._ssh_output = 'command not found'
+
+    mocker.patch.object(paramiko_platform, 'send_command', side_effect=_send_command)
+    read_file = mocker.patch.object(paramiko_platform, 'read_file', return_value=b'content')
+
+    contents = paramiko_platform.read_files({'/remote/file1': 10, '/remote/file2': None})
+
+    assert read_file.call_count == 2
+    assert contents == {'/remote/file1': b'content', '/remote/file2': b'content'}
+
+
+def test_send_files_single_archive(paramiko_platform, mocker, tmp_path):
+    """The files are sent in a single archive, extracted in the remote log directory."""
+    local_dir = tmp_path / 'local'
+    remote_dir = tmp_path / 'remote'
+    local_dir.mkdir()
+    remote_dir.mkdir()
+    paramiko_platform.tmp_path = str(local_dir)
+    mocker.patch.object(paramiko_platform, 'get_files_path', return_value=str(remote_dir))
+    for name in ('job1.cmd', 'job2.cmd'):
+        (local_dir / name).write_text(f'echo {name}')
+        (local_dir / name).chmod(0o755)
+
+    def _send_file(filename, check=True):
+        (remote_dir / filename).write_bytes((local_dir / filename).read_bytes())
+        return True
+
+    def _send_command(cmd, **_):
+        return subprocess.run(cmd, shell=True).returncode == 0
+
+    check_remote_log_dir = mocker.patch.object(paramiko_platform, 'check_remote_log_dir')
+    remove_multiple_files = mocker.patch.object(paramiko_platform, 'remove_multiple_files')
+    send_file = mocker.patch.object(paramiko_platform, 'send_file', side_effect=_send_file)
+    mocker.patch.object(paramiko_platform, 'send_command', side_effect=_send_command)
+
+    paramiko_platform.send_files(['job1.cmd', 'job2.cmd', 'job1.cmd'])
+
+    check_remote_log_dir.assert_called_once()
+    remove_multiple_files.assert_called_once_with(f' {remote_dir / "job1.cmd"} {remote_dir / "job2.cmd"}')
+    send_file.assert_called_once_with('send_files_local.tar', check=False)
+    assert sorted(path.name for path in remote_dir.iterdir()) == ['job1.cmd', 'job2.cmd']
+    assert (remote_dir / 'job2.cmd').read_text() == 'echo job2.cmd'
+    assert os.access(remote_dir / 'job2.cmd', os.X_OK)
+    assert not (local_dir / 'send_files_local.tar').exists()
+
+
+def test_send_files_falls_back_to_send_file(paramiko_platform, mocker, tmp_path):
+    """If the archive cannot be extracted, the files are sent one by one."""
+    paramiko_platform.tmp_path = str(tmp_path)
+    mocker.patch.object(paramiko_platform, 'get_files_path', return_value=str(tmp_path / 'remote'))
+    for name in ('job1.cmd', 'job2.cmd'):
+        (tmp_path / name).write_text(f'echo {name}')
+    mocker.patch.object(paramiko_platform, 'check_remote_log_dir')
+    mocker.patch.object(paramiko_platform, 'remove_multiple_files')
+    mocker.patch.object(paramiko_platform, 'send_command', return_value=False)
+    send_file = mocker.patch.object(paramiko_platform, 'send_file', return_value=True)
+
+    paramiko_platform.send_files(['job1.cmd', 'job2.cmd'])
+
+    assert send_file.call_args_list == [
+        mocker.call('send_files_local.tar', check=False),
+        mocker.call('job1.cmd'),
+        mocker.call('job2.cmd'),
+    ]
+
+
+def test_get_files_single_archive(paramiko_platform, mocker, tmp_path):
+    """The files are copied in a single archive, and the missing ones are copied one by one."""
+    local_dir = tmp_path / 'local'
+    remote_dir = tmp_path / 'remote'
+    local_dir.mkdir()
+    remote_dir.mkdir()
+    paramiko_platform.tmp_path = str(local_dir)
+    paramiko_platform.remove_log_files_on_transfer = True
+    mocker.patch.object(paramiko_platform, 'get_files_path', return_value=str(remote_dir))
+    (remote_dir / 'job.20250101.out').write_text('out')
+    (remote_dir / 'job.20250101.err').write_bytes(bytes(range(256)))
+    (remote_dir / 'job_STAT_0').write_text('stat')
+
+    def _send_command(cmd, **_):
+        return subprocess.run(cmd, shell=True, check=False).returncode == 0
+
+    send_command = mocker.patch.object(paramiko_platform, 'send_command', side_effect=_send_command)
+    paramiko_platform._ftpChannel = mocker.MagicMock()
+    paramiko_platform._ftpChannel.get.side_effect = lambda src, dst: Path(dst).write_bytes(Path(src).read_bytes())
+    get_file = mocker.patch.object(paramiko_platform, 'get_file', return_value=False)
+
+    paramiko_platform.get_files(['job.20250101.out', 'job.20250101.err', 'job_STAT_0', 'missing.20250101.out'], False, 'LOG_a000')
+
+    assert send_command.call_count == 2
+    paramiko_platform._ftpChannel.get.assert_called_once()
+    get_file.assert_called_once_with('missing.20250101.out', False, 'LOG_a000')
+    assert (local_dir / 'LOG_a000' / 'job.20250101.out').read_text() == 'out'
+    assert (local_dir / 'LOG_a000' / 'job.20250101.err').read_bytes() == bytes(range(256))
+    assert (local_dir / 'LOG_a000' / 'job_STAT_0').read_text() == 'stat'
+    assert [path.name for path in remote_dir.iterdir()] == ['job_STAT_0']
+    assert [path.name for path in local_dir.iterdir()] == ['LOG_a000']
+
+
+def test_get_files_falls_back_to_get_file(paramiko_platform, mocker, tmp_path):
+    """If the archive cannot be created, the files are copied one by one."""
+    paramiko_platform.tmp_path = str(tmp_path)
+    mocker.patch.object(paramiko_platform, 'get_files_path', return_value=str(tmp_path / 'remote'))
+    mocker.patch.object(paramiko_platform, 'send_command', return_value=False)
+    paramiko_platform._ftpChannel = mocker.MagicMock()
+    get_file = mocker.patch.object(paramiko_platform, 'get_file', return_value=True)
+
+    paramiko_platform.get_files(['job.20250101.out', 'job.20250101.err'], False, 'LOG_a000')
+
+    paramiko_platform._ftpChannel.get.assert_not_called()
+    assert get_file.call_args_list == [
+        mocker.call('job.20250101.out', False, 'LOG_a000'),
+        mocker.call('job.20250101.err', False, 'LOG_a000'),
+    ]
+
+
+def test_batch_logs_files(paramiko_platform, mocker):
+    """The log files requested in the block are copied together when it ends."""
+    get_files = mocker.patch.object(paramiko_platform, 'get_files')
+
+    with paramiko_platform.batch_logs_files():
+        paramiko_platform.get_logs_files('a000', ('job1.cmd.out.0', 'job1.cmd.err.0'))
+        paramiko_platform.get_logs_files('a000', ('job2.cmd.out.1', 'job2.cmd.err.1'))
+        get_files.assert_not_called()
+
+    get_files.assert_called_once_with(
+        ['job1.cmd.out.0', 'job1.cmd.err.0', 'job2.cmd.out.1', 'job2.cmd.err.1'], False, 'LOG_a000')
+    paramiko_platform.get_logs_files('a000', ('job3.cmd.out.0', 'job3.cmd.err.0'))
+    assert get_files.call_count == 2
+
+
+@pytest.mark.parametrize("platform_class", [LocalPlatform, EcPlatform], ids=["local", "ecaccess"])
+def test_send_files_one_by_one(platform_class, mocker, tmp_path):
+    """The local and ecaccess platforms send the files one by one, without building an archive."""
+    config = {"LOCAL_ROOT_DIR": str(tmp_path), "LOCAL_TMP_DIR": "tmp"}
+    if platform_class is EcPlatform:
+        platform = EcPlatform(expid='a000', name='ecaccess', config=config, scheduler='slurm')
+    else:
+        platform = LocalPlatform(expid='a000', name='local', config=config)
+    tar_open = mocker.patch('autosubmit.platforms.paramiko_platform.tarfile.open')
+    send_command = mocker.patch.object(platform, 'send_command')
+    send_file = mocker.patch.object(platform, 'send_file', return_value=True)
+
+    platform.send_files(['job1.cmd', 'job2.cmd'])
+
+    tar_open.assert_not_called()
+    send_command.assert_not_called()
+    assert send_file.call_args_list == [mocker.call('job1.cmd'), mocker.call('job2.cmd')]
@@ -17,10 +17,13 @@
 
 """This file contains tests for the ``platform``."""
 
+import queue
 from pathlib import Path
 
 import pytest
 
+from autosubmit.job.job import Job
+from autosubmit.job.job_common import Status
 from autosubmit.log.log import Log
 from autosubmit.platforms.locplatform import LocalPlatform
 from autosubmit.platforms.platform import recover_platform_job_logs_wrapper
@@ -117,6 +120,60 @@ def test_init_logs_log_process_with_root_dir(mocker, autosubmit_config):
     assert len(Log.log.handlers) == current_number_of_handlers + 2  # + out + err
 
 
+def test_recover_job_log_in_batches(mocker):
+    """recover_job_log loads a batch of queued jobs, copies their logs and saves them at once, in queue order."""
+    platform = LocalPlatform("t000", "test_platform", {})
+    platform._as_conf = None
+    platform.recovery_queue = queue.Queue()
+    jobs = {name: Job(name, 0, Status.COMPLETED, 0) for name in ['t000_job0', 't000_job1']}
+    for name, job_id in [('t000_job0', 10), ('t000_job1', 11), ('t000_job0', 12)]:
+        platform.recovery_queue.put({"name": name, "id": job_id})
+
+    jobs_db_manager = mocker.MagicMock()
+    jobs_db_manager.load_jobs_by_names.side_effect = lambda names: [jobs[name].__getstate__() for name in names]
+    retrieved = []
+    mocker.patch.object(Job, 'retrieve_logfiles', autospec=True, side_effect=lambda job: retrieved.append(
+        (job.name, job.id)) or mocker.MagicMock(all_succeeded=True, attempts=[]))
+    mocker.patch.object(Job, 'send_cpmip_notification')
+    batch_logs_files = mocker.spy(platform, 'batch_logs_files')
+
+    platform.recover_job_log(jobs_db_manager, None)
+
+    batch_logs_files.assert_called_once()
+    jobs_db_manager.load_jobs_by_names.assert_called_once_with(['t000_job0', 't000_job1'])
+    assert [job_id for name, job_id in retrieved if name == 't000_job0'] == [10, 12]
+    assert ('t000_job1', 11) in retrieved
+    saved_jobs = jobs_db_manager.save_jobs_log.call_args.args[0]
+    assert jobs_db_manager.save_jobs_log.call_count == 1
+    assert sorted(job.name for job in saved_jobs) == ['t000_job0', 't000_job1']
+    assert all(job.platform is platform for job in saved_jobs)
+    jobs_db_manager.save_jobs_retrials.assert_called_once_with(saved_jobs)
+
+
+def test_recover_job_log_saves_the_batch_when_a_job_fails(mocker):
+    """A job whose logs cannot be recovered is reported, and the log information of the batch is still saved."""
+    platform = LocalPlatform("t000", "test_platform", {})
+    platform._as_conf = None
+    platform.recovery_queue = queue.Queue()
+    jobs = {name: Job(name, 0, Status.COMPLETED, 0) for name in ['t000_job0', 't000_job1']}
+    for job_id, name in enumerate(jobs):
+        platform.recovery_queue.put({"name": name, "id": job_id})
+
+    jobs_db_manager = mocker.MagicMock()
+    jobs_db_manager.load_jobs_by_names.side_effect = lambda names: [jobs[name].__getstate__() for name in names]
+    mocker.patch.object(Job, 'retrieve_logfiles', autospec=True, side_effect=[
+        OSError("connection lost"), mocker.MagicMock(all_succeeded=True, attempts=[])])
+    mocker.patch.object(Job, 'send_cpmip_notification')
+    mocked_log = mocker.patch('autosubmit.platforms.platform.Log')
+
+    platform.recover_job_log(jobs_db_manager, None)
+
+    assert "t000_job0: connection lost" in mocked_log.warning.call_args.args[0]
+    saved_jobs = jobs_db_manager.save_jobs_log.call_args.args[0]
+    assert sorted(job.name for job in saved_jobs) == ['t000_job0', 't000_job1']
+    jobs_db_manager.save_jobs_retrials.assert_called_once_with(saved_jobs)
+
+
 def test_add_job_to_log_recover_signals_work_event(mocker):
     """add_job_to_log_recover signals work_event after queuing the job."""
     platform = LocalPlatform("t000", "test_platform", {})
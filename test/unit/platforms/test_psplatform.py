@@ -319,13 +319,13 @@ def test_ps_check_all_jobs_stat_confirmation(
     job = _make_ps_job('a000_INI', status=Status.RUNNING)
 
     stat_path = str(Path(ps_platform.remote_log_dir) / f'{job.name}_STAT_{job.fail_count}')
-    stat_value = stat_line if stat_line else 'None'
-    stat_output = f'{stat_path}: "{stat_value}"'
+    # read_stat_files prints nothing for a missing STAT file.
+    stat_output = f'{stat_path}\t{stat_line}' if stat_line else ''
 
     ps_output = f'{job.id} 1'
 
     def _send_command(cmd, **_):
-        # confirm_done_jobs_via_stat sends a 'for f in' shell loop; everything
+        # read_stat_files sends a 'for f in' shell loop; everything
         # else is the scheduler/ps process-status check.
         ps_platform._ssh_output = stat_output if 'for f in' in cmd else ps_output
 
@@ -358,7 +358,7 @@ def test_ps_check_all_jobs_save_flag(
     job = _make_ps_job('a000_SIM', status=Status.RUNNING)
 
     stat_path = str(Path(ps_platform.remote_log_dir) / f'{job.name}_STAT_{job.fail_count}')
-    stat_output = f'{stat_path}: "COMPLETED"'
+    stat_output = f'{stat_path}\t1715769600\t1715769601\t1715769700\tCOMPLETED'
     ps_output = f'{job.id} 1'
 
     def _send_command(cmd, **_):
@@ -17,6 +17,7 @@
 
 from datetime import datetime, timedelta
 
+import numpy as np
 import pytest
 
 from autosubmit.job.job import Job
@@ -26,6 +27,7 @@ from autosubmit.statistics.utils import (
     filter_by_time_period,
     parse_number_processors,
     timedelta2hours,
+    timedeltas2hours,
 )
 
 DEFAULT_NUMBER_PROCESSORS = 1
@@ -95,20 +97,12 @@ def test_filter_by_time_period(mocker, monkeypatch):
 
     Finally, we filter by 15 hours, which brings all ten jobs.
     """
-
-    # FIXME: Here we are basically rewriting the logic in mocks because the
-    #        original code is hard to test -- we need to re-think/design
-    #        that so that our tests are simpler. We probably don't need a mock at all...
-    def check_started_after(other: datetime) -> bool:
-        """Start time of job hard-coded at 10h00"""
-        start_time = datetime(2020, 5, 17, 10, 0, 0)
-        return start_time > other
-
     jobs = []
     for i in range(10):
         job = mocker.MagicMock(spec=Job)
-        job.check_started_after.side_effect = check_started_after
-        job.check_running_after.return_value = False
+        # Start time of job hard-coded at 10h00, and not finished yet.
+        job.check_retrials_start_time.return_value = [datetime(2020, 5, 17, 10, 0, 0)]
+        job.check_retrials_end_time.return_value = []
         jobs.append(job)
 
     mocked_datetime = mocker.patch('autosubmit.statistics.utils.datetime', autospec=True)
@@ -143,6 +137,35 @@ def test_timedelta2hours():
     assert timedelta2hours(delta_time) == 25
 
 
+def test_filter_by_time_period_keeps_jobs_started_or_running_after(mocker):
+    """Jobs are kept if any of their retrials started, or finished, after the start time."""
+    retrial_times = [
+        ([datetime(2020, 5, 17, 10)], [datetime(2020, 5, 17, 11)]),
+        ([datetime(2020, 5, 17, 10), datetime(2020, 5, 17, 11, 30)], []),
+        ([datetime(2020, 5, 17, 10)], [datetime(2020, 5, 17, 11, 30)]),
+        ([], []),
+    ]
+    jobs = []
+    for start_times, end_times in retrial_times:
+        job = mocker.MagicMock(spec=Job)
+        job.check_retrials_start_time.return_value = start_times
+        job.check_retrials_end_time.return_value = end_times
+        jobs.append(job)
+    mocked_datetime = mocker.patch('autosubmit.statistics.utils.datetime', autospec=True)
+    mocked_datetime.now.return_value = datetime(2020, 5, 17, 12, 0, 0)
+
+    filtered, start, _ = filter_by_time_period(jobs, 1)
+
+    assert start == datetime(2020, 5, 17, 11, 0, 0)
+    assert filtered == jobs[1:3]
+
+
+def test_timedeltas2hours():
+    delta_times = [timedelta(days=1, seconds=3600), timedelta(seconds=5400, microseconds=999), timedelta()]
+    hours = timedeltas2hours(np.array(delta_times, dtype="timedelta64[us]"))
+    assert hours.tolist() == [timedelta2hours(delta_time) for delta_time in delta_times]
+
+
 @pytest.mark.parametrize(
     'n,expected',
     [
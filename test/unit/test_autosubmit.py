@@ -19,6 +19,7 @@
 
 import datetime
 import signal
+import threading
 from pathlib import Path
 from textwrap import dedent
 
@@ -29,8 +30,8 @@ from autosubmit.config.basicconfig import BasicConfig
 from autosubmit.config.utils import copy_as_config
 from autosubmit.job.job import Job
 from autosubmit.job.job_common import Status
-from autosubmit.log.log import AutosubmitCritical
-from test.unit.conftest import AutosubmitConfigFactory
+from autosubmit.log.log import AutosubmitCritical, AutosubmitError
+from test.unit.conftest import AutosubmitConfigFactory, FakePlatform
 
 
 def test_copy_as_config(autosubmit_config: AutosubmitConfigFactory):
@@ -101,6 +102,20 @@ def test_database_backup_postgres(monkeypatch, autosubmit, mocker):
     assert mocked_log.debug.called
 
 
+def test_database_backup_sqlite(monkeypatch, autosubmit, mocker):
+    """Test that a SQLite DB backup is requested in the background, and waited for only when asked."""
+    monkeypatch.setattr(BasicConfig, 'DATABASE_BACKEND', 'sqlite')
+    backup = mocker.patch('autosubmit.autosubmit.HistoricalDatabaseBackup').for_experiment.return_value
+
+    autosubmit.database_backup('a000')
+    backup.request.assert_called_once_with(force=False)
+    backup.wait.assert_not_called()
+
+    autosubmit.database_backup('a000', force=True, wait=True)
+    backup.request.assert_called_with(force=True)
+    backup.wait.assert_called_once()
+
+
 @pytest.mark.parametrize(
     'completed,failed',
     [
@@ -270,6 +285,59 @@ def test_check_non_wrapped_jobs_calls_platform_and_updates_status(
     fake_job_list.save_jobs.assert_called_once()
 
 
+def test_check_non_wrapped_jobs_polls_platforms_concurrently(fake_job_list, mocker) -> None:
+    """check_non_wrapped_jobs: a platform still being polled does not hold back the others."""
+    as_conf = mocker.MagicMock()
+    other_platform_checked = threading.Event()
+    slow_platform, fast_platform = FakePlatform(), FakePlatform()
+    slow_platform.name, fast_platform.name = 'slow_platform', 'fast_platform'
+    slow_platform.check_all_jobs = mocker.MagicMock(
+        side_effect=lambda *_: other_platform_checked.wait(timeout=10) or pytest.fail("Platforms polled in sequence"))
+    fast_platform.check_all_jobs = mocker.MagicMock(side_effect=lambda *_: other_platform_checked.set())
+
+    jobs = []
+    for job_id, platform in enumerate([slow_platform, fast_platform], start=10):
+        job = Job(f'a000_20000101_fc0_{job_id}_SIM', job_id, Status.RUNNING, 0)
+        job.platform = platform
+        job.new_status = Status.COMPLETED
+        fake_job_list.add_job(job)
+        jobs.append(job)
+
+    mocker.patch.object(Job, 'update_status', lambda self, conf: setattr(self, 'status', self.new_status))
+    mocker.patch.object(fake_job_list, 'save_jobs')
+
+    Autosubmit.check_non_wrapped_jobs([slow_platform, fast_platform], fake_job_list, as_conf, 'a000')
+
+    assert [job.status for job in jobs] == [Status.COMPLETED, Status.COMPLETED]
+    fake_job_list.save_jobs.assert_called_once()
+
+
+def test_check_non_wrapped_jobs_saves_the_platforms_checked_before_raising(fake_job_list, mocker) -> None:
+    """check_non_wrapped_jobs: a failing platform does not discard the updates of the others."""
+    as_conf = mocker.MagicMock()
+    failing_platform, ok_platform = FakePlatform(), FakePlatform()
+    failing_platform.name, ok_platform.name = 'failing_platform', 'ok_platform'
+    failing_platform.check_all_jobs = mocker.MagicMock(side_effect=AutosubmitError("Connection lost", 6016))
+    ok_platform.check_all_jobs = mocker.MagicMock()
+
+    jobs = []
+    for job_id, platform in enumerate([failing_platform, ok_platform], start=10):
+        job = Job(f'a000_20000101_fc0_{job_id}_SIM', job_id, Status.RUNNING, 0)
+        job.platform = platform
+        job.new_status = Status.COMPLETED
+        fake_job_list.add_job(job)
+        jobs.append(job)
+
+    mocker.patch.object(Job, 'update_status', lambda self, conf: setattr(self, 'status', self.new_status))
+    mocker.patch.object(fake_job_list, 'save_jobs')
+
+    with pytest.raises(AutosubmitError, match="Connection lost"):
+        Autosubmit.check_non_wrapped_jobs([failing_platform, ok_platform], fake_job_list, as_conf, 'a000')
+
+    assert [job.status for job in jobs] == [Status.RUNNING, Status.COMPLETED]
+    fake_job_list.save_jobs.assert_called_once()
+
+
 @pytest.mark.parametrize("status,elapsed,should_check", [
     (Status.WAITING, 0, True),    # non-RUNNING always checks
     (Status.RUNNING, 5, True),    # RUNNING and elapsed >= sleeptime
@@ -170,3 +170,29 @@ def test_read_overwrites_config_with_etc_files(tmp_path):
         BasicConfig.DB_FILE = original_db_file
         BasicConfig.DB_PATH = original_db_path
         BasicConfig.CONFIG_FILE_FOUND = original_config_file_found
+
+
+def test_read_cached_only_reads_changed_config(tmp_path, monkeypatch):
+    """``read_cached`` reuses the last ``read`` until the configuration file changes."""
+    config_file = tmp_path / "autosubmitrc"
+    config_file.write_text(dedent(f"""
+        [local]
+        path = {tmp_path / "first"}
+    """))
+    monkeypatch.setenv("AUTOSUBMIT_CONFIGURATION", str(config_file))
+    BasicConfig.read()
+    assert BasicConfig.LOCAL_ROOT_DIR == str(tmp_path / "first")
+
+    with patch(
+        "autosubmit.config.basicconfig.BasicConfig._BasicConfig__read_file_config"
+    ) as mock_read:
+        BasicConfig.read_cached()
+        mock_read.assert_not_called()
+
+    config_file.write_text(dedent(f"""
+        [local]
+        path = {tmp_path / "second"}
+    """))
+    os.utime(config_file, ns=(0, 0))
+    BasicConfig.read_cached()
+    assert BasicConfig.LOCAL_ROOT_DIR == str(tmp_path / "second")
@@ -15,7 +15,7 @@
 # You should have received a copy of the GNU General Public License
 # along with Autosubmit.  If not, see <http://www.gnu.org/licenses/>.
 
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 from autosubmit.database.db_manager_job_list import JobsDbManager
 from autosubmit.database.tables import ExperimentStructureTable, JobsTable
@@ -47,6 +47,31 @@ def test_save_job_log_includes_updated_stats(tmp_path):
         assert loaded["updated_stats"] == 1
 
 
+def test_save_jobs_log_and_load_jobs_by_names(tmp_path):
+    """save_jobs_log writes the log information of several jobs, which load_jobs_by_names reads back."""
+    with patch("autosubmit.config.basicconfig.BasicConfig.LOCAL_ROOT_DIR", str(tmp_path)):
+        from autosubmit.job.job import Job
+        from autosubmit.job.job_common import Status
+        mgr = JobsDbManager(schema="test_schema_jobs_log")
+        jobs = [Job(f"job{i}", i, Status.COMPLETED, 0) for i in range(3)]
+        mgr.save_jobs(jobs)
+
+        for i, job in enumerate(jobs[:2]):
+            job.updated_log = 1
+            job.local_logs = (f"out{i}", f"err{i}")
+            job.priority = 42
+        mgr.save_jobs_log(jobs[:2])
+
+        loaded = {job["name"]: job for job in mgr.load_jobs_by_names(["job0", "job1", "job2", "missing"])}
+        assert set(loaded) == {"job0", "job1", "job2"}
+        assert [loaded[name]["local_logs_out"] for name in ("job0", "job1")] == ["out0", "out1"]
+        assert loaded["job0"]["updated_log"] == 1
+        assert loaded["job2"]["updated_log"] == 0
+        # Only the log columns are written.
+        assert loaded["job0"]["priority"] == 0
+        assert mgr.load_jobs_by_names([]) == []
+
+
 def test_save_jobs_preserves_log_counters_for_non_waiting_ready(tmp_path):
     """save_jobs preserves updated_log / updated_stats for non-WAITING/READY jobs."""
     with patch("autosubmit.config.basicconfig.BasicConfig.LOCAL_ROOT_DIR", str(tmp_path)):
@@ -219,3 +244,245 @@ def test_remaining_blocked_by_package(tmp_path):
 
         # COMPLETED parent is allowed → blocked
         assert mgr.remaining_blocked_by_package({"rem_job"}, {"pkg_job"}) is True
+
+
+def test_save_jobs_only_writes_dirty_jobs(tmp_path, mocker):
+    """save_jobs skips unchanged jobs and updates only the changed columns of the others."""
+    with patch("autosubmit.config.basicconfig.BasicConfig.LOCAL_ROOT_DIR", str(tmp_path)):
+        from autosubmit.job.job import Job
+        from autosubmit.job.job_common import Status
+        mgr = JobsDbManager(schema="test_schema_dirty")
+        jobs = [Job(f"job{i}", i, Status.WAITING, 0) for i in range(3)]
+        mgr.save_jobs(jobs)
+
+        # Changed in the DB behind our back, an unchanged job must not overwrite it.
+        mgr.update_where(JobsTable.name, {'priority': 42}, {'name': 'job0'})
+
+        jobs[1].status = Status.READY
+        upsert_spy = mocker.spy(mgr, 'upsert_many')
+        update_spy = mocker.spy(mgr, 'update_many')
+        mgr.save_jobs(jobs)
+
+        upsert_spy.assert_not_called()
+        update_spy.assert_called_once()
+        changes = update_spy.call_args.args[1]
+        assert [change['name'] for change in changes] == ['job1']
+        assert set(changes[0]) == {'name', 'status', 'modified'}
+
+        assert mgr.load_job_by_name("job0")["priority"] == 42
+        assert mgr.load_job_by_name("job1")["status"] == "READY"
+
+        update_spy.reset_mock()
+        mgr.save_jobs(jobs)
+        update_spy.assert_not_called()
+
+
+def test_save_jobs_rewrites_dirty_jobs_missing_from_db(tmp_path):
+    """save_jobs falls back to an upsert when a flushed job is no longer in the database."""
+    with patch("autosubmit.config.basicconfig.BasicConfig.LOCAL_ROOT_DIR", str(tmp_path)):
+        from autosubmit.job.job import Job
+        from autosubmit.job.job_common import Status
+        mgr = JobsDbManager(schema="test_schema_dirty_missing")
+        job = Job("job0", 1, Status.WAITING, 0)
+        mgr.save_jobs([job])
+        mgr.delete_all(JobsTable.name)
+
+        job.status = Status.COMPLETED
+        mgr.save_jobs([job])
+
+        assert mgr.load_job_by_name("job0")["status"] == "COMPLETED"
+
+
+def test_save_jobs_ignores_the_rowcount_of_the_update(tmp_path, mocker):
+    """save_jobs finds the missing rows itself, as drivers may report a rowcount of -1."""
+    with patch("autosubmit.config.basicconfig.BasicConfig.LOCAL_ROOT_DIR", str(tmp_path)):
+        from autosubmit.job.job import Job
+        from autosubmit.job.job_common import Status
+        mgr = JobsDbManager(schema="test_schema_dirty_rowcount")
+        jobs = [Job(f"job{i}", i, Status.WAITING, 0) for i in range(2)]
+        mgr.save_jobs(jobs)
+        mgr.delete_where(JobsTable.name, {'name': 'job0'})
+
+        for job in jobs:
+            job.status = Status.COMPLETED
+        update_many = mgr.update_many
+        mocker.patch.object(mgr, 'update_many', side_effect=lambda *args: update_many(*args) and -1)
+        upsert_spy = mocker.spy(mgr, 'upsert_many')
+        mgr.save_jobs(jobs)
+
+        assert [row['name'] for row in upsert_spy.call_args.args[1]] == ['job0']
+        assert mgr.load_job_by_name("job0")["status"] == "COMPLETED"
+        assert mgr.load_job_by_name("job1")["status"] == "COMPLETED"
+
+
+def test_loaded_job_is_clean(tmp_path):
+    """A job built from a database row has no dirty columns until it is modified."""
+    with patch("autosubmit.config.basicconfig.BasicConfig.LOCAL_ROOT_DIR", str(tmp_path)):
+        from autosubmit.job.job import Job
+        from autosubmit.job.job_common import Status
+        mgr = JobsDbManager(schema="test_schema_dirty_loaded")
+        mgr.save_jobs([Job("job0", 1, Status.WAITING, 0)])
+
+        job = Job(loaded_data=mgr.load_job_by_name("job0"))
+        assert job.get_dirty_columns(job.__getstate__()) == set()
+
+        job.fail_count = 1
+        assert job.get_dirty_columns(job.__getstate__()) == {'fail_count'}
+
+
+def test_update_outgoing_edges_completion_many(tmp_path):
+    """Satisfied outgoing edges are completed and fully propagated parents are returned."""
+    with patch("autosubmit.config.basicconfig.BasicConfig.LOCAL_ROOT_DIR", str(tmp_path)):
+        mgr = JobsDbManager(schema="test_schema_edges_completion")
+        mgr.create_table(JobsTable.name)
+        mgr.upsert_many(JobsTable.name, [
+            {"name": name, "status": "WAITING", "fail_count": 0}
+            for name in ("child1", "child2", "child3")
+        ], ["name"])
+        mgr.save_edges([
+            {"e_from": "completed", "e_to": "child1", "min_trigger_status": "COMPLETED",
+             "completion_status": "WAITING", "from_step": 0, "fail_ok": False},
+            {"e_from": "completed", "e_to": "child2", "min_trigger_status": "COMPLETED",
+             "completion_status": "WAITING", "from_step": 0, "fail_ok": False},
+            {"e_from": "failed", "e_to": "child2", "min_trigger_status": "COMPLETED",
+             "completion_status": "WAITING", "from_step": 0, "fail_ok": True},
+            {"e_from": "failed", "e_to": "child3", "min_trigger_status": "COMPLETED",
+             "completion_status": "WAITING", "from_step": 0, "fail_ok": False},
+        ])
+
+        propagated = mgr.update_outgoing_edges_completion_many({"completed": "COMPLETED", "failed": "FAILED"})
+
+        assert propagated == {"completed"}
+        edges = {(edge["e_from"], edge["e_to"]): edge["completion_status"] for edge in mgr.select_edges()}
+        assert edges == {
+            ("completed", "child1"): "COMPLETED",
+            ("completed", "child2"): "COMPLETED",
+            ("failed", "child2"): "COMPLETED",
+            ("failed", "child3"): "WAITING",
+        }
+        assert mgr.update_outgoing_edges_completion_many({}) == set()
+
+
+def test_replace_edges_to_and_delete_edges_of_jobs(tmp_path):
+    """Only the changed edges to the regenerated jobs are written, and removed jobs lose all their edges."""
+    def edge(e_from, e_to, min_trigger_status="COMPLETED"):
+        return {"e_from": e_from, "e_to": e_to, "min_trigger_status": min_trigger_status,
+                "completion_status": "WAITING", "from_step": 0, "fail_ok": False}
+
+    with patch("autosubmit.config.basicconfig.BasicConfig.LOCAL_ROOT_DIR", str(tmp_path)):
+        mgr = JobsDbManager(schema="test_schema_replace_edges")
+        mgr.save_edges([
+            edge("ini", "sim"),
+            edge("ini", "post"),
+            edge("sim", "post"),
+            edge("stale", "post"),
+            edge("removed", "clean"),
+            edge("sim", "clean"),
+        ])
+
+        with patch.object(mgr, "upsert_many", wraps=mgr.upsert_many) as upsert_many:
+            mgr.replace_edges_to({"post"}, [
+                edge("ini", "post", min_trigger_status="RUNNING"),
+                edge("sim", "post"),
+                edge("new", "post"),
+            ])
+        assert upsert_many.call_args.args[1] == [edge("ini", "post", min_trigger_status="RUNNING"),
+                                                 edge("new", "post")]
+
+        mgr.delete_edges_of_jobs({"removed"})
+
+        edges = {(e["e_from"], e["e_to"]): e["min_trigger_status"] for e in mgr.select_edges()}
+        assert edges == {
+            ("ini", "sim"): "COMPLETED",
+            ("ini", "post"): "RUNNING",
+            ("sim", "post"): "COMPLETED",
+            ("new", "post"): "COMPLETED",
+            ("sim", "clean"): "COMPLETED",
+        }
+
+
+def test_select_children_jobs(tmp_path):
+    """Only children whose parent edges are all satisfied are selected, using in-memory parent statuses."""
+    with patch("autosubmit.config.basicconfig.BasicConfig.LOCAL_ROOT_DIR", str(tmp_path)):
+        mgr = JobsDbManager(schema="test_schema_select_children")
+        mgr.create_table(JobsTable.name)
+        mgr.upsert_many(JobsTable.name, [
+            {"name": "parent", "status": "RUNNING", "fail_count": 0, "member": "fc0"},
+            {"name": "other_parent", "status": "COMPLETED", "fail_count": 0, "member": "fc0"},
+            {"name": "ready_child", "status": "WAITING", "fail_count": 0, "member": "fc0"},
+            {"name": "blocked_child", "status": "WAITING", "fail_count": 0, "member": "fc0"},
+            {"name": "blocker", "status": "WAITING", "fail_count": 0, "member": "fc0"},
+            {"name": "other_member_child", "status": "WAITING", "fail_count": 0, "member": "fc1"},
+        ], ["name"])
+        mgr.save_edges([
+            {"e_from": "parent", "e_to": "ready_child", "min_trigger_status": "COMPLETED",
+             "completion_status": "WAITING", "from_step": 0, "fail_ok": False},
+            {"e_from": "other_parent", "e_to": "ready_child", "min_trigger_status": "COMPLETED",
+             "completion_status": "WAITING", "from_step": 0, "fail_ok": False},
+            {"e_from": "parent", "e_to": "blocked_child", "min_trigger_status": "COMPLETED",
+             "completion_status": "WAITING", "from_step": 0, "fail_ok": False},
+            {"e_from": "blocker", "e_to": "blocked_child", "min_trigger_status": "COMPLETED",
+             "completion_status": "WAITING", "from_step": 0, "fail_ok": False},
+            {"e_from": "parent", "e_to": "other_member_child", "min_trigger_status": "COMPLETED",
+             "completion_status": "WAITING", "from_step": 0, "fail_ok": False},
+        ])
+
+        # The in-memory status takes precedence over the stored one.
+        job_list = [(("name", "parent"), ("status", "COMPLETED"))]
+        children = mgr.select_children_jobs(list(job_list))
+        assert {dict(job)["name"] for job in children[1:]} == {"ready_child", "other_member_child"}
+
+        children = mgr.select_children_jobs(list(job_list), members=["fc0"])
+        assert [dict(job)["name"] for job in children[1:]] == ["ready_child"]
+
+        assert mgr.select_children_jobs([(("name", "parent"), ("status", "WAITING"))])[1:] == []
+        assert mgr.select_children_jobs([]) == []
+
+
+def test_save_and_select_retrials(tmp_path):
+    """Retrials are returned per job in insertion order, without the missing fields."""
+    with patch("autosubmit.config.basicconfig.BasicConfig.LOCAL_ROOT_DIR", str(tmp_path)):
+        mgr = JobsDbManager(schema="test_schema_retrials")
+        assert mgr.count_retrials(["sim"]) == {}
+        assert mgr.select_retrials(["sim"]) == {}
+
+        mgr.save_retrials({"sim": [["20250101000000", "20250101000100", "20250101000200", "FAILED"],
+                                   ["20250101000300", "20250101000400", "20250101000500", "COMPLETED"]],
+                           "post": [["20250101000600", "20250101000700"]]})
+        mgr.save_retrials({"sim": [["20250102000000", "20250102000100", "20250102000200", "COMPLETED"]]})
+
+        assert mgr.count_retrials(["sim", "post", "other"], batch_size=1) == {"sim": 3, "post": 1}
+        assert mgr.select_retrials(["sim"]) == {"sim": [
+            ["20250101000000", "20250101000100", "20250101000200", "FAILED"],
+            ["20250101000300", "20250101000400", "20250101000500", "COMPLETED"],
+            ["20250102000000", "20250102000100", "20250102000200", "COMPLETED"],
+        ]}
+        assert mgr.select_retrials(["post", "sim"], batch_size=1)["post"] == [["20250101000600", "20250101000700"]]
+
+
+def test_save_jobs_retrials_imports_the_total_stats_file_once(tmp_path):
+    """The retrials of the file missing in the table are imported once, then the new ones are appended."""
+    with patch("autosubmit.config.basicconfig.BasicConfig.LOCAL_ROOT_DIR", str(tmp_path)):
+        mgr = JobsDbManager(schema="test_schema_retrials")
+        lines = [["20250101000000", "20250101000100", "20250101000200", "FAILED"],
+                 ["20250102000000", "20250102000100", "20250102000200", "COMPLETED"]]
+        job = MagicMock(new_retrials=[lines[-1]], read_total_stats_file=MagicMock(return_value=lines))
+        job.name = "sim"
+
+        mgr.save_jobs_retrials([job])
+        assert job.new_retrials == []
+        assert mgr.select_retrials(["sim"]) == {"sim": lines}
+
+        # Once in sync, the new retrials are appended without reading the file.
+        job.new_retrials = [["20250103000000", "20250103000100", "20250103000200", "COMPLETED"]]
+        mgr.save_jobs_retrials([job])
+        assert job.read_total_stats_file.call_count == 1
+        assert mgr.count_retrials(["sim"]) == {"sim": 3}
+
+        # A new manager, as after a failed save, only imports the lines of the file missing in the table.
+        file_lines = [*mgr.select_retrials(["sim"])["sim"],
+                      ["20250104000000", "20250104000100", "20250104000200", "FAILED"]]
+        job.read_total_stats_file.return_value = file_lines
+        job.new_retrials = [file_lines[-1]]
+        JobsDbManager(schema="test_schema_retrials").save_jobs_retrials([job])
+        assert mgr.select_retrials(["sim"]) == {"sim": file_lines}
@@ -26,7 +26,13 @@ from shutil import copy2
 import pytest
 from sqlalchemy import create_engine
 
+from autosubmit.autosubmit import Autosubmit
 from autosubmit.config.basicconfig import BasicConfig
+from autosubmit.history.data_classes.experiment_run import ExperimentRun
+from autosubmit.history.data_classes.job_data import JobData
+from autosubmit.history.database_managers.experiment_history_db_manager import (
+    create_experiment_history_db_manager,
+)
 from autosubmit.history.experiment_history import ExperimentHistory
 from autosubmit.history.internal_logging import Logging
 from autosubmit.history.platform_monitor.slurm_monitor import SlurmMonitor
@@ -36,6 +42,8 @@ from autosubmit.history.strategies import (
     StraightWrapperAssociationStrategy,
 )
 from autosubmit.history.utils import get_current_datetime
+from autosubmit.job.job import Job
+from autosubmit.job.job_common import Status
 from test._oldschema import old_experiment_run_table, old_job_data_table
 
 EXPID_TT00_SOURCE = "test_database.db~"
@@ -55,6 +63,108 @@ def test_get_current_datetime():
     assert re.match(pattern, current_datetime) is not None
 
 
+@pytest.mark.parametrize("force_sql_alchemy", [False, True])
+def test_process_job_changes(tmp_path, mocker, force_sql_alchemy):
+    """Only the changed jobs are read, and the run counters move from the previous to the new status."""
+    mocker.patch.object(BasicConfig, "DATABASE_BACKEND", "sqlite")
+    exp_history = ExperimentHistory("t000")
+    exp_history.manager = create_experiment_history_db_manager(
+        "sqlite", expid="t000", jobdata_dir_path=str(tmp_path), force_sql_alchemy=force_sql_alchemy,
+        jobdata_file="job_data_t000.db")
+    exp_history.manager.initialize()
+    exp_history.manager.register_experiment_run_dc(ExperimentRun(1, total=4, running=2, completed=2))
+    for job_name, status in [("job_a", "RUNNING"), ("job_b", "RUNNING"), ("job_c", "COMPLETED"),
+                             ("job_d", "COMPLETED")]:
+        exp_history.manager.register_submitted_job_data_dc(JobData(0, job_name=job_name, status=status))
+    get_all_last = mocker.spy(exp_history.manager, "get_all_last_job_data_dcs")
+
+    exp_run = exp_history.process_job_changes({
+        "job_a": ("RUNNING", "COMPLETED"),
+        "job_b": ("RUNNING", "FAILED"),
+        # A finished job going back to a starting status keeps its job_data row.
+        "job_c": ("COMPLETED", "WAITING"),
+    })
+
+    get_all_last.assert_not_called()
+    assert (exp_run.total, exp_run.running, exp_run.completed, exp_run.failed) == (4, 0, 2, 1)
+    statuses = {job.job_name: job.status for job in exp_history.manager.get_all_last_job_data_dcs()}
+    assert statuses == {"job_a": "COMPLETED", "job_b": "FAILED", "job_c": "COMPLETED", "job_d": "COMPLETED"}
+    assert exp_history.process_job_changes({}) is None
+
+
+def test_process_historical_data_iteration_applies_each_change_once(tmp_path, mocker):
+    """A job that did not change since the last iteration does not move the run counters again."""
+    mocker.patch.object(BasicConfig, "DATABASE_BACKEND", "sqlite")
+    exp_history = ExperimentHistory("t000")
+    exp_history.manager = create_experiment_history_db_manager(
+        "sqlite", expid="t000", jobdata_dir_path=str(tmp_path), jobdata_file="job_data_t000.db")
+    exp_history.manager.initialize()
+    exp_history.manager.register_experiment_run_dc(ExperimentRun(1, total=2, running=2))
+    for job_name in ("job_a", "job_b"):
+        exp_history.manager.register_submitted_job_data_dc(JobData(0, job_name=job_name, status="RUNNING"))
+    mocker.patch("autosubmit.autosubmit.ExperimentHistory", return_value=exp_history)
+    mocker.patch.object(Autosubmit, "database_backup")
+    job_list = mocker.MagicMock(history_statuses={})
+
+    # ``job_a`` keeps its previous status, so its change is tracked in both iterations.
+    Autosubmit.process_historical_data_iteration(job_list, {"job_a": ("RUNNING", "COMPLETED")}, "t000")
+    Autosubmit.process_historical_data_iteration(job_list, {"job_a": ("RUNNING", "COMPLETED")}, "t000")
+    exp_run = exp_history.manager.get_experiment_run_dc_with_max_id()
+    assert (exp_run.running, exp_run.completed) == (1, 1)
+
+    Autosubmit.process_historical_data_iteration(
+        job_list, {"job_a": ("RUNNING", "COMPLETED"), "job_b": ("RUNNING", "COMPLETED")}, "t000")
+    exp_run = exp_history.manager.get_experiment_run_dc_with_max_id()
+    assert (exp_run.running, exp_run.completed) == (0, 2)
+    assert Autosubmit.database_backup.call_count == 2
+
+
+def test_job_changes_made_by_update_list_move_the_run_counters(tmp_path, mocker, fake_job_list):
+    """A job retried by ``update_list`` keeps a stale ``prev_status``, its counters move from the applied status."""
+    mocker.patch.object(BasicConfig, "DATABASE_BACKEND", "sqlite")
+    exp_history = ExperimentHistory("t000")
+    exp_history.manager = create_experiment_history_db_manager(
+        "sqlite", expid="t000", jobdata_dir_path=str(tmp_path), jobdata_file="job_data_t000.db")
+    exp_history.manager.initialize()
+    exp_history.manager.register_experiment_run_dc(ExperimentRun(1, total=2, running=2))
+    mocker.patch("autosubmit.autosubmit.ExperimentHistory", return_value=exp_history)
+    mocker.patch.object(Autosubmit, "database_backup")
+    jobs = []
+    for job_name in ("t000_SIM_1", "t000_SIM_2"):
+        job = Job(job_name, 0, Status.RUNNING, 0)
+        job.section = "SIM"
+        exp_history.manager.register_submitted_job_data_dc(JobData(0, job_name=job_name, status="RUNNING"))
+        fake_job_list.add_job(job)
+        jobs.append(job)
+    fake_job_list.history_statuses = {job.name: job.status_str for job in jobs}
+    as_conf = mocker.MagicMock(jobs_data={"SIM": {}})
+    as_conf.get_retrials.return_value = 1
+    as_conf.get_delay_retry_time.return_value = "0"
+
+    # The platform check fails both jobs, ``update_status`` sets their ``prev_status`` to RUNNING.
+    for job in jobs:
+        job.prev_status, job.status = Status.RUNNING, Status.FAILED
+    Autosubmit.process_historical_data_iteration(
+        fake_job_list, Autosubmit.get_job_changes_tracker(fake_job_list), "t000")
+    exp_run = exp_history.manager.get_experiment_run_dc_with_max_id()
+    assert (exp_run.running, exp_run.failed) == (0, 2)
+
+    # ``update_list`` retries them, FAILED -> READY, without touching ``prev_status``.
+    fake_job_list.update_list(as_conf)
+    assert [(job.prev_status, job.status) for job in jobs] == [(Status.RUNNING, Status.READY)] * 2
+    Autosubmit.process_historical_data_iteration(
+        fake_job_list, Autosubmit.get_job_changes_tracker(fake_job_list), "t000")
+    exp_run = exp_history.manager.get_experiment_run_dc_with_max_id()
+    assert (exp_run.running, exp_run.failed) == (0, 0)
+
+    # The submission changes the status without touching ``prev_status`` either.
+    jobs[0].status = Status.SUBMITTED
+    Autosubmit.process_historical_data_iteration(
+        fake_job_list, Autosubmit.get_job_changes_tracker(fake_job_list), "t000")
+    exp_run = exp_history.manager.get_experiment_run_dc_with_max_id()
+    assert (exp_run.submitted, exp_run.running, exp_run.failed) == (1, 0, 0)
+
+
 @pytest.mark.skip()
 @pytest.mark.skip(
     'TODO: another test that uses actual data. See if there is anything useful, and extract into functional/integration/unit tests that run on any machine')
@@ -27,7 +27,7 @@ from textwrap import dedent
 from unittest.mock import MagicMock, Mock  # type: ignore
 
 import pytest
-from bscearth.utils.date import date2str
+from bscearth.utils.date import date2str, parse_date
 from mock.mock import patch  # type: ignore
 
 from autosubmit.config.configcommon import (
@@ -35,11 +35,13 @@ from autosubmit.config.configcommon import (
     BasicConfig,
     YAMLParserFactory,
 )
-from autosubmit.job.job import Job, WrapperJob
+from autosubmit.database.db_manager_job_list import JobsDbManager
+from autosubmit.job.job import Job, WrapperJob, _parse_stats_date
 from autosubmit.job.job_common import Status
 from autosubmit.job.job_list import JobList
 from autosubmit.job.job_utils import SubJob, SubJobManager
 from autosubmit.job.template import Language
+from autosubmit.job.template.placeholders import CompiledTemplate
 from autosubmit.log.log import AutosubmitCritical
 from autosubmit.platforms.locplatform import LocalPlatform
 from autosubmit.platforms.paramiko_submitter import ParamikoSubmitter
@@ -596,8 +598,9 @@ def test_pytest_check_script(mocker, autosubmit_config):
     parameters['NUMTHREADS'] = 777
     parameters['NUMTASK'] = 666
     parameters['RESERVATION'] = "random-string"
-    mocker.patch("autosubmit.job.job.Job.update_content", return_value=(
-        'some-content: %NUMPROC%, %NUMTHREADS%, %NUMTASK%', 'some-content: %NUMPROC%, %NUMTHREADS%, %NUMTASK%'))
+    mocker.patch("autosubmit.job.job.Job.compile_content", return_value=(
+        [CompiledTemplate('some-content: %NUMPROC%, %NUMTHREADS%, %NUMTASK%')],
+        [CompiledTemplate('some-content: %NUMPROC%, %NUMTHREADS%, %NUMTASK%')]))
     mocker.patch("autosubmit.job.job.Job.update_parameters", return_value=parameters)
     as_conf = autosubmit_config("t000", {})
     job.init_runtime_parameters(as_conf, reset_logs=True, called_from_log_recovery=False)
@@ -653,10 +656,10 @@ def test_create_script(test_tmp_path: Path, mocker) -> None:
     job._tmp_path = test_tmp_path
     job.section = "DUMMY"
     job.additional_files = ['dummy_file1', 'dummy_file2']
-    mocker.patch("autosubmit.job.job.Job.update_content", return_value=(
-        'some-content: %NUMPROC%, %NUMTHREADS%, %NUMTASK% %% %%',
-        ['some-content: %NUMPROC%, %NUMTHREADS%, %NUMTASK% %% %%',
-         'some-content: %NUMPROC%, %NUMTHREADS%, %NUMTASK% %% %%']))
+    mocker.patch("autosubmit.job.job.Job.compile_content", return_value=(
+        [CompiledTemplate('some-content: %NUMPROC%, %NUMTHREADS%, %NUMTASK% %% %%')],
+        [CompiledTemplate('some-content: %NUMPROC%, %NUMTHREADS%, %NUMTASK% %% %%'),
+         CompiledTemplate('some-content: %NUMPROC%, %NUMTHREADS%, %NUMTASK% %% %%')]))
     mocker.patch("autosubmit.job.job.Job.update_parameters", return_value=parameters)
 
     config = Mock(spec=AutosubmitConfig)
@@ -676,6 +679,33 @@ def test_create_script(test_tmp_path: Path, mocker) -> None:
         assert 'some-content: 999, 777, 666' in content
 
 
+def test_render_script_parses_template_file_once(tmp_path: Path, mocker) -> None:
+    """The jobs sharing a template file share its parsed body, and the values are inserted as they are."""
+    (tmp_path / 'test.sh').write_text('echo %JOBNAME% 100%%')
+    config = Mock(spec=AutosubmitConfig)
+    config.default_parameters = {}
+    config.get_project_type = Mock(return_value='local')
+    config.get_project_dir = Mock(return_value=str(tmp_path))
+    update_parameters = mocker.patch("autosubmit.job.job.Job.update_parameters")
+
+    jobs = []
+    for name in ['a000_SIM', 'a000_POST']:
+        job = Job(name, "1", Status.READY, 0)
+        job.file = 'test.sh'
+        job.type = Language.BASH
+        job.platform = Mock(get_header=Mock(return_value='# %JOBNAME% %VALUE%'))
+        jobs.append(job)
+    compiled = [job.compile_content(config, {})[0] for job in jobs]
+
+    assert compiled[0][1] is compiled[1][1]
+    for job in jobs:
+        update_parameters.return_value = {'JOBNAME': job.name, 'VALUE': '%%'}
+        content = job.render_script(config).content
+        assert f'# {job.name} %%\n' in content
+        assert f'echo {job.name} 100%\n' in content
+        assert content == CompiledTemplate(job.update_content(config, {})[0]).render(update_parameters.return_value)
+
+
 def test_reset_logs(autosubmit_config):
     as_conf = autosubmit_config("t000", {})
     job = Job("job1", "1", Status.READY, 0)
@@ -691,8 +721,8 @@ def test_pytest_that_check_script_returns_false_when_there_is_an_unbound_templat
     as_conf = autosubmit_config("t000", {})
     job.init_runtime_parameters(as_conf, reset_logs=True, called_from_log_recovery=False)
     parameters = {}
-    mocker.patch("autosubmit.job.job.Job.update_content",
-                 return_value=('some-content: %UNBOUND%', 'some-content: %UNBOUND%'))
+    mocker.patch("autosubmit.job.job.Job.compile_content",
+                 return_value=([CompiledTemplate('some-content: %UNBOUND%')], [CompiledTemplate('some-content: %UNBOUND%')]))
     mocker.patch("autosubmit.job.job.Job.update_parameters", return_value=parameters)
     job.init_runtime_parameters(as_conf, reset_logs=True, called_from_log_recovery=False)
 
@@ -1262,7 +1292,7 @@ def test_get_from_stat(tmpdir, file_exists, index_timestamp, fail_count, expecte
     ]
 )
 def test_write_submit_time_ignore_exp_history(total_stats_exists: bool, autosubmit_config, local, mocker):
-    """Test that the job writes the submit time correctly.
+    """Test that the job only writes the submit time to the history database, not to the TOTAL_STATS file.
 
     It ignores what happens to the experiment history object."""
     mocker.patch('autosubmit.job.job.ExperimentHistory')
@@ -1282,14 +1312,9 @@ def test_write_submit_time_ignore_exp_history(total_stats_exists: bool, autosubm
 
     job.write_submit_time(0)
 
-    # It will exist regardless of the argument ``total_stats_exists``, as ``write_submit_time()``
-    # must have created it.
-    assert total_stats.exists()
-
-    # When the file already exists, it will append a new line. Otherwise,
-    # a new file is created with a single line.
-    expected_lines = 2 if total_stats_exists else 1
-    assert len(total_stats.read_text().split('\n')) == expected_lines
+    assert total_stats.exists() == total_stats_exists
+    if total_stats_exists:
+        assert total_stats.read_text() == 'First line'
 
 
 @pytest.mark.parametrize(
@@ -1309,7 +1334,7 @@ def test_write_submit_time_ignore_exp_history(total_stats_exists: bool, autosubm
 )
 def test_write_end_time_ignore_exp_history(completed: bool, existing_lines: str, local, count: int,
                                            autosubmit_config, mocker):
-    """Test that the job writes the end time correctly.
+    """Test that the job only writes the end time to the history database, not to the TOTAL_STATS file.
 
     It ignores what happens to the experiment history object."""
     mocker.patch('autosubmit.job.job.ExperimentHistory')
@@ -1329,16 +1354,9 @@ def test_write_end_time_ignore_exp_history(completed: bool, existing_lines: str,
 
     job.write_end_time(completed=completed, attempt=count)
 
-    # The file must exist after write_end_time regardless of whether it existed before.
-    assert total_stats.exists()
-
-    # For an empty file a single template line is created by _write_time.
-    # For pre-existing content the last line is updated in-place; no new line is appended.
+    assert total_stats.exists() == bool(existing_lines)
     if existing_lines:
-        expected_lines = len(existing_lines.splitlines())
-    else:
-        expected_lines = 1
-    assert len(total_stats.read_text().splitlines()) == expected_lines
+        assert total_stats.read_text() == existing_lines
 
 
 def test_job_repr():
@@ -2090,50 +2108,6 @@ def test_process_scheduler_parameters(local):
         assert isinstance(job.process_scheduler_parameters(local, 0), AutosubmitCritical)
 
 
-def test_write_time(tmp_path, local):
-    job = Job(_EXPID, '1', 5, 0, None)
-    job.platform = local
-    job._tmp_path = tmp_path
-    total_stats = job._tmp_path / f'{job.name}_TOTAL_STATS'
-    job.submit_time_timestamp = "20240101000000"
-    job.start_time_timestamp = "20240101010001"
-    job.finish_time_timestamp = "20240101020002"
-    job._write_time("submit")
-    job.status = Status.COMPLETED
-    assert job.submit_time_timestamp in total_stats.read_text()
-    assert "start" in total_stats.read_text()
-    assert "end" in total_stats.read_text()
-    assert "status" in total_stats.read_text()
-    job._write_time("start")
-
-    assert job.submit_time_timestamp in total_stats.read_text()
-    assert job.start_time_timestamp in total_stats.read_text()
-    assert "end" in total_stats.read_text()
-    assert "status" in total_stats.read_text()
-    job._write_time("end")
-
-    assert job.submit_time_timestamp in total_stats.read_text()
-    assert job.start_time_timestamp in total_stats.read_text()
-    assert job.finish_time_timestamp in total_stats.read_text()
-    assert "status" in total_stats.read_text()
-
-    job._write_time("status")
-    assert job.submit_time_timestamp in total_stats.read_text()
-    assert job.start_time_timestamp in total_stats.read_text()
-    assert job.finish_time_timestamp in total_stats.read_text()
-    assert "COMPLETED" in total_stats.read_text()
-
-    assert "submit" not in total_stats.read_text()
-    assert "start" not in total_stats.read_text()
-    assert "end" not in total_stats.read_text()
-    assert "status" not in total_stats.read_text()
-
-    # expected lines
-    assert len(total_stats.read_text().split('\n')) == 1
-    job._write_time("submit")
-    assert len(total_stats.read_text().split('\n')) == 2
-
-
 @pytest.mark.parametrize("create_jobs", [[1, 2]], indirect=True)
 @pytest.mark.parametrize(
     'status',
@@ -2231,7 +2205,7 @@ def test_update_and_write_time(count, with_stat_file, tmp_path):
     job.update_start_time(count)
     assert job.start_time_timestamp
     job.write_start_time(count)
-    assert (job._tmp_path / f'{job.name}_TOTAL_STATS').exists()
+    assert not (job._tmp_path / f'{job.name}_TOTAL_STATS').exists()
     if with_stat_file:
         job.write_end_time(True, count)
     else:
@@ -2299,30 +2273,6 @@ def test_case_insensitive_running_parameter(autosubmit_config):
     assert job.running == "once"
 
 
-@pytest.mark.parametrize("column,expected_pattern", [
-    ("start", r"^submit 0 end status$"),
-    ("end", r"^submit start 0 status$"),
-    ("submit", r"^0 start end status$"),
-    ("status", r"^submit start end WAITING$"),
-])
-@pytest.mark.parametrize("file_exists", [True, False])
-def test_write_time_parametrized(tmp_path, column, expected_pattern, file_exists):
-    job = Job("dummy", 1, Status.WAITING, 0)
-    job._tmp_path = tmp_path
-    job.submit_time_timestamp = 0
-    job.start_time_timestamp = 0
-    job.finish_time_timestamp = 0
-    job.status = Status.WAITING
-    stats_path = tmp_path / "dummy_TOTAL_STATS"
-    if file_exists:
-        stats_path.write_text("submit start end status\n")
-    job._write_time(column)
-    lines = stats_path.read_text().splitlines()
-    assert re.search(expected_pattern, lines[-1]) is not None
-    if not file_exists:
-        assert len(lines) == 1
-
-
 def test_write_start_time(mocker, tmp_path):
     job = Job("dummy", 1, Status.WAITING, 0)
     job._tmp_path = tmp_path
@@ -2335,10 +2285,8 @@ def test_write_start_time(mocker, tmp_path):
     job.workflow_commit = "abc"
     job.split = "1"
     job.splits = "2"
-    mocker.patch('autosubmit.job.job.Job._write_time')
     mock_exp_hist = mocker.patch('autosubmit.job.job.ExperimentHistory')
     job.write_start_time(attempt=2)
-    job._write_time.assert_called_once_with("start")
     mock_exp_hist.return_value.write_start_time.assert_called_once()
     call_kwargs = mock_exp_hist.return_value.write_start_time.call_args.kwargs
     assert call_kwargs['start'] == job._datestr_to_epoch(str(job.start_time_timestamp))
@@ -2352,6 +2300,7 @@ def test_write_stats(mocker):
     mocker.patch('autosubmit.job.job.Job.update_start_time')
     mocker.patch('autosubmit.job.job.Job.write_start_time')
     mocker.patch('autosubmit.job.job.Job.write_end_time')
+    mocker.patch('autosubmit.job.job.Job._append_total_stats')
     job.write_stats(attempt=1)
     job._update_submit_time_from_stat.assert_called_once_with(1)
     job.write_submit_time.assert_called_once_with(1)
@@ -2360,6 +2309,60 @@ def test_write_stats(mocker):
     job.write_end_time.assert_called_once_with(job.status == Status.COMPLETED, 1)
 
 
+def test_write_stats_saves_retrials_in_database(mocker, tmp_path):
+    mocker.patch('autosubmit.config.basicconfig.BasicConfig.LOCAL_ROOT_DIR', str(tmp_path))
+    job = Job("dummy", 1, Status.WAITING, 0)
+    job._tmp_path = tmp_path
+    job.queue = "debug"
+    job.local_logs = ("out", "err")
+    mocker.patch('autosubmit.job.job.Job._update_submit_time_from_stat')
+    mocker.patch('autosubmit.job.job.Job.update_start_time')
+    mocker.patch('autosubmit.job.job.Job.check_end_time', return_value=0)
+    mocker.patch('autosubmit.job.job.ExperimentHistory').return_value.write_finish_time.return_value = None
+    total_stats = tmp_path / 'dummy_TOTAL_STATS'
+    total_stats.write_text('20250101000000 20250101000100 20250101000200 COMPLETED\n'
+                           '20250102000000 20250102000100 20250102000200 FAILED')
+    db_manager = JobsDbManager(schema='dummy')
+
+    # The first retrial stored imports the previous ones from the TOTAL_STATS file.
+    for day, status in [(3, Status.FAILED), (4, Status.COMPLETED)]:
+        job.submit_time_timestamp = f'2025010{day}000000'
+        job.start_time_timestamp = f'2025010{day}000100'
+        job.finish_time_timestamp = f'2025010{day}000200'
+        job.status = status
+        job.write_stats(attempt=0)
+        db_manager.save_jobs_retrials([job])
+    assert job.new_retrials == []
+
+    retrials = db_manager.select_retrials(['dummy', 'other'])
+    assert retrials == {'dummy': [line.split() for line in total_stats.read_text().splitlines()]}
+    assert retrials['dummy'][-2:] == [['20250103000000', '20250103000100', '20250103000200', 'FAILED'],
+                                      ['20250104000000', '20250104000100', '20250104000200', 'COMPLETED']]
+
+    total_stats.unlink()
+    job._total_stats = retrials['dummy']
+    assert job.get_last_retrials() == [
+        [datetime(2025, 1, 2, 0, 0), datetime(2025, 1, 2, 0, 1), datetime(2025, 1, 2, 0, 2), 'FAILED'],
+        [datetime(2025, 1, 3, 0, 0), datetime(2025, 1, 3, 0, 1), datetime(2025, 1, 3, 0, 2), 'FAILED'],
+        [datetime(2025, 1, 4, 0, 0), datetime(2025, 1, 4, 0, 1), datetime(2025, 1, 4, 0, 2), 'COMPLETED'],
+    ]
+    assert job.check_retrials_start_time()[-1] == datetime(2025, 1, 4, 0, 1)
+
+
+@pytest.mark.parametrize('string_date', [
+    '20250102030405',
+    '2025010203',
+    '2025-01-02 03:04:05',
+])
+def test_parse_stats_date(string_date):
+    assert _parse_stats_date(string_date) == parse_date(string_date)
+
+
+def test_parse_stats_date_invalid():
+    with pytest.raises(ValueError):
+        _parse_stats_date('20251302030405')
+
+
 @pytest.mark.parametrize("attempt,expected_out,expected_err", [
     (0, "dummy.0.out", "dummy.0.err"),
     (1, "dummy.0.out_attempt_1", "dummy.0.err_attempt_1"),
@@ -2784,7 +2787,9 @@ def test_check_and_update_status_orchestrator(mocker):
     assert wrapper.status == Status.COMPLETED
     assert save is True
     wrapper.platform.check_all_jobs.assert_called_once_with([wrapper], wrapper.as_config)
-    wrapper.platform.confirm_done_jobs_via_stat.assert_called_once_with([inner])
+    wrapper.platform.read_stat_files.assert_called_once_with([inner])
+    wrapper.platform.confirm_done_jobs_via_stat.assert_called_once_with(
+        [inner], wrapper.platform.read_stat_files.return_value)
 
 
 def test_setstate_initializes_missing_timestamps():
@@ -2939,7 +2944,6 @@ def test_write_end_time_with_positive_end_time(mocker, tmp_path):
     job._platform = mocker.MagicMock()
     epoch = 1700000000
     mocker.patch("autosubmit.job.job.Job.check_end_time", return_value=epoch)
-    mocker.patch("autosubmit.job.job.Job._write_time")
     mocker.patch("autosubmit.job.job.ExperimentHistory")
     job.write_end_time(True, attempt=0)
     expected = datetime.fromtimestamp(epoch).strftime("%Y%m%d%H%M%S")
@@ -3140,3 +3144,38 @@ def test_recover_log_disabled_threads(mocker):
     mock_notify.assert_called_once_with(as_conf)
     assert job.log_recovery_call_count == 1
 
+
+def test_jobs_share_experiment_paths_and_create_edges_lazily():
+    """Jobs share the paths of their experiment, and only create their edge sets when connected."""
+    first = Job("t000_first", 1, Status.WAITING, 0)
+    second = Job("t000_second", 2, Status.WAITING, 0)
+    assert first._tmp_path is second._tmp_path
+    assert first._log_path is second._log_path
+    assert first._parents is None and first._children is None
+
+    second.add_parent(first)
+    assert second.parents == {first}
+    assert first.children == {second}
+    assert first.children_names_str == "t000_second"
+    assert second.children_names_str == ""
+
+
+def test_loaded_job_does_not_store_runtime_attributes():
+    """A job loaded from the database only stores its runtime attributes once one of them is set."""
+    row = {"name": "t000_20000101_fc0_1_SIM", "id": 1, "status": "WAITING", "date": "2000-01-01T00:00:00",
+           "local_logs_out": None, "local_logs_err": None, "remote_logs_out": "", "remote_logs_err": ""}
+    first, second = Job(loaded_data=row), Job(loaded_data=row)
+
+    assert first._lazy_attributes is None
+    assert (first.check, first.type, first.exclusive, first.het) == ('true', Language.BASH, "", None)
+    assert first.date is second.date
+    assert first.local_logs is second.local_logs
+    assert first.expid is second.expid
+    assert first._lazy_attributes is None
+
+    assert first.stat_file == "t000_20000101_fc0_1_SIM_STAT_"
+    first.additional_files.append("extra.sh")
+    first.check = 'false'
+    assert first._lazy_attributes is not None and second._lazy_attributes is None
+    assert (first.additional_files, first.check) == (["extra.sh"], 'false')
+    assert (second.additional_files, second.check) == ([], 'true')
@@ -203,6 +203,27 @@ def test_get_active(setup_job_list):
                               Status.READY, Status.DELAYED]
 
 
+def test_status_index_follows_status_changes(setup_job_list):
+    jobs, _edges, job_list = setup_job_list
+    assert job_list.get_waiting() == [jobs[4], jobs[5]]
+
+    jobs[5].status = Status.READY
+    jobs[2].status = Status.RUNNING
+    job_list._remove_job_node('job5')
+    assert job_list.get_waiting() == []
+    assert job_list.get_ready() == [jobs[5]]
+    assert job_list.get_running() == [jobs[1], jobs[2]]
+
+    # Jobs removed from the job list no longer move in its index.
+    jobs[4].status = Status.READY
+    assert job_list.get_ready() == [jobs[5]]
+
+    # Nodes added to the graph directly are picked up by a rebuild of the index.
+    queuing_job = Job('job7', 7, Status.QUEUING, 0)
+    job_list.graph.add_node(queuing_job.name, job=queuing_job)
+    assert job_list.get_queuing() == [queuing_job]
+
+
 def test_get_job_by_name_returns_the_expected_job(setup_job_list):
     jobs, _edges, job_list = setup_job_list
 
@@ -400,6 +421,47 @@ def test_manage_dependencies(as_conf, setup_job_list):
         assert job in dependencies_keys
 
 
+def test_get_jobs_filtered_is_memoized_by_filter_shape(setup_job_list, mocker):
+    jobs, _, job_list = setup_job_list
+    dic_jobs = mocker.MagicMock()
+    dic_jobs.get_jobs_filtered.return_value = [jobs[0]]
+    first, second = Job('a000_1_SIM', 1, Status.WAITING, 0), Job('a000_2_SIM', 2, Status.WAITING, 0)
+    for job in (first, second):
+        job.section, job.running, job.chunk, job.split, job.splits = 'SIM', 'chunk', 1, -1, 1
+    filters_to = {"CHUNKS_TO": "1"}
+
+    assert job_list._get_jobs_filtered(dic_jobs, 'INI', first, filters_to, None, None, 1, {}) == [jobs[0]]
+    assert job_list._get_jobs_filtered(dic_jobs, 'INI', second, filters_to, None, None, 1, {}) == [jobs[0]]
+    dic_jobs.get_jobs_filtered.assert_called_once()
+
+    # Another filter, or a dependency of a section to itself, is resolved again.
+    job_list._get_jobs_filtered(dic_jobs, 'INI', second, {"CHUNKS_TO": "all"}, None, None, 1, {})
+    job_list._get_jobs_filtered(dic_jobs, 'SIM', first, filters_to, None, None, 1, {})
+    job_list._get_jobs_filtered(dic_jobs, 'SIM', second, filters_to, None, None, 1, {})
+    assert dic_jobs.get_jobs_filtered.call_count == 4
+
+    assert JobList._split_dependency_key('SIM-2') == ('SIM', 2)
+    assert JobList._split_dependency_key('SIM+1') == ('SIM', 1)
+    assert JobList._split_dependency_key('SIM') == ('SIM', 0)
+
+
+def test_sections_affected_by_includes_transitive_dependents(setup_job_list, as_conf):
+    _, _, job_list = setup_job_list
+    as_conf.experiment_data['JOBS'] = {
+        'INI': {},
+        'SIM': {'DEPENDENCIES': {'INI': {}, 'SIM-1': {}}},
+        'POST': {'DEPENDENCIES': {'SIM': {}}},
+        'CLEAN': {'DEPENDENCIES': {'POST+1': {}, 'REMOVED': {}}},
+        'REPORT': {'DEPENDENCIES': {'CLEAN': {}}},
+    }
+
+    assert job_list._sections_affected_by({'REPORT': {'status': 'modified'}}) == {'REPORT'}
+    assert job_list._sections_affected_by({'POST': {'status': 'modified'}}) == {'POST', 'CLEAN', 'REPORT'}
+    assert job_list._sections_affected_by({'INI': {'status': 'modified'}}) == {'INI', 'SIM', 'POST', 'CLEAN',
+                                                                                'REPORT'}
+    assert job_list._sections_affected_by({'REMOVED': {'status': 'removed'}}) == {'CLEAN', 'REPORT'}
+
+
 @pytest.mark.parametrize(
     "section_list, banned_jobs, get_only_non_completed, expected_length, expected_section",
     [
@@ -437,6 +499,27 @@ def test_get_jobs_by_section(setup_job_list, section_list, banned_jobs, get_only
     assert all(job.section == expected_section for job in result)
 
 
+def test_load_retrials_imports_the_total_stats_files(setup_job_list, tmp_path):
+    """The jobs without stored retrials import them from their TOTAL_STATS file, once."""
+    jobs, _, job_list = setup_job_list
+    stored = [['20250101000000', '20250101000100', '20250101000200', 'COMPLETED']]
+    lines = [['20250102000000', '20250102000100', '20250102000200', 'FAILED'],
+             ['20250103000000', '20250103000100', '20250103000200', 'COMPLETED']]
+    job_list.dbmanager.save_retrials({'job1': stored})
+    for job in jobs:
+        job._tmp_path = tmp_path
+    (tmp_path / 'job1_TOTAL_STATS').write_text('\n'.join(' '.join(fields) for fields in lines))
+    (tmp_path / 'job2_TOTAL_STATS').write_text('\n'.join(' '.join(fields) for fields in lines))
+
+    job_list.load_retrials(jobs[:3])
+
+    assert [job._total_stats for job in jobs[:3]] == [stored, lines, []]
+    assert job_list.dbmanager.select_retrials(['job1', 'job2', 'job3']) == {'job1': stored, 'job2': lines}
+
+    job_list.load_retrials(jobs[:3])
+    assert job_list.dbmanager.select_retrials(['job2'])['job2'] == lines
+
+
 def test_get_jobs_by_section_db(setup_job_list):
     """get_jobs_by_section_db delegates to dbmanager with correct parameters."""
     _, _, job_list = setup_job_list
@@ -473,6 +556,29 @@ def test_retrieve_times(setup_job_list, tmp_path, make_exception, seconds):
         assert retrieve_data.status == Status.VALUE_TO_KEY[job.status]
 
 
+def test_propagate_edges_completion_skips_propagated_jobs(setup_job_list, mocker):
+    """Finished jobs are sent once, unless some outgoing edge is still unsatisfied."""
+    jobs, _, job_list = setup_job_list
+    job_list.save_jobs()
+    job_list.save_edges()
+
+    job_list._propagate_edges_completion()
+    edges = {(edge['e_from'], edge['e_to']): edge for edge in job_list.dbmanager.select_edges()}
+    assert edges['job1', 'job2']['completion_status'] == 'COMPLETED'
+    assert edges['job4', 'job5']['completion_status'] == 'WAITING'
+
+    spy = mocker.spy(job_list.dbmanager, 'update_outgoing_edges_completion_many')
+    job_list._propagate_edges_completion()
+    assert spy.call_args.args[0] == {'job4': 'FAILED'}
+
+    # A job that leaves a final status is sent again once it finishes again.
+    jobs[0].status = Status.WAITING
+    job_list._propagate_edges_completion()
+    jobs[0].status = Status.COMPLETED
+    job_list._propagate_edges_completion()
+    assert spy.call_args.args[0] == {'job1': 'COMPLETED', 'job4': 'FAILED'}
+
+
 def test_unload_after_confirmed_recovery(setup_job_list):
     """Verify job is unloaded once updated_log > fail_count."""
     jobs, _, job_list = setup_job_list
@@ -616,6 +722,39 @@ def test_save_wrappers_casts_id_to_int(fake_job_list, mocker) -> None:
     assert '999' not in fake_job_list.job_package_map
 
 
+def test_wrapper_ids_are_loaded_once_and_kept_in_sync(fake_job_list, mocker) -> None:
+    """wrapper_ids reads the database once, then follows save_wrappers and clear_wrappers_db.
+
+    :param fake_job_list: Minimal JobList fixture.
+    :param mocker: pytest-mock mocker fixture.
+    """
+    get_ids = mocker.patch.object(fake_job_list, 'get_wrappers_id_from_db', return_value=[10])
+
+    assert fake_job_list.wrapper_ids == {10}
+    assert fake_job_list.wrapper_ids == {10}
+    get_ids.assert_called_once()
+
+    job = Job('a000_20000101_fc0_1_SIM', '999', Status.SUBMITTED, 0)
+    package = mocker.MagicMock(spec=JobPackageThread)
+    package.is_wrapped = True
+    package.jobs = [job]
+    package.name = 'wrapper_1'
+    package._wallclock = '00:30'
+    package.platform = FakePlatform()
+    package.sections = "bla"
+    package.method = "bla"
+    package.wrapper_type = "bla"
+    package._num_processors = 1
+    fake_job_list.save_wrappers({'section': {'pkg': package}}, mocker.MagicMock())
+
+    assert fake_job_list.wrapper_ids == {10, 999}
+    get_ids.assert_called_once()
+
+    fake_job_list.clear_wrappers_db(preview=False)
+    assert fake_job_list.wrapper_ids == {10}
+    assert get_ids.call_count == 2
+
+
 @pytest.mark.parametrize(
     "parent_statuses,fail_ok,expected",
     [
@@ -322,7 +322,7 @@ def test_create_scripts_populates_job_scripts(mocker):
     package = JobPackageSimple([job])
     package._create_scripts(as_conf)
 
-    mock_create_script.assert_called_once_with(as_conf)
+    mock_create_script.assert_called_once_with(as_conf, rendered=None)
     assert package._job_scripts["job1"] == "/path/to/job1.cmd"
 
 